@@ -0,0 +1,5 @@
+"""
+Headless benchmarks for engine hot paths.
+
+Run with `python -m benchmarks.run_benchmarks` or `python run_tests.py --bench`.
+"""
@@ -0,0 +1,21 @@
+"""Bullet movement and recycling (BulletManager.update)."""
+
+from benchmarks.harness import DT, benchmark
+
+
+def _update(count):
+    def factory(game):
+        game.clear()
+        game.spawn_bullets(count, speed=60.0)
+        bullets = game.bullet_manager
+
+        def step():
+            bullets.update(DT)
+
+        return step
+
+    return factory
+
+
+benchmark("bullets.update_200", number=30)(_update(200))
+benchmark("bullets.update_1000", number=20)(_update(1000))
@@ -0,0 +1,24 @@
+"""Collision broad phase and narrow phase (CollisionManager)."""
+
+from benchmarks.harness import benchmark
+
+
+def _detect(bullets, enemies):
+    def factory(game):
+        game.clear()
+        game.spawn_enemies(enemies)
+        game.spawn_bullets(bullets)
+        cm = game.collision_manager
+
+        def step():
+            cm.update()
+            cm.detect()
+
+        return step
+
+    return factory
+
+
+benchmark("collision.detect_100b_20e", number=30)(_detect(100, 20))
+benchmark("collision.detect_400b_60e", number=20)(_detect(400, 60))
+benchmark("collision.detect_1000b_120e", number=3, rounds=5)(_detect(1000, 120))
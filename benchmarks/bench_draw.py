@@ -0,0 +1,44 @@
+"""Frame composition (DrawManager.render)."""
+
+import pygame
+
+from benchmarks.harness import benchmark
+from src.core.runtime.game_settings import Display, Layers
+from src.graphics.draw_manager import DrawManager
+
+
+def _render(items):
+    # One DrawManager per benchmark, reused across rounds
+    state = {}
+
+    def factory(game):
+        if "draw_manager" not in state:
+            state["draw_manager"] = DrawManager()
+        draw_manager = state["draw_manager"]
+        target = pygame.Surface((Display.WIDTH, Display.HEIGHT))
+        sprite = pygame.Surface((24, 24), pygame.SRCALPHA)
+        sprite.fill((200, 80, 80, 255))
+        rects = [
+            pygame.Rect(
+                (i * 37) % (Display.WIDTH - 24),
+                (i * 53) % (Display.HEIGHT - 24),
+                24,
+                24,
+            )
+            for i in range(items)
+        ]
+        layers = (Layers.ENEMIES, Layers.BULLETS, Layers.PARTICLES)
+
+        def step():
+            draw_manager.clear()
+            for i, rect in enumerate(rects):
+                draw_manager.queue_draw(sprite, rect, layers[i % 3])
+            draw_manager.render(target)
+
+        return step
+
+    return factory
+
+
+benchmark("draw.render_200", number=20)(_render(200))
+benchmark("draw.render_1000", number=10)(_render(1000))
@@ -0,0 +1,32 @@
+"""Particle simulation and queueing (ParticleEmitter.update_all/render_all)."""
+
+from benchmarks.harness import DT, benchmark
+from src.graphics.particles.particle_manager import ParticleEmitter
+
+
+def _burst(game, count):
+    game.clear()
+    for i in range(count // 20):
+        ParticleEmitter.burst("damage", (100 + i * 40, 360), count=20)
+
+
+@benchmark("particles.update_all_400", number=10)
+def particles_update(game):
+    _burst(game, 400)
+
+    def step():
+        ParticleEmitter.update_all(DT)
+
+    return step
+
+
+@benchmark("particles.render_all_400", number=20)
+def particles_render(game):
+    _burst(game, 400)
+    draw_manager = game.draw_manager
+
+    def step():
+        ParticleEmitter.render_all(draw_manager)
+        draw_manager.clear()
+
+    return step
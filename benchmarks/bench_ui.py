@@ -0,0 +1,29 @@
+"""HUD drawing (UIManager.draw with hud/player_hud.yaml)."""
+
+from benchmarks.harness import benchmark
+
+
+@benchmark("ui.draw_player_hud", number=2000)
+def ui_draw_cached(game):
+    ui = game.scene.ui
+    draw_manager = game.draw_manager
+
+    def step():
+        ui.draw(draw_manager)
+        draw_manager.clear()
+
+    return step
+
+
+@benchmark("ui.draw_player_hud_rebuild", number=30)
+def ui_draw_rebuild(game):
+    ui = game.scene.ui
+    draw_manager = game.draw_manager
+    element = ui.hud_elements[0]
+
+    def step():
+        element.mark_dirty()  # As when a HUD value changes
+        ui.draw(draw_manager)
+        draw_manager.clear()
+
+    return step
@@ -0,0 +1,17 @@
+"""Wave triggering and spawning (WaveScheduler)."""
+
+from benchmarks.harness import DT, benchmark
+
+
+@benchmark("waves.trigger_stage", number=1, rounds=7)
+def waves_trigger_stage(game):
+    """Trigger every wave of the mission's first stage in one update."""
+    game.clear()
+    scheduler = game.wave_scheduler
+    scheduler.reset()
+    scheduler.load_waves(game.scene.level_manager.timeline[0])
+
+    def step():
+        scheduler.update(DT, float("inf"))
+
+    return step
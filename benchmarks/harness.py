@@ -0,0 +1,186 @@
+"""
+harness.py
+----------
+Registry, timing and shared game fixture for the benchmark suite.
+
+Benchmarks are factories registered with @benchmark. Each round calls the
+factory to set up fresh state and get a step function, then times
+`number` calls of it with perf_counter_ns. The compared figure is the
+best (minimum) per-call time across rounds, the least disturbed by other
+load on the machine; the median is reported alongside.
+
+Results are normalized against a fixed pure-Python calibration workload,
+so baselines recorded on one machine stay usable on a faster or slower one.
+"""
+
+import os
+import statistics
+import time
+
+from src.core.runtime.game_settings import Display, Physics
+
+DT = Physics.FIXED_DT
+
+# name -> Benchmark
+REGISTRY = {}
+
+
+class Benchmark:
+    """One registered benchmark."""
+
+    def __init__(self, name, factory, number, rounds):
+        self.name = name
+        self.factory = factory
+        self.number = number
+        self.rounds = rounds
+
+    def run(self, game):
+        """
+        Time the benchmark.
+
+        Args:
+            game: BenchGame fixture
+
+        Returns:
+            dict: median_us, min_us (per call), rounds, number
+        """
+        # Warm-up round (imports, caches, pools)
+        step = self.factory(game)
+        step()
+
+        per_call = []
+        for _ in range(self.rounds):
+            step = self.factory(game)
+            start = time.perf_counter_ns()
+            for _ in range(self.number):
+                step()
+            per_call.append((time.perf_counter_ns() - start) / self.number / 1000.0)
+
+        return {
+            "median_us": statistics.median(per_call),
+            "min_us": min(per_call),
+            "rounds": self.rounds,
+            "number": self.number,
+        }
+
+
+def benchmark(name, number=20, rounds=7):
+    """
+    Register a benchmark factory.
+
+    The factory receives the BenchGame and returns a zero-argument step
+    function; setup work done in the factory is not timed.
+
+    Args:
+        name: Unique name ("collision.detect_300b_60e")
+        number: Step calls per timed round
+        rounds: Timed rounds
+    """
+
+    def register(factory):
+        REGISTRY[name] = Benchmark(name, factory, number, rounds)
+        return factory
+
+    return register
+
+
+def calibrate(rounds=15):
+    """
+    Time a fixed pure-Python workload (dict, list and float operations).
+
+    The fastest run is used: it is the least disturbed by other load.
+
+    Returns:
+        float: Minimum microseconds for one workload run
+    """
+
+    def workload():
+        data = {}
+        for i in range(20000):
+            data[i & 1023] = data.get(i & 1023, 0.0) + i * 0.5
+        return sorted(data.values())[:10]
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        workload()
+        samples.append((time.perf_counter_ns() - start) / 1000.0)
+    return min(samples)
+
+
+# ===========================================================
+# Game Fixture
+# ===========================================================
+
+
+class BenchGame:
+    """A headless GameScene with waves disabled, shared by all benchmarks."""
+
+    def __init__(self, mission=None):
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        from src.core.debug.debug_logger import LoggerConfig
+        from src.core.runtime.main_loop import MainLoop
+
+        self.loop = MainLoop(headless=True)
+        LoggerConfig.ENABLE_LOGGING = False
+
+        self.mission, _ = self.loop.start_mission(mission)
+        self.loop.run_fixed(1)
+
+        self.scene = self.loop.scenes.active_scene
+        self.draw_manager = self.loop.draw_manager
+        self.spawn_manager = self.scene.spawn_manager
+        self.bullet_manager = self.scene.bullet_manager
+        self.collision_manager = self.scene.collision_manager
+        self.wave_scheduler = self.scene.level_manager.wave_scheduler
+
+        # Benchmarks place their own entities
+        self.wave_scheduler.reset()
+
+    def clear(self):
+        """Remove every enemy, bullet and particle and reseed the RNG streams."""
+        from src.core.services.rng import seed_all
+        from src.graphics.particles.particle_manager import ParticleEmitter
+
+        seed_all(0)
+        self.spawn_manager.reset()
+        self.bullet_manager.clear()
+        ParticleEmitter.clear_all()
+        self.draw_manager.clear()
+
+    def spawn_enemies(self, count, top=60, bottom=300):
+        """
+        Place stationary, durable enemies on a grid in the upper screen.
+
+        Args:
+            count: Number of enemies
+            top, bottom: Vertical band to fill
+        """
+        width = Display.WIDTH
+        cols = max(1, int(count**0.5 * 2))
+        rows = max(1, -(-count // cols))
+        for i in range(count):
+            x = 80 + (i % cols) * (width - 160) / max(1, cols - 1)
+            y = top + (i // cols) * (bottom - top) / max(1, rows - 1)
+            self.spawn_manager.spawn(
+                "enemy", "straight", x, y, direction=(0, 1), speed=0, health=10**6
+            )
+
+    def spawn_bullets(self, count, owner="player", top=420, bottom=640, speed=0.0):
+        """
+        Place bullets on a grid in the lower screen (clear of the enemies).
+
+        Args:
+            count: Number of bullets
+            owner: "player" or "enemy"
+            top, bottom: Vertical band to fill
+            speed: Upward speed (0 = stationary)
+        """
+        cols = max(1, int(count**0.5 * 2))
+        rows = max(1, -(-count // cols))
+        for i in range(count):
+            x = 40 + (i % cols) * (Display.WIDTH - 80) / max(1, cols - 1)
+            y = top + (i // cols) * (bottom - top) / max(1, rows - 1)
+            self.bullet_manager.spawn((x, y), (0, -speed), owner=owner)
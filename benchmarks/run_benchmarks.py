@@ -0,0 +1,256 @@
+"""
+run_benchmarks.py
+-----------------
+Run the benchmark suite and compare against stored baselines.
+
+A benchmark regresses when its calibrated time (best per-call time
+divided by the calibration workload time) exceeds the baseline's by more than
+its allowance, and it stays that slow when re-run. The allowance is the
+tolerance, widened for benchmarks whose baseline runs were noisy (each
+baseline stores its spread across --runs recordings). Exit code 1 on any
+confirmed regression.
+
+Usage:
+    python -m benchmarks.run_benchmarks                 # Compare to baselines
+    python -m benchmarks.run_benchmarks --update        # Record new baselines
+    python -m benchmarks.run_benchmarks -k collision    # Only matching names
+    python -m benchmarks.run_benchmarks --tolerance 0.75
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+
+import benchmarks
+from benchmarks.harness import REGISTRY, BenchGame, calibrate
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_TOLERANCE = 0.50
+DEFAULT_RUNS = 3  # Suite runs per baseline recording
+DEFAULT_CONFIRM = 2  # Re-runs a slow benchmark must fail too
+NOISE_FACTOR = 1.0  # Allowance in multiples of the recorded spread
+
+
+def discover():
+    """Import every bench_* module so its benchmarks register."""
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def load_baselines(path=BASELINE_FILE):
+    """Stored baselines, or an empty set."""
+    if not os.path.exists(path):
+        return {"calibration_us": None, "results": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(runs, path=BASELINE_FILE):
+    """
+    Write results as the new baselines (merged with untouched entries).
+
+    Args:
+        runs: (results, calibration_us) per suite run; each benchmark keeps
+              its best calibrated time and the spread across runs as noise
+    """
+    calibration_us = min(calibration for _, calibration in runs)
+    data = load_baselines(path)
+    data["calibration_us"] = round(calibration_us, 2)
+    data["python"] = platform.python_version()
+    for name in runs[0][0]:
+        scaled = [
+            (results[name]["min_us"] * calibration_us / calibration, results[name])
+            for results, calibration in runs
+        ]
+        best, result = min(scaled, key=lambda pair: pair[0])
+        worst = max(pair[0] for pair in scaled)
+        data["results"][name] = {
+            "min_us": round(best, 2),
+            "median_us": round(result["median_us"], 2),
+            "noise": round(worst / best - 1.0, 3),
+        }
+    data["results"] = dict(sorted(data["results"].items()))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def allowance(baseline, tolerance):
+    """Allowed slowdown for one benchmark: the tolerance, or more if noisy."""
+    return max(tolerance, NOISE_FACTOR * baseline.get("noise", 0.0))
+
+
+def compare(results, calibration_us, baselines, tolerance):
+    """
+    Check results against baselines.
+
+    Returns:
+        list: (name, current_us, expected_us, ratio, status) rows
+    """
+    rows = []
+    base_calibration = baselines.get("calibration_us") or calibration_us
+    scale = calibration_us / base_calibration
+
+    for name, result in results.items():
+        baseline = baselines["results"].get(name)
+        if baseline is None:
+            rows.append((name, result["min_us"], None, None, "NEW"))
+            continue
+        expected = baseline["min_us"] * scale
+        ratio = result["min_us"] / expected
+        status = "SLOWER" if ratio > 1.0 + allowance(baseline, tolerance) else "ok"
+        rows.append((name, result["min_us"], expected, ratio, status))
+    return rows
+
+
+def run_suite(selected, game, verbose=True):
+    """
+    Run benchmarks, calibrating before, between and after them.
+
+    The fastest calibration is used: like the benchmark minimum, it is the
+    run least disturbed by other load.
+
+    Returns:
+        tuple: (results by name, calibration_us)
+    """
+    calibrations = [calibrate()]
+    results = {}
+    for bench in selected:
+        results[bench.name] = result = bench.run(game)
+        calibrations.append(calibrate(rounds=5))
+        if verbose:
+            print(
+                f"  {bench.name:<34}{result['min_us']:>12.1f} us "
+                f"(median {result['median_us']:.1f})"
+            )
+    calibrations.append(calibrate())
+    return results, min(calibrations)
+
+
+def confirm(rows, selected, game, baselines, tolerance, attempts):
+    """
+    Re-run benchmarks flagged SLOWER; keep the flag only if every re-run
+    is slow too (the best time across attempts is reported).
+
+    Returns:
+        list: Rows with unconfirmed slowdowns downgraded to "noisy"
+    """
+    slow = [row[0] for row in rows if row[4] == "SLOWER"]
+    if not slow or attempts <= 0:
+        return rows
+
+    benches = [bench for bench in selected if bench.name in slow]
+    best = {row[0]: row for row in rows if row[0] in slow}
+    for attempt in range(attempts):
+        print(f"Re-running {len(benches)} slow benchmark(s) ({attempt + 1}/{attempts})")
+        results, calibration_us = run_suite(benches, game, verbose=False)
+        for row in compare(results, calibration_us, baselines, tolerance):
+            if row[3] < best[row[0]][3]:
+                best[row[0]] = row
+        benches = [bench for bench in benches if best[bench.name][4] == "SLOWER"]
+        if not benches:
+            break
+
+    confirmed = []
+    for row in rows:
+        row = best.get(row[0], row)
+        if row[0] in slow and row[4] == "ok":
+            row = row[:4] + ("noisy",)
+        confirmed.append(row)
+    return confirmed
+
+
+def main(argv=None):
+    """Run benchmarks; return 1 on regression."""
+    parser = argparse.ArgumentParser(description="Engine hot-path benchmarks")
+    parser.add_argument("-k", dest="pattern", help="Only run names containing this")
+    parser.add_argument("--update", action="store_true", help="Record new baselines")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed slowdown as a fraction (default {DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help=f"Suite runs per --update, to measure noise (default {DEFAULT_RUNS})",
+    )
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=DEFAULT_CONFIRM,
+        help=f"Re-runs a slowdown must repeat in (default {DEFAULT_CONFIRM})",
+    )
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    discover()
+    selected = [
+        bench
+        for name, bench in sorted(REGISTRY.items())
+        if not args.pattern or args.pattern in name
+    ]
+    if not selected:
+        print("No benchmarks selected")
+        return 1
+
+    game = BenchGame()
+    results, calibration_us = run_suite(selected, game)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"calibration_us": calibration_us, "results": results}, f, indent=2
+            )
+
+    if args.update:
+        runs = [(results, calibration_us)]
+        for run in range(1, args.runs):
+            print(f"Baseline run {run + 1}/{args.runs}")
+            runs.append(run_suite(selected, game, verbose=False))
+        save_baselines(runs)
+        print(f"Baselines updated: {BASELINE_FILE}")
+        return 0
+
+    baselines = load_baselines()
+    rows = compare(results, calibration_us, baselines, args.tolerance)
+    rows = confirm(rows, selected, game, baselines, args.tolerance, args.confirm)
+    print(f"\nCalibration: {calibration_us:.0f} us  tolerance: +{args.tolerance:.0%}")
+    print(
+        f"{'benchmark':<34}{'current':>12}{'baseline':>12}{'ratio':>8}{'limit':>8}"
+        "  status"
+    )
+    for name, current, expected, ratio, status in rows:
+        expected_text = f"{expected:>12.1f}" if expected is not None else f"{'-':>12}"
+        ratio_text = f"{ratio:>8.2f}" if ratio is not None else f"{'-':>8}"
+        baseline = baselines["results"].get(name)
+        limit_text = (
+            f"{1.0 + allowance(baseline, args.tolerance):>8.2f}"
+            if baseline
+            else f"{'-':>8}"
+        )
+        print(
+            f"{name:<34}{current:>12.1f}{expected_text}{ratio_text}{limit_text}"
+            f"  {status}"
+        )
+
+    regressions = [row for row in rows if row[4] == "SLOWER"]
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) regressed beyond their allowance "
+            f"in {args.confirm + 1} runs"
+        )
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,37 @@
+import argparse
+
+from src.core.debug.event_trace import get_tracer
 from src.core.runtime.main_loop import MainLoop
+from src.core.services.input_sources import InputRecorder
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the game")
+    parser.add_argument("--mission", help="Start this mission directly")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for --mission")
+    parser.add_argument(
+        "--record", help="Record input from mission start to this file (for replay)"
+    )
+    parser.add_argument(
+        "--trace", help="Record an event timeline to this .json/.jsonl file (see F10)"
+    )
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
     game = MainLoop()
+    if args.trace:
+        get_tracer().start(args.trace)
+
+    recorder = None
+    if args.mission or args.record:
+        mission, seeds = game.start_mission(args.mission, args.seed)
+        if args.record:
+            recorder = InputRecorder(game.input_manager, mission, seeds)
+            game.input_manager.set_recorder(recorder)
+
     game.run()
+
+    if recorder:
+        recorder.save(args.record)
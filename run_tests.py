@@ -9,6 +9,7 @@ Usage:
     python run_tests.py                    # Start watching for changes
     python run_tests.py --run-once         # Run tests once and exit
     python run_tests.py --levelup-only     # Run only LevelUpSystem tests
+    python run_tests.py --bench            # Run benchmarks against baselines
 """
 
 import sys
@@ -118,9 +119,22 @@ def main():
     parser.add_argument(
         "--coverage", action="store_true", help="Generate coverage report"
     )
+    parser.add_argument(
+        "--bench", action="store_true", help="Run benchmarks and check for regressions"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, help="Allowed benchmark slowdown (fraction)"
+    )
 
     args = parser.parse_args()
 
+    # Benchmarks run standalone (no pytest needed)
+    if args.bench:
+        cmd = [sys.executable, "-m", "benchmarks.run_benchmarks"]
+        if args.tolerance is not None:
+            cmd += ["--tolerance", str(args.tolerance)]
+        return subprocess.run(cmd, cwd=Path(__file__).parent).returncode
+
     # Check if pytest is available
     try:
         import pytest  # noqa: F401
@@ -1,6 +1,10 @@
 import pygame
-import random
+from src.core.services.asset_bundle import get_bundle
+from src.core.services.asset_loader import get_asset_loader
 from src.core.services.settings_manager import get_settings
+from src.core.services.rng import get_rng
+
+_rng = get_rng("audio")
 
 INSTANCE = None
 
@@ -87,8 +91,10 @@ class SoundManager:
         # DebugLogger.init("Loading Audio Assets...")
         for name, path in self.ASSET_PATHS["bgm"].items():  # load BGM
             self.load_bgm(name, path)
+        # decode all BFX / UI sounds in one threaded batch
+        sounds = get_asset_loader().load_sounds(self.ASSET_PATHS["bfx"].values())
         for name, path in self.ASSET_PATHS["bfx"].items():  # load BFX / UI sound
-            self.load_bfx(name, path)
+            self.load_bfx(name, path, sounds.get(path))
 
     def volume_scale(self, level):  # natural scale volume control(0-100)
         if level < 0:
@@ -97,8 +103,14 @@ class SoundManager:
             log_volume = (level / 100) ** 2
             return min(max(log_volume, 0.0), 1.0)
 
-    def load_bfx(self, name, route):  # load BFX file
-        bfx_sound = self.bfx[name] = pygame.mixer.Sound(route)
+    def load_bfx(
+        self, name, route, bfx_sound=None
+    ):  # load BFX file (bundled PCM if available)
+        if bfx_sound is None:
+            bfx_sound = get_bundle().load_sound(route)
+        if bfx_sound is None:
+            bfx_sound = pygame.mixer.Sound(route)
+        self.bfx[name] = bfx_sound
         volume = self.master_volume * self.bfx_volume
         bfx_sound.set_volume(volume)
 
@@ -114,7 +126,7 @@ class SoundManager:
         bfx.play(loops=loop)
 
     def play_random_bfx(self, bfx_list):
-        chosen_name = random.choice(bfx_list)
+        chosen_name = _rng.choice(bfx_list)
         self.play_bfx(chosen_name)
 
     def play_bgm(self, name, loop):  # play BGM
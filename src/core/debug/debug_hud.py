@@ -3,17 +3,51 @@ debug_hud.py
 ------------
 Lightweight developer overlay with performance metrics and quick-access controls.
 Uses data-driven UI system for buttons, direct rendering for metrics.
+
+Performance panel:
+- Frame history in fixed-size ring buffers (deque maxlen)
+- Frame-time graph kept on one surface, scrolled one column per frame,
+  with 16.67ms / 33ms guide lines and spike markers
+- Frame-time histogram updated incrementally, redrawn every few frames
+- Text surfaces cached and only re-rendered when their text changes
 """
 
 import pygame
 import time
+from bisect import bisect_left
+from collections import deque
 
-from src.core.runtime.game_settings import Display, Layers
+from src.core.runtime.game_settings import Debug, Display, Layers
 from src.core.debug.debug_logger import DebugLogger
 
 from src.ui.core.ui_loader import UILoader
 from src.ui.core.anchor_resolver import AnchorResolver
 
+# Panel layout
+PANEL_X = 10
+PANEL_Y = 10
+PANEL_WIDTH = 280
+PANEL_PADDING = 10
+LINE_HEIGHT = 16
+PANEL_COLOR = (20, 20, 20, 180)
+
+# Frame-time graph: one column per frame, newest on the right
+GRAPH_WIDTH = PANEL_WIDTH - 2 * PANEL_PADDING
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 50.0
+SPIKE_MS = 33.33
+GUIDE_LINES_MS = (Debug.FRAME_TIME_WARNING, SPIKE_MS)
+
+# Histogram bin upper edges in ms (one more bin catches everything above)
+HISTOGRAM_EDGES = (2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.67, 20.0, 25.0, 33.33)
+HISTOGRAM_HEIGHT = 36
+HISTOGRAM_REFRESH_FRAMES = 10
+
+COLOR_OK = (100, 255, 100)
+COLOR_SLOW = (255, 220, 80)
+COLOR_SPIKE = (255, 80, 80)
+COLOR_GUIDE = (220, 220, 220, 170)
+
 
 class DebugHUD:
     """Developer overlay with metrics and controls."""
@@ -46,12 +80,13 @@ class DebugHUD:
         self.max_fps = 0.0
         self.min_fps_time = None
 
-        self.frame_time_history = []
-        self.frame_time_history_max = 300
-        self.fps_history = []
-        self.fps_history_max = 300
+        self.frame_time_history = deque(maxlen=GRAPH_WIDTH)
+        self.fps_history = deque(maxlen=GRAPH_WIDTH)
         self.current_fps = 0.0
 
+        # Histogram bin counts over frame_time_history
+        self.histogram = [0] * (len(HISTOGRAM_EDGES) + 1)
+
         self.frame_time = 0.0
         self.update_time = 0.0
         self.render_time = 0.0
@@ -60,6 +95,18 @@ class DebugHUD:
         self.font = pygame.font.SysFont("consolas", 14)
         self.font_bold = pygame.font.SysFont("consolas", 14, bold=True)
 
+        # Cached panel surfaces
+        self._panel_surfaces = {}  # height -> translucent background
+        self._text_cache = {}  # key -> (text, color, surface)
+        self._graph = pygame.Surface((GRAPH_WIDTH, GRAPH_HEIGHT), pygame.SRCALPHA)
+        self._graph_rect = pygame.Rect(0, 0, GRAPH_WIDTH, GRAPH_HEIGHT)
+        self._graph_guide_rows = [self._graph_y(ms) for ms in GUIDE_LINES_MS]
+        self._histogram = pygame.Surface(
+            (GRAPH_WIDTH, HISTOGRAM_HEIGHT), pygame.SRCALPHA
+        )
+        self._histogram_rect = pygame.Rect(0, 0, GRAPH_WIDTH, HISTOGRAM_HEIGHT)
+        self._histogram_age = HISTOGRAM_REFRESH_FRAMES
+
         DebugLogger.init_entry("DebugHUD")
 
     def update(self, dt, mouse_pos):
@@ -193,43 +240,17 @@ class DebugHUD:
                 self._draw_element_tree(child, draw_manager, parent=element)
 
     def _draw_metrics(self, draw_manager, player=None):
-        """Draw performance metrics with translucent background."""
-        # Background panel (translucent dark)
-        panel_width = 280
-        panel_height = 180
-        panel_x = 10
-        panel_y = 10
-
-        bg_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        bg_surface.fill((20, 20, 20, 180))  # Dark translucent
-        bg_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        # print(f"[DEBUG] Drawing metrics panel at layer {Layers.DEBUG}")
-        draw_manager.queue_draw(bg_surface, bg_rect, Layers.DEBUG)
-
-        # Metrics text
-        y_offset = panel_y + 10
-        x_offset = panel_x + 10
-        line_height = 16
+        """Draw performance metrics, graph and histogram on a translucent panel."""
+        x_offset = PANEL_X + PANEL_PADDING
+        lines = []
 
         # Player info (if exists)
         if player:
-            self._draw_text(
-                f"Pos: ({player.rect.x:.0f}, {player.rect.y:.0f})",
-                x_offset,
-                y_offset,
-                (150, 255, 150),
-                draw_manager,
-            )
-            y_offset += line_height
-
-            self._draw_text(
-                f"Vel: ({player.velocity.x:.1f}, {player.velocity.y:.1f})",
-                x_offset,
-                y_offset,
-                (150, 255, 150),
-                draw_manager,
-            )
-            y_offset += line_height + 5
+            pos = f"Pos: ({player.rect.x:.0f}, {player.rect.y:.0f})"
+            vel = f"Vel: ({player.velocity.x:.1f}, {player.velocity.y:.1f})"
+            lines.append(("pos", pos, (150, 255, 150)))
+            lines.append(("vel", vel, (150, 255, 150)))
+            lines.append(None)
 
         # FPS metrics
         recent_avg = (
@@ -237,79 +258,183 @@ class DebugHUD:
             if self.recent_fps_count > 0
             else 0.0
         )
-
-        self._draw_text(
-            f"FPS (smooth): {self.smoothed_fps:.1f}",
-            x_offset,
-            y_offset,
-            (100, 255, 100),
-            draw_manager,
-            bold=True,
-        )
-        y_offset += line_height
-
-        self._draw_text(
-            f"FPS (recent): {recent_avg:.1f}",
-            x_offset,
-            y_offset,
-            (100, 200, 255),
-            draw_manager,
-        )
-        y_offset += line_height
-
         min_text = f"Min: {self.min_fps:.1f}"
         if self.min_fps_time:
             min_text += f" ({self.min_fps_time})"
-        self._draw_text(min_text, x_offset, y_offset, (255, 200, 100), draw_manager)
-        y_offset += line_height
-
-        self._draw_text(
-            f"Max: {self.max_fps:.1f}",
-            x_offset,
-            y_offset,
-            (150, 200, 255),
-            draw_manager,
-        )
-        y_offset += line_height + 5
+
+        lines.append(("fps_smooth", f"FPS (smooth): {self.smoothed_fps:.1f}", COLOR_OK))
+        lines.append(("fps_recent", f"FPS (recent): {recent_avg:.1f}", (100, 200, 255)))
+        lines.append(("fps_min", min_text, (255, 200, 100)))
+        lines.append(("fps_max", f"Max: {self.max_fps:.1f}", (150, 200, 255)))
+        lines.append(None)
 
         # Frame timing
-        self._draw_text(
-            f"Frame: {self.frame_time:.2f}ms",
-            x_offset,
-            y_offset,
-            (255, 255, 150),
-            draw_manager,
-        )
-        y_offset += line_height
-
-        self._draw_text(
-            f"Update: {self.update_time:.2f}ms",
-            x_offset,
-            y_offset,
-            (200, 255, 200),
-            draw_manager,
+        spikes = self.histogram[-1]
+        lines.append(("frame", f"Frame: {self.frame_time:.2f}ms", (255, 255, 150)))
+        lines.append(("update", f"Update: {self.update_time:.2f}ms", (200, 255, 200)))
+        lines.append(("render", f"Render: {self.render_time:.2f}ms", (200, 200, 255)))
+        lines.append(
+            (
+                "spikes",
+                f"Spikes >{SPIKE_MS:.0f}ms: {spikes}/{len(self.frame_time_history)}",
+                COLOR_SPIKE if spikes else (180, 180, 180),
+            )
         )
-        y_offset += line_height
-
-        self._draw_text(
-            f"Render: {self.render_time:.2f}ms",
-            x_offset,
-            y_offset,
-            (200, 200, 255),
-            draw_manager,
+
+        # Layout: text, graph, histogram
+        text_height = sum(LINE_HEIGHT if line else 5 for line in lines)
+        graph_y = PANEL_Y + PANEL_PADDING + text_height + 6
+        histogram_y = graph_y + GRAPH_HEIGHT + 6
+        panel_height = histogram_y + HISTOGRAM_HEIGHT + PANEL_PADDING - PANEL_Y
+
+        draw_manager.queue_draw(
+            self._panel_surface(panel_height),
+            pygame.Rect(PANEL_X, PANEL_Y, PANEL_WIDTH, panel_height),
+            Layers.DEBUG,
         )
 
-    def _draw_text(self, text, x, y, color, draw_manager, bold=False):
-        """Helper to render and queue text."""
+        y_offset = PANEL_Y + PANEL_PADDING
+        for line in lines:
+            if line is None:
+                y_offset += 5
+                continue
+            key, text, color = line
+            self._draw_text(key, text, x_offset, y_offset, color, draw_manager)
+            y_offset += LINE_HEIGHT
+
+        # Frame-time graph with guide labels
+        self._graph_rect.topleft = (x_offset, graph_y)
+        draw_manager.queue_draw(self._graph, self._graph_rect, Layers.DEBUG)
+        for ms, row in zip(GUIDE_LINES_MS, self._graph_guide_rows):
+            label = self._text(f"guide_{ms}", f"{ms:.0f}", (170, 170, 170))
+            draw_manager.queue_draw(
+                label,
+                label.get_rect(topright=(self._graph_rect.right, graph_y + row - 13)),
+                Layers.DEBUG,
+            )
+
+        # Histogram (refreshed every few frames)
+        self._histogram_age += 1
+        if self._histogram_age >= HISTOGRAM_REFRESH_FRAMES:
+            self._histogram_age = 0
+            self._render_histogram()
+        self._histogram_rect.topleft = (x_offset, histogram_y)
+        draw_manager.queue_draw(self._histogram, self._histogram_rect, Layers.DEBUG)
+        draw_manager.mark_dirty(self._histogram_rect)
+
+    def _draw_text(self, key, text, x, y, color, draw_manager, bold=False):
+        """Queue a cached text surface."""
+        surface = self._text(key, text, color, bold)
+        draw_manager.queue_draw(surface, surface.get_rect(topleft=(x, y)), Layers.DEBUG)
+
+    def _text(self, key, text, color, bold=False):
+        """
+        Get a text surface, rendering only when the text or color changed.
+
+        Args:
+            key: Cache slot (one per panel line)
+            text: String to show
+            color: RGB color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        cached = self._text_cache.get(key)
+        if cached is not None and cached[0] == text and cached[1] == color:
+            return cached[2]
+
         font = self.font_bold if bold else self.font
         surface = font.render(text, True, color)
-        rect = surface.get_rect(topleft=(x, y))
-        draw_manager.queue_draw(surface, rect, Layers.DEBUG)
+        self._text_cache[key] = (text, color, surface)
+        return surface
+
+    def _panel_surface(self, height):
+        """Translucent panel background (created once per height)."""
+        surface = self._panel_surfaces.get(height)
+        if surface is None:
+            surface = pygame.Surface((PANEL_WIDTH, height), pygame.SRCALPHA)
+            surface.fill(PANEL_COLOR)
+            self._panel_surfaces[height] = surface
+        return surface
+
+    # ===========================================================
+    # Graph and Histogram
+    # ===========================================================
+
+    def _graph_y(self, ms):
+        """Graph row for a frame time (clamped to the graph)."""
+        ratio = min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS
+        return GRAPH_HEIGHT - 1 - int(ratio * (GRAPH_HEIGHT - 1))
+
+    def _draw_graph_column(self, x, ms):
+        """Draw one frame's bar, guide pixels and spike marker at column x."""
+        graph = self._graph
+        graph.fill((0, 0, 0, 0), (x, 0, 1, GRAPH_HEIGHT))
+
+        if ms >= SPIKE_MS:
+            color = COLOR_SPIKE
+        elif ms > Debug.FRAME_TIME_WARNING:
+            color = COLOR_SLOW
+        else:
+            color = COLOR_OK
+        graph.fill(color, (x, self._graph_y(ms), 1, GRAPH_HEIGHT))
+
+        # Dashed guide lines
+        if x % 4 < 2:
+            for row in self._graph_guide_rows:
+                graph.set_at((x, row), COLOR_GUIDE)
+
+        # Spike marker along the top edge
+        if ms >= SPIKE_MS:
+            graph.fill(COLOR_SPIKE, (x, 0, 1, 3))
+
+    def _push_graph_sample(self, ms):
+        """Scroll the graph one column left and draw the newest frame."""
+        self._graph.scroll(-1, 0)
+        self._draw_graph_column(GRAPH_WIDTH - 1, ms)
+        self.draw_manager.mark_dirty(self._graph_rect)
+
+    def _rebuild_graph(self):
+        """Redraw the whole graph from history (after being hidden)."""
+        self._graph.fill((0, 0, 0, 0))
+        offset = GRAPH_WIDTH - len(self.frame_time_history)
+        for i in range(offset):
+            self._draw_graph_column(i, 0.0)
+        for i, ms in enumerate(self.frame_time_history):
+            self._draw_graph_column(offset + i, ms)
+
+    def _render_histogram(self):
+        """Redraw histogram bars from the current bin counts."""
+        surface = self._histogram
+        surface.fill((0, 0, 0, 60))
+
+        counts = self.histogram
+        peak = max(counts) or 1
+        bins = len(counts)
+        bar_width = GRAPH_WIDTH // bins
+
+        for i, count in enumerate(counts):
+            if not count:
+                continue
+            upper = HISTOGRAM_EDGES[i] if i < len(HISTOGRAM_EDGES) else GRAPH_MAX_MS
+            if upper > SPIKE_MS:
+                color = COLOR_SPIKE
+            elif upper > Debug.FRAME_TIME_WARNING:
+                color = COLOR_SLOW
+            else:
+                color = COLOR_OK
+            height = max(1, count * HISTOGRAM_HEIGHT // peak)
+            surface.fill(
+                color,
+                (i * bar_width + 1, HISTOGRAM_HEIGHT - height, bar_width - 2, height),
+            )
 
     def toggle(self):
         self.visible = not self.visible
         if self.visible:
             self._ensure_loaded()
+            self._rebuild_graph()
+            self._histogram_age = HISTOGRAM_REFRESH_FRAMES
 
         state = "shown" if self.visible else "hidden"
         DebugLogger.action(f"DebugHUD {state}")
@@ -331,15 +456,19 @@ class DebugHUD:
         self.update_time = scene_time
         self.render_time = render_time
 
-        # Frame time history (for graphs)
-        self.frame_time_history.append(frame_time_ms)
-        if len(self.frame_time_history) > self.frame_time_history_max:
-            self.frame_time_history.pop(0)
+        # Frame time history (the fast draw path reports FPS only)
+        if frame_time_ms > 0.0:
+            history = self.frame_time_history
+            if len(history) == history.maxlen:
+                self.histogram[bisect_left(HISTOGRAM_EDGES, history[0])] -= 1
+            history.append(frame_time_ms)
+            self.histogram[bisect_left(HISTOGRAM_EDGES, frame_time_ms)] += 1
+
+            if self.visible:
+                self._push_graph_sample(frame_time_ms)
 
-        # FPS history (for graphs)
+        # FPS history
         self.fps_history.append(fps)
-        if len(self.fps_history) > self.fps_history_max:
-            self.fps_history.pop(0)
 
         # Smoothed FPS (exponential moving average)
         self.smoothed_fps = (
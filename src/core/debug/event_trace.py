@@ -0,0 +1,386 @@
+"""
+event_trace.py
+--------------
+Structured gameplay timeline in Chrome trace_event format.
+
+Spans (durations) and instant events are appended to an in-memory ring
+buffer of Tracing.BUFFER_SIZE events. A background thread drains it every
+Tracing.FLUSH_INTERVAL seconds and streams the events to disk, so the game
+thread never formats or writes trace data:
+
+- .json    Chrome trace_event JSON array; open in Perfetto
+           (ui.perfetto.dev) or chrome://tracing. The array is closed by
+           stop(), but the format allows it open, so a crashed run loads.
+- .jsonl   The same event objects, one per line (jq, pandas, grep)
+
+If the writer falls behind, the oldest buffered events are dropped and
+counted (see stats()).
+
+Traced sources:
+- EventManager.dispatch   span per dispatched event ("event" category)
+- SceneManager.set_scene  span per scene switch ("scene")
+- WaveScheduler           instant per wave triggered or deferred ("level")
+- Boss                    attack state changes and death phases ("boss")
+- NukePulse               fire, detonation and finish ("effects")
+- Garbage collector       span per collection pass ("gc", gc.callbacks)
+- MainLoop                span per frame / tick ("frame")
+
+Usage:
+    tracer = get_tracer()
+    tracer.start("profiles/boss_fight.json")
+
+    with tracer.span("load_level", "level", {"level": level_id}):
+        ...
+    tracer.instant("wave", "level", {"enemy": "straight", "count": 5})
+
+    tracer.stop()
+
+While stopped, span() returns a shared no-op context and instant() returns
+at once; hooks that build an args dict check tracer.enabled first.
+"""
+
+import gc
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Profiling, Tracing
+
+_perf_ns = time.perf_counter_ns
+_thread_id = threading.get_ident
+
+
+# ===========================================================
+# Spans
+# ===========================================================
+
+
+class _Span:
+    """One timed block, buffered as a complete ("X") event on exit."""
+
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = _perf_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        start = self.start
+        self.tracer._record(
+            "X", self.name, self.cat, start, _perf_ns() - start, self.args
+        )
+        return False
+
+
+class _NullSpan:
+    """Shared do-nothing span returned while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# ===========================================================
+# Event Tracer
+# ===========================================================
+
+
+class EventTracer:
+    """Ring-buffered span / instant recorder with a background writer."""
+
+    def __init__(self, size=None):
+        """
+        Initialize the tracer (stopped).
+
+        Args:
+            size: Events buffered between flushes (default Tracing.BUFFER_SIZE)
+        """
+        self.size = size or Tracing.BUFFER_SIZE
+        self.enabled = False
+        self.path = None
+
+        self._jsonl = False
+        self._buffer = deque(maxlen=self.size)  # Full ring drops its oldest
+        self._seq = itertools.count()  # Numbers records so drops show as gaps
+        self._last_seq = -1
+        self._written = 0
+        self._dropped = 0
+        self._origin_ns = 0
+        self._file = None
+        self._first = True
+        self._writer = None
+        self._wake = threading.Event()
+        self._stopping = False
+        self._lock = threading.Lock()  # Serializes drains (writer vs stop)
+        self._gc_start = 0
+
+    # ===========================================================
+    # Recording
+    # ===========================================================
+
+    def span(self, name: str, cat: str = "game", args: dict = None):
+        """
+        Time a block as one trace event.
+
+        Args:
+            name: Event name shown on the timeline
+            cat: Category (filterable in the viewer)
+            args: Extra values shown with the event
+
+        Returns:
+            Context manager recording its block (no-op while stopped)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def instant(self, name: str, cat: str = "game", args: dict = None):
+        """
+        Record a point-in-time event.
+
+        Args:
+            name: Event name shown on the timeline
+            cat: Category (filterable in the viewer)
+            args: Extra values shown with the event
+        """
+        if self.enabled:
+            self._record("i", name, cat, _perf_ns(), 0, args)
+
+    def _record(self, phase, name, cat, ts_ns, dur_ns, args):
+        """Append one record to the ring (called from any thread)."""
+        self._buffer.append(
+            (next(self._seq), phase, name, cat, ts_ns, dur_ns, _thread_id(), args)
+        )
+
+    # ===========================================================
+    # Lifecycle
+    # ===========================================================
+
+    def start(self, path=None):
+        """
+        Open the output file and begin recording.
+
+        Args:
+            path: Output file; ".jsonl" writes JSON lines, anything else a
+                  Chrome trace (default: timestamped file in EXPORT_DIR,
+                  never overwriting an earlier trace)
+
+        Returns:
+            str: Path being written
+        """
+        if self.enabled:
+            return self.path
+
+        if path is None:
+            path = self._default_path()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._jsonl = path.endswith(".jsonl")
+        self._file = open(path, "w", encoding="utf-8")
+        if not self._jsonl:
+            self._file.write("[\n")
+        self._first = True
+        self._buffer.clear()
+        self._seq = itertools.count()
+        self._last_seq = -1
+        self._written = 0
+        self._dropped = 0
+        self._origin_ns = _perf_ns()
+        self._write_metadata()
+
+        self._stopping = False
+        self._writer = threading.Thread(
+            target=self._write_loop, name="EventTraceWriter", daemon=True
+        )
+        self._writer.start()
+        if Tracing.TRACE_GC:
+            gc.callbacks.append(self._on_gc)
+
+        self.enabled = True
+        DebugLogger.state(f"Event trace started: {path}", category="system")
+        return path
+
+    def _default_path(self):
+        """Timestamped file in EXPORT_DIR, numbered if that second is taken."""
+        base = os.path.join(Profiling.EXPORT_DIR, time.strftime("trace_%Y%m%d_%H%M%S"))
+        path = base + Tracing.FORMAT
+        counter = 1
+        while os.path.exists(path):
+            path = f"{base}_{counter}{Tracing.FORMAT}"
+            counter += 1
+        return path
+
+    def stop(self):
+        """
+        Stop recording, write everything still buffered and close the file.
+
+        Returns:
+            str: Path written (None if not tracing)
+        """
+        if not self.enabled:
+            return None
+
+        self.enabled = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+        self._stopping = True
+        self._wake.set()
+        self._writer.join()
+        self._writer = None
+        self._drain()
+
+        if not self._jsonl:
+            self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+        stats = self.stats()
+        DebugLogger.system(
+            f"Event trace saved: {self.path} "
+            f"({stats['written']} events, {stats['dropped']} dropped)"
+        )
+        return self.path
+
+    def toggle(self) -> bool:
+        """Start or stop tracing and return the new state."""
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+        return self.enabled
+
+    def stats(self):
+        """
+        Event counts of the current or last trace.
+
+        Returns:
+            dict: written, buffered and dropped event counts
+        """
+        return {
+            "written": self._written,
+            "buffered": len(self._buffer),
+            "dropped": self._dropped,
+        }
+
+    # ===========================================================
+    # Garbage Collection
+    # ===========================================================
+
+    def _on_gc(self, phase, info):
+        """gc.callbacks hook: one span per collection pass."""
+        if phase == "start":
+            self._gc_start = _perf_ns()
+        elif self._gc_start:
+            start = self._gc_start
+            self._gc_start = 0
+            self._record(
+                "X",
+                f"gc.gen{info['generation']}",
+                "gc",
+                start,
+                _perf_ns() - start,
+                {
+                    "collected": info["collected"],
+                    "uncollectable": info["uncollectable"],
+                },
+            )
+
+    # ===========================================================
+    # Writer Thread
+    # ===========================================================
+
+    def _write_loop(self):
+        """Drain the buffer to disk until stop() is called."""
+        while not self._stopping:
+            self._wake.wait(Tracing.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self):
+        """Format and write every buffered event."""
+        with self._lock:
+            buffer = self._buffer
+            lines = []
+            while True:
+                try:
+                    record = buffer.popleft()
+                except IndexError:
+                    break
+                self._dropped += record[0] - self._last_seq - 1
+                self._last_seq = record[0]
+                lines.append(json.dumps(self._to_event(record), separators=(",", ":")))
+            if not lines:
+                return
+            self._written += len(lines)
+
+            if self._jsonl:
+                self._file.write("\n".join(lines) + "\n")
+            else:
+                separator = ",\n"
+                if self._first:
+                    self._first = False
+                    self._file.write(separator.join(lines))
+                else:
+                    self._file.write(separator + separator.join(lines))
+            self._file.flush()
+
+    def _to_event(self, record):
+        """Chrome trace_event dict for a buffered record."""
+        _, phase, name, cat, ts_ns, dur_ns, tid, args = record
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": phase,
+            "ts": (ts_ns - self._origin_ns) / 1000.0,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if phase == "X":
+            event["dur"] = dur_ns / 1000.0
+        elif phase == "i":
+            event["s"] = "t"
+        if args:
+            event["args"] = args
+        return event
+
+    def _write_metadata(self):
+        """Name the process and the game thread in the viewer."""
+        for name, value in (("process_name", "SDP game"), ("thread_name", "main")):
+            self._record("M", name, "__metadata", self._origin_ns, 0, {"name": value})
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_TRACER = None
+
+
+def get_tracer() -> EventTracer:
+    """Get or create the event tracer singleton."""
+    global _TRACER
+    if _TRACER is None:
+        _TRACER = EventTracer()
+    return _TRACER
@@ -0,0 +1,327 @@
+"""
+frame_profiler.py
+-----------------
+Low-overhead per-subsystem timing with percentile reports.
+
+Code is wrapped in named scopes; each scope keeps its last Profiling.RING_SIZE
+durations (perf_counter_ns) in a preallocated ring buffer. Percentiles are
+only computed when a report is requested.
+
+Usage:
+    profile = get_profiler().scope
+
+    with profile("update.player"):
+        player.update(dt)
+
+    get_profiler().export("run.csv")   # or .json
+
+In game, F8 (system "toggle_profiler") starts a fresh recording and, when
+pressed again, stops it and exports a timestamped CSV (toggle_session()).
+
+While disabled, scope() returns a shared no-op context, so instrumented
+code costs one dict lookup and an empty with-block per scope.
+"""
+
+import csv
+import json
+import os
+import time
+from array import array
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Profiling
+
+_perf_ns = time.perf_counter_ns
+
+# Reported percentiles (nearest rank)
+PERCENTILES = (50, 95, 99)
+
+STAT_FIELDS = ("section", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+# ===========================================================
+# Scopes
+# ===========================================================
+
+
+class _Scope:
+    """Reusable timer for one section, writing into its ring buffer."""
+
+    __slots__ = ("name", "samples", "size", "index", "count", "_start")
+
+    def __init__(self, name, size):
+        self.name = name
+        self.samples = array("q", bytes(8 * size))
+        self.size = size
+        self.index = 0
+        self.count = 0
+        self._start = 0
+
+    def __enter__(self):
+        self._start = _perf_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.add(_perf_ns() - self._start)
+        return False
+
+    def add(self, ns):
+        """Store one duration in nanoseconds."""
+        self.samples[self.index] = ns
+        self.index = (self.index + 1) % self.size
+        self.count += 1
+
+    def values(self):
+        """Stored durations, oldest first."""
+        if self.count < self.size:
+            return self.samples[: self.count].tolist()
+        return (self.samples[self.index :] + self.samples[: self.index]).tolist()
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+
+
+class _NullScope:
+    """Do-nothing scope returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+# ===========================================================
+# Frame Profiler
+# ===========================================================
+
+
+class FrameProfiler:
+    """Named section timers with ring-buffer history."""
+
+    def __init__(self, size=None, enabled=None):
+        """
+        Initialize the profiler.
+
+        Args:
+            size: Samples kept per section (default Profiling.RING_SIZE)
+            enabled: Start recording (default Profiling.ENABLED)
+        """
+        self.size = size or Profiling.RING_SIZE
+        self.enabled = Profiling.ENABLED if enabled is None else enabled
+        self._scopes = {}
+
+    # ===========================================================
+    # Recording
+    # ===========================================================
+
+    def scope(self, name: str):
+        """
+        Get the timer for a section, for use in a with-block.
+
+        Args:
+            name: Section name ("update.player", "draw.ui", ...)
+
+        Returns:
+            Context manager timing its block (no-op while disabled)
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        timer = self._scopes.get(name)
+        if timer is None:
+            timer = self._scopes[name] = _Scope(name, self.size)
+        return timer
+
+    def record(self, name: str, ms: float):
+        """
+        Add a duration measured elsewhere.
+
+        Args:
+            name: Section name
+            ms: Duration in milliseconds
+        """
+        if self.enabled:
+            timer = self.scope(name)
+            timer.add(int(ms * 1_000_000))
+
+    def set_enabled(self, enabled: bool):
+        """Start or stop recording (history is kept)."""
+        self.enabled = enabled
+        DebugLogger.state(
+            f"Frame profiler {'ON' if enabled else 'OFF'}", category="system"
+        )
+
+    def toggle(self) -> bool:
+        """Flip recording on/off and return the new state."""
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def toggle_session(self):
+        """
+        Start a fresh recording, or stop the current one and export it.
+
+        Bound to the "toggle_profiler" system key. Exports are named by
+        time, with a counter added so quick restarts don't overwrite each other.
+
+        Returns:
+            str or None: Path written when stopping, else None
+        """
+        if not self.enabled:
+            self.reset()
+            self.set_enabled(True)
+            return None
+
+        self.set_enabled(False)
+        base = os.path.join(
+            Profiling.EXPORT_DIR, time.strftime("frame_profile_%Y%m%d_%H%M%S")
+        )
+        path = f"{base}.csv"
+        counter = 1
+        while os.path.exists(path):
+            path = f"{base}_{counter}.csv"
+            counter += 1
+        try:
+            return self.export(path)
+        except OSError as e:
+            DebugLogger.warn(f"Frame profile export failed: {e}")
+            return None
+
+    def reset(self):
+        """Clear all recorded samples."""
+        for timer in self._scopes.values():
+            timer.reset()
+
+    # ===========================================================
+    # Reporting
+    # ===========================================================
+
+    def sections(self):
+        """Names of sections with samples, in first-seen order."""
+        return [name for name, timer in self._scopes.items() if timer.count]
+
+    def samples(self, name: str):
+        """
+        Stored durations for a section in milliseconds, oldest first.
+
+        Args:
+            name: Section name
+
+        Returns:
+            list: Durations (empty for unknown sections)
+        """
+        timer = self._scopes.get(name)
+        if timer is None:
+            return []
+        return [ns / 1_000_000 for ns in timer.values()]
+
+    def stats(self, name: str):
+        """
+        Summarize a section's stored samples.
+
+        Args:
+            name: Section name
+
+        Returns:
+            dict: STAT_FIELDS values, or None without samples
+        """
+        values = self.samples(name)
+        if not values:
+            return None
+
+        values.sort()
+        n = len(values)
+        result = {
+            "section": name,
+            "count": n,
+            "mean_ms": sum(values) / n,
+        }
+        for pct in PERCENTILES:
+            rank = max(0, min(n - 1, -(-pct * n // 100) - 1))
+            result[f"p{pct}_ms"] = values[rank]
+        result["max_ms"] = values[-1]
+        return result
+
+    def summary(self):
+        """Stats for every section with samples."""
+        return [self.stats(name) for name in self.sections()]
+
+    def export(self, path: str, include_samples=False) -> str:
+        """
+        Write the summary as CSV or JSON (chosen by file extension).
+
+        Args:
+            path: Output file; bare names go to Profiling.EXPORT_DIR
+            include_samples: JSON only, also write the raw samples
+
+        Returns:
+            str: Path written
+        """
+        if not os.path.dirname(path):
+            path = os.path.join(Profiling.EXPORT_DIR, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        rows = self.summary()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=STAT_FIELDS)
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow(
+                        {
+                            k: round(v, 4) if isinstance(v, float) else v
+                            for k, v in row.items()
+                        }
+                    )
+        else:
+            data = {"ring_size": self.size, "sections": rows}
+            if include_samples:
+                data["samples"] = {name: self.samples(name) for name in self.sections()}
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+
+        DebugLogger.system(f"Exported frame profile ({len(rows)} sections) -> {path}")
+        return path
+
+    def format_table(self, limit=None):
+        """
+        Render the summary as aligned text, slowest p95 first.
+
+        Args:
+            limit: Show at most this many sections
+
+        Returns:
+            str: Table text
+        """
+        rows = sorted(self.summary(), key=lambda r: r["p95_ms"], reverse=True)
+        if limit:
+            rows = rows[:limit]
+        lines = [
+            f"{'section':<22}{'n':>6}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}"
+        ]
+        for r in rows:
+            lines.append(
+                f"{r['section']:<22}{r['count']:>6}{r['mean_ms']:>8.3f}{r['p50_ms']:>8.3f}"
+                f"{r['p95_ms']:>8.3f}{r['p99_ms']:>8.3f}{r['max_ms']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_PROFILER = None
+
+
+def get_profiler() -> FrameProfiler:
+    """Get or create the frame profiler singleton."""
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = FrameProfiler()
+    return _PROFILER
@@ -0,0 +1,332 @@
+"""
+leak_harness.py
+---------------
+Allocation and leak tracking across repeated level runs.
+
+Runs headless cycles of: start a mission, play it for a while, exit to
+the main menu. After every cycle it collects garbage and records:
+
+- A tracemalloc snapshot (Python allocations by source line)
+- Subscriber counts per event type on the global EventManager
+- Sizes of the long-lived caches and pools (sprite, image, animation
+  frame and formation caches; entity and bullet pools)
+- Live instance counts of scene-owned classes (GameScene, Player, ...)
+
+The first cycles fill caches legitimately and are treated as warm-up.
+Growth is measured from the end of warm-up to the last cycle; the run
+fails when Python memory grows more than the threshold per cycle, or when
+subscribers or live scene objects keep accumulating. With --cold, any
+scene-owned object still alive after exit fails the run too (with the
+scene cache on, the cached GameScene and its systems are expected).
+
+Event subscriber, cache and pool counters are read while the mission is
+still running; live instance counts are read after exiting to the menu.
+
+Surface pixel data is allocated by SDL outside the Python allocator and
+is not seen by tracemalloc; the image cache sizes cover it instead.
+
+Usage:
+    python -m src.core.debug.leak_harness 2_Mission --cycles 6
+    python -m src.core.debug.leak_harness --cold --frames 8 --top 15
+"""
+
+import argparse
+import fnmatch
+import gc
+import json
+import sys
+import tracemalloc
+
+from src.core.debug.debug_logger import DebugLogger, LoggerConfig
+from src.core.runtime.game_settings import Loading, Physics, Spawning
+from src.core.runtime.main_loop import MainLoop
+from src.core.services.event_manager import get_events
+from src.core.services.input_sources import ScriptedInput
+from src.graphics.animations import animation_data
+from src.graphics.particles.particle_manager import SpriteCache
+from src.systems.level.pattern_registry import PatternRegistry
+
+# Scene-owned classes that must not outlive their scene
+TRACKED_CLASSES = (
+    "GameScene",
+    "Player",
+    "BulletManager",
+    "ItemManager",
+    "WaveScheduler",
+)
+
+# Allocations made by the measuring machinery itself (snapshot filtering
+# compiles patterns through fnmatch anywhere in the stack)
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+    tracemalloc.Filter(False, fnmatch.__file__, all_frames=True),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class LeakHarness:
+    """Repeats mission cycles on one headless engine and tracks growth."""
+
+    def __init__(
+        self, mission=None, play=10.0, render=False, cold=False, seed=0, frames=1
+    ):
+        """
+        Start tracing allocations and boot the engine headless.
+
+        Args:
+            mission: Mission ID from Campaigns.json (None = campaign start)
+            play: Simulated seconds of play per cycle
+            render: Run the draw pipeline while playing
+            cold: Disable the scene cache so every cycle builds a new GameScene
+            seed: Master seed for the RNG streams
+            frames: Traceback depth recorded per allocation
+        """
+        self.mission = mission
+        self.cold = cold
+        self.play_ticks = round(play / Physics.FIXED_DT)
+        self.render = render
+        self.seed = seed
+
+        if cold:
+            Loading.SCENE_CACHE_SIZE = 0
+        Spawning.FRAME_BUDGET_MS = float("inf")
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.loop = MainLoop(headless=True)
+        self.cycles = []  # [(counters, snapshot)]
+
+    # ===========================================================
+    # Cycles
+    # ===========================================================
+
+    def run_cycle(self):
+        """
+        Play one mission from start to exit and record the retained state.
+
+        Returns:
+            dict: Counters after the cycle (see collect_counters())
+        """
+        input_source = ScriptedInput(self.loop.input_manager)
+        self.loop.input_manager.set_key_source(input_source)
+        self.loop.start_mission(self.mission, seed=self.seed)
+        scene = self.loop.scenes.active_scene
+
+        self.loop.run_fixed(
+            self.play_ticks, render=self.render, before_tick=input_source.advance
+        )
+        counters = self.collect_counters(scene)
+
+        self.loop.scenes.set_scene("MainMenu")
+        self.loop.run_fixed(2, render=self.render)
+        scene = None  # Drop our reference before collecting
+
+        gc.collect()
+        counters.update(self._live_counts())
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self.cycles.append((counters, snapshot))
+        return counters
+
+    def collect_counters(self, scene):
+        """
+        Read subscriber counts and cache / pool sizes.
+
+        Args:
+            scene: The GameScene of this cycle (for its pools)
+
+        Returns:
+            dict: {counter name: value}
+        """
+        counters = {
+            f"events.{name}": count
+            for name, count in get_events().subscriber_counts().items()
+        }
+        counters.update(
+            {
+                "cache.sprite": len(SpriteCache._cache),
+                "cache.draw_images": len(self.loop.draw_manager.images),
+                "cache.anim_frames": len(animation_data._FRAME_CACHE),
+                "cache.patterns": PatternRegistry.cache_info()["size"],
+                "pool.entities": sum(
+                    len(p) for p in scene.spawn_manager.pools.values()
+                ),
+                "pool.bullets": len(scene.bullet_manager.pool),
+            }
+        )
+        return counters
+
+    @staticmethod
+    def _live_counts():
+        """Instances of TRACKED_CLASSES still reachable after collection."""
+        counts = dict.fromkeys(TRACKED_CLASSES, 0)
+        for obj in gc.get_objects():
+            name = type(obj).__name__
+            if name in counts:
+                counts[name] += 1
+        return {f"live.{name}": count for name, count in counts.items()}
+
+    # ===========================================================
+    # Report
+    # ===========================================================
+
+    def report(self, warmup=1, top=10, group_by="lineno"):
+        """
+        Compare the last cycle against the end of warm-up.
+
+        Args:
+            warmup: Cycles excluded from growth (cache fill)
+            top: Allocation sites to list
+            group_by: "lineno" or "traceback" (needs --frames > 1)
+
+        Returns:
+            dict: Per-cycle growth, top sites and counter history
+
+        Raises:
+            ValueError: Not enough cycles after warm-up
+        """
+        measured = len(self.cycles) - warmup
+        if warmup < 1 or measured < 1:
+            raise ValueError(f"Need more than {warmup} cycles (ran {len(self.cycles)})")
+
+        base_counters, base_snapshot = self.cycles[warmup - 1]
+        last_counters, last_snapshot = self.cycles[-1]
+        stats = last_snapshot.compare_to(base_snapshot, group_by)
+
+        growth = sum(stat.size_diff for stat in stats)
+        sites = [
+            {
+                "site": _format_site(stat.traceback),
+                "size_diff_kb": round(stat.size_diff / 1024 / measured, 2),
+                "count_diff": round(stat.count_diff / measured, 1),
+            }
+            for stat in stats[:top]
+            if stat.size_diff > 0
+        ]
+        history = {
+            name: [counters.get(name, 0) for counters, _ in self.cycles]
+            for name in sorted(set().union(*(c for c, _ in self.cycles)))
+        }
+        accumulating = [
+            name
+            for name in history
+            if name.startswith(("events.", "live."))
+            and last_counters.get(name, 0) > base_counters.get(name, 0)
+        ]
+        # Without the scene cache nothing scene-owned should survive exit
+        retained = [
+            name
+            for name in history
+            if self.cold and name.startswith("live.") and last_counters.get(name, 0)
+        ]
+        return {
+            "mission": self.mission,
+            "cycles": len(self.cycles),
+            "warmup": warmup,
+            "growth_kb_per_cycle": round(growth / 1024 / measured, 2),
+            "top_sites": sites,
+            "counters": history,
+            "accumulating": accumulating,
+            "retained": retained,
+        }
+
+
+def _format_site(traceback):
+    """Innermost frame first, as 'file:line < caller:line'."""
+    return " < ".join(
+        f"{frame.filename.replace(chr(92), '/').split('/src/')[-1]}:{frame.lineno}"
+        for frame in reversed(traceback)
+    )
+
+
+# ===========================================================
+# Command Line
+# ===========================================================
+
+
+def main(argv=None):
+    """Run the cycles, print the report and return 1 on a leak."""
+    parser = argparse.ArgumentParser(
+        description="Track memory retained across level runs"
+    )
+    parser.add_argument("mission", nargs="?", help="Mission ID from Campaigns.json")
+    parser.add_argument("--cycles", type=int, default=5, help="Load/play/exit cycles")
+    parser.add_argument("--warmup", type=int, default=1, help="Cycles before measuring")
+    parser.add_argument(
+        "--play", type=float, default=10.0, help="Sim seconds per cycle"
+    )
+    parser.add_argument("--render", action="store_true", help="Run the draw pipeline")
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Build a new GameScene every cycle (no scene cache)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=64.0,
+        help="Allowed Python memory growth per cycle in KB (default 64)",
+    )
+    parser.add_argument(
+        "--frames", type=int, default=1, help="Traceback depth per allocation"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to list")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", help="Also write the report to this file")
+    parser.add_argument("--log", action="store_true", help="Keep game logging on")
+    args = parser.parse_args(argv)
+
+    LoggerConfig.ENABLE_LOGGING = args.log
+    harness = LeakHarness(
+        args.mission, args.play, args.render, args.cold, args.seed, args.frames
+    )
+    for index in range(args.cycles):
+        harness.run_cycle()
+        current, peak = tracemalloc.get_traced_memory()
+        print(
+            f"cycle {index + 1}/{args.cycles}: traced {current / 1024:.0f} KB "
+            f"(peak {peak / 1024:.0f} KB)"
+        )
+    tracemalloc.stop()
+
+    group_by = "traceback" if args.frames > 1 else "lineno"
+    report = harness.report(args.warmup, args.top, group_by)
+
+    print(
+        f"\nGrowth after warm-up: {report['growth_kb_per_cycle']:+.2f} KB/cycle "
+        f"(threshold {args.threshold:.0f} KB)"
+    )
+    if report["top_sites"]:
+        print("Top allocation sites (per cycle):")
+        for site in report["top_sites"]:
+            print(
+                f"  {site['size_diff_kb']:>+9.2f} KB {site['count_diff']:>+8.1f} blocks"
+                f"  {site['site']}"
+            )
+
+    print(f"\n{'counter':<34}per cycle (events/cache/pool in play, live after exit)")
+    for name, values in report["counters"].items():
+        flag = ""
+        if name in report["accumulating"]:
+            flag = "  <- accumulating"
+        elif name in report["retained"]:
+            flag = "  <- retained after exit"
+        print(f"{name:<34}{' '.join(str(v) for v in values)}{flag}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failed = (
+        report["growth_kb_per_cycle"] > args.threshold
+        or report["accumulating"]
+        or report["retained"]
+    )
+    DebugLogger.system(f"Leak check {'FAILED' if failed else 'passed'}")
+    print("\nLEAK" if failed else "\nNo leaks above threshold")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+profile_capture.py
+------------------
+On-demand profiling of the next N frames.
+
+A capture is started by the profile hotkey (F9, see InputManager), or
+automatically when a frame's work exceeds the configured threshold. It
+runs cProfile and/or a stack sampler for Profiling.CAPTURE_FRAMES frames,
+then writes to Profiling.EXPORT_DIR:
+
+- <name>.pstats      cProfile stats (python -m pstats, snakeviz, ...)
+- <name>.collapsed   Sampled stacks in collapsed format
+                     (flamegraph.pl, speedscope, inferno)
+- <name>.json        Capture context: scene, level, entity counts,
+                     reason and per-frame times
+
+Options (settings.json "debug" section, defaults in Profiling):
+    capture_mode       "cprofile", "sample" or "both"
+    capture_frames     Frames per capture
+    auto_capture_ms    Frame time that triggers a capture (0 = off)
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Profiling
+from src.core.services.settings_manager import get_settings
+
+CAPTURE_MODES = ("cprofile", "sample", "both")
+
+
+# ===========================================================
+# Stack Sampler
+# ===========================================================
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id, interval_ms):
+        """
+        Args:
+            thread_id: threading.get_ident() of the thread to sample
+            interval_ms: Milliseconds between samples
+        """
+        super().__init__(name="StackSampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000.0
+        self.counts = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        own_code = self.run.__code__
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code is not own_code:
+                    name = os.path.basename(code.co_filename)
+                    stack.append(f"{name}:{code.co_name}:{code.co_firstlineno}")
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.counts[";".join(stack)] += 1
+
+    def stop(self):
+        """Stop sampling and wait for the thread to exit."""
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path):
+        """Write stacks as 'frame;frame;frame count' lines."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+# ===========================================================
+# Profile Capture
+# ===========================================================
+
+
+class ProfileCapture:
+    """Frame-bounded cProfile / sampling capture."""
+
+    def __init__(self):
+        settings = get_settings()
+        self.mode = settings.get("debug", "capture_mode", Profiling.CAPTURE_MODE)
+        self.frames = settings.get("debug", "capture_frames", Profiling.CAPTURE_FRAMES)
+        self.auto_ms = settings.get(
+            "debug", "auto_capture_ms", Profiling.AUTO_CAPTURE_MS
+        )
+
+        if self.mode not in CAPTURE_MODES:
+            DebugLogger.warn(f"Unknown capture_mode '{self.mode}', using 'both'")
+            self.mode = "both"
+
+        self._pending = None  # Reason for a capture starting next frame
+        self._active = False
+        self._frames_left = 0
+        self._frame_times = []
+        self._reason = None
+        self._context = None
+        self._profiler = None
+        self._sampler = None
+        self._next_auto = 0.0
+
+    @property
+    def active(self) -> bool:
+        """True while a capture is recording."""
+        return self._active
+
+    def request(self, reason="hotkey"):
+        """
+        Start a capture at the beginning of the next frame.
+
+        Args:
+            reason: Tag for the output files
+        """
+        if self._active or self._pending:
+            return
+        self._pending = reason
+        DebugLogger.action(f"Profile capture armed ({self.mode}, {self.frames} frames)")
+
+    # ===========================================================
+    # Frame Hooks (MainLoop)
+    # ===========================================================
+
+    def begin_frame(self):
+        """Start a requested capture. Call before the frame's work."""
+        if self._pending and not self._active:
+            self._start(self._pending)
+            self._pending = None
+
+    def end_frame(self, frame_ms, context_fn):
+        """
+        Count a finished frame; stop the capture or trigger an automatic one.
+
+        Args:
+            frame_ms: Work time of the frame in milliseconds
+            context_fn: Callable returning a dict describing the game state
+        """
+        if self._active:
+            self._frame_times.append(round(frame_ms, 3))
+            if self._context is None:
+                self._context = context_fn()
+            self._frames_left -= 1
+            if self._frames_left <= 0:
+                self._finish()
+            return
+
+        if self.auto_ms and frame_ms > self.auto_ms:
+            now = time.monotonic()
+            if now >= self._next_auto:
+                self._next_auto = now + Profiling.AUTO_CAPTURE_COOLDOWN
+                self.request(f"slow{frame_ms:.0f}ms")
+
+    # ===========================================================
+    # Internal
+    # ===========================================================
+
+    def _start(self, reason):
+        """Begin profiling."""
+        self._active = True
+        self._frames_left = self.frames
+        self._frame_times = []
+        self._reason = reason
+        self._context = None
+
+        if self.mode in ("sample", "both"):
+            self._sampler = StackSampler(
+                threading.get_ident(), Profiling.SAMPLE_INTERVAL_MS
+            )
+            self._sampler.start()
+        if self.mode in ("cprofile", "both"):
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def _finish(self):
+        """Stop profiling and write the outputs."""
+        if self._profiler:
+            self._profiler.disable()
+        if self._sampler:
+            self._sampler.stop()
+        self._active = False
+
+        context = self._context or {}
+        os.makedirs(Profiling.EXPORT_DIR, exist_ok=True)
+        tags = [
+            time.strftime("%Y%m%d_%H%M%S"),
+            context.get("scene"),
+            context.get("level"),
+        ]
+        tags.append(self._reason)
+        name = "_".join(str(tag) for tag in tags if tag)
+        base = os.path.join(Profiling.EXPORT_DIR, name)
+
+        written = []
+        if self._profiler:
+            self._profiler.dump_stats(base + ".pstats")
+            written.append(".pstats")
+        if self._sampler:
+            self._sampler.write_collapsed(base + ".collapsed")
+            written.append(f".collapsed ({sum(self._sampler.counts.values())} samples)")
+
+        meta = {
+            "reason": self._reason,
+            "mode": self.mode,
+            "frames": len(self._frame_times),
+            "frame_ms": self._frame_times,
+            "context": context,
+        }
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+        self._profiler = None
+        self._sampler = None
+        DebugLogger.system(f"Profile capture saved: {base} [{', '.join(written)}]")
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_CAPTURE = None
+
+
+def get_profile_capture() -> ProfileCapture:
+    """Get or create the profile capture singleton."""
+    global _CAPTURE
+    if _CAPTURE is None:
+        _CAPTURE = ProfileCapture()
+    return _CAPTURE
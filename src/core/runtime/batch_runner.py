@@ -0,0 +1,444 @@
+"""
+batch_runner.py
+---------------
+Parallel headless simulation for balance and performance sweeps.
+
+Expands missions x seeds x bot policies into jobs and runs them on a
+ProcessPoolExecutor, one headless engine per worker process. Workers keep
+their engine between jobs and restart the mission on it, so boot cost is
+paid once per process. Each job plays its mission with a scripted bot
+(BOT_POLICIES in input_sources.py) until the player dies, the mission is
+cleared, or the time limit runs out, and returns:
+
+- Outcome and SessionStats (score, kills, items, run time, level reached)
+- Frame cost percentiles (update, plus draw when rendering) over the
+  ticks played outside the level-up overlay
+- Simulated seconds per wall-clock second
+
+Results are merged into one report grouped by mission and policy.
+
+Runs are deterministic (seeded RNG streams, scripted input, no wall-clock
+spawn budget), so a job gives the same game result on any worker; only
+the frame costs depend on the machine and its load.
+
+Usage:
+    python -m src.core.runtime.batch_runner --missions 1_Tutorial 2_Mission --seeds 0-15
+    python -m src.core.runtime.batch_runner --policies turret dodger --seconds 90
+    python -m src.core.runtime.batch_runner --workers 4 --render --json sweep.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+
+from src.core.debug.debug_logger import DebugLogger, LoggerConfig
+from src.core.debug.frame_profiler import PERCENTILES, get_profiler
+from src.core.runtime.game_settings import Physics, Profiling, Spawning
+from src.core.runtime.main_loop import MainLoop
+from src.core.runtime.session_stats import get_session_stats
+from src.core.services.input_sources import BOT_POLICIES, ScriptedInput
+from src.entities.entity_state import LifecycleState
+
+# Outcomes of a run
+CLEARED = "cleared"
+DIED = "died"
+TIMEOUT = "timeout"
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One simulated run."""
+
+    mission: str = None  # None = campaign start
+    seed: int = 0
+    policy: str = "autopilot"  # Name from BOT_POLICIES
+    seconds: float = 60.0  # Simulated time limit
+    render: bool = False
+
+
+def make_jobs(missions, seeds, policies, seconds=60.0, render=False):
+    """
+    Expand the sweep into jobs (mission-major order).
+
+    Args:
+        missions: Mission IDs (None entries = campaign start)
+        seeds: Master seeds
+        policies: Names from BOT_POLICIES
+        seconds: Simulated time limit per run
+        render: Run the draw pipeline
+
+    Returns:
+        list[BatchJob]: One job per combination
+
+    Raises:
+        ValueError: Unknown policy name
+    """
+    unknown = [p for p in policies if p not in BOT_POLICIES]
+    if unknown:
+        raise ValueError(
+            f"Unknown policies {unknown}; available: {sorted(BOT_POLICIES)}"
+        )
+    return [
+        BatchJob(mission, seed, policy, seconds, render)
+        for mission in missions
+        for policy in policies
+        for seed in seeds
+    ]
+
+
+# ===========================================================
+# Worker Side
+# ===========================================================
+
+_WORKER_LOOP = None  # Engine of this worker process
+
+
+def _init_worker(max_seconds, log):
+    """
+    Configure a worker process before its engine boots.
+
+    Args:
+        max_seconds: Longest job's time limit (sizes the profiler rings)
+        log: Keep game logging on
+    """
+    LoggerConfig.ENABLE_LOGGING = log
+    Profiling.RING_SIZE = max(
+        Profiling.RING_SIZE, round(max_seconds / Physics.FIXED_DT)
+    )
+    Spawning.FRAME_BUDGET_MS = float("inf")
+
+
+def _worker_loop():
+    """Boot this process's engine on first use."""
+    global _WORKER_LOOP
+    if _WORKER_LOOP is None:
+        _WORKER_LOOP = MainLoop(headless=True)
+        get_profiler().set_enabled(True)
+    return _WORKER_LOOP
+
+
+def run_job(job: BatchJob) -> dict:
+    """
+    Play one job on this process's engine.
+
+    Failures are returned, not raised, so one bad job does not abort
+    the batch.
+
+    Args:
+        job: Run to simulate
+
+    Returns:
+        dict: Run result (see _play()), or the job with an "error" entry
+    """
+    try:
+        return _play(_worker_loop(), job)
+    except Exception as exc:
+        DebugLogger.warn(f"Batch job {job} failed: {exc!r}")
+        return {**asdict(job), "error": repr(exc)}
+
+
+def _play(loop, job):
+    """Run one mission with a bot policy and collect its stats."""
+    profiler = get_profiler()
+    input_source = ScriptedInput(loop.input_manager, BOT_POLICIES[job.policy])
+    loop.input_manager.set_key_source(input_source)
+    mission, _ = loop.start_mission(job.mission, seed=job.seed)
+    scene = loop.scenes.active_scene
+
+    # Play starts when the intro cutscene ends
+    loop.run_fixed(1, before_tick=input_source.advance)
+    while scene.cutscene_manager.is_playing:
+        loop.run_fixed(1, before_tick=input_source.advance)
+    profiler.reset()
+
+    gameplay = []
+
+    def before_tick(dt):
+        input_source.advance(dt)
+        gameplay.append(not scene.level_up_ui.is_active)
+
+    limit = round(job.seconds / Physics.FIXED_DT)
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < limit and not scene.game_over_shown:
+        if not loop.run_fixed(1, render=job.render, before_tick=before_tick):
+            break
+        ticks += 1
+        if loop.scenes.active_scene is not scene:
+            break
+    wall = time.perf_counter() - start
+
+    frames = profiler.samples("update")
+    if job.render:
+        frames = [u + d for u, d in zip(frames, profiler.samples("draw"))]
+    frames = [ms for ms, live in zip(frames, gameplay) if live]
+
+    if scene.player.death_state == LifecycleState.DEAD:
+        outcome = DIED
+    elif scene.game_over_shown:
+        outcome = CLEARED
+    else:
+        outcome = TIMEOUT
+
+    sim_seconds = ticks * Physics.FIXED_DT
+    stats = get_session_stats().as_dict()
+    return {
+        **asdict(job),
+        "mission": mission,
+        "outcome": outcome,
+        "ticks": ticks,
+        "sim_seconds": round(sim_seconds, 3),
+        "wall_seconds": round(wall, 3),
+        "sim_per_wall": round(sim_seconds / wall, 2) if wall else 0.0,
+        "score": stats["score"],
+        "kills": stats["enemies_killed"],
+        "items": stats["items_collected"],
+        "run_time": stats["run_time"],
+        "level_reached": stats["max_level_reached"],
+        "exp": stats["total_exp_gained"],
+        "player_health": scene.player.health,
+        "stage": scene.level_manager.current_stage_idx,
+        "frame": _frame_stats(frames),
+        "pid": os.getpid(),
+    }
+
+
+def _frame_stats(values):
+    """Mean, percentiles and max of frame costs in ms (None if empty)."""
+    if not values:
+        return None
+    values = sorted(values)
+    n = len(values)
+    result = {"count": n, "mean_ms": round(sum(values) / n, 3)}
+    for pct in PERCENTILES:
+        rank = max(0, min(n - 1, -(-pct * n // 100) - 1))
+        result[f"p{pct}_ms"] = round(values[rank], 3)
+    result["max_ms"] = round(values[-1], 3)
+    return result
+
+
+# ===========================================================
+# Batch
+# ===========================================================
+
+
+def run_batch(jobs, workers=None, log=False, on_result=None):
+    """
+    Run jobs in parallel worker processes.
+
+    Args:
+        jobs: BatchJobs to run
+        workers: Process count (None = all cores)
+        log: Keep game logging on in the workers
+        on_result: Called with each result as it completes
+
+    Returns:
+        list[dict]: Results in job order
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    max_seconds = max(job.seconds for job in jobs)
+
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(max_seconds, log)
+    ) as executor:
+        futures = {
+            executor.submit(run_job, job): index for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    return results
+
+
+def merge_report(results):
+    """
+    Merge run results into per-(mission, policy) aggregates.
+
+    Args:
+        results: Dicts returned by run_job()
+
+    Returns:
+        dict: {"groups": [...], "errors": [...], "runs": int}
+    """
+    groups = {}
+    errors = []
+    for result in results:
+        if "error" in result:
+            errors.append(result)
+            continue
+        groups.setdefault((result["mission"], result["policy"]), []).append(result)
+
+    merged = []
+    for (mission, policy), runs in groups.items():
+        outcomes = [run["outcome"] for run in runs]
+        scores = [run["score"] for run in runs]
+        frames = [run["frame"] for run in runs if run["frame"]]
+        merged.append(
+            {
+                "mission": mission,
+                "policy": policy,
+                "runs": len(runs),
+                "seeds": sorted(run["seed"] for run in runs),
+                "cleared": outcomes.count(CLEARED),
+                "died": outcomes.count(DIED),
+                "timeout": outcomes.count(TIMEOUT),
+                "survival_rate": round(1.0 - outcomes.count(DIED) / len(runs), 3),
+                "score_mean": round(statistics.fmean(scores), 1),
+                "score_min": min(scores),
+                "score_max": max(scores),
+                "kills_mean": round(statistics.fmean(run["kills"] for run in runs), 1),
+                "run_time_mean": round(
+                    statistics.fmean(run["run_time"] for run in runs), 2
+                ),
+                "level_mean": round(
+                    statistics.fmean(run["level_reached"] for run in runs), 2
+                ),
+                "level_max": max(run["level_reached"] for run in runs),
+                "frame_p50_ms": _median(f["p50_ms"] for f in frames),
+                "frame_p95_ms": _median(f["p95_ms"] for f in frames),
+                "frame_p99_worst_ms": max((f["p99_ms"] for f in frames), default=None),
+                "frame_max_ms": max((f["max_ms"] for f in frames), default=None),
+                "sim_per_wall": round(
+                    statistics.fmean(run["sim_per_wall"] for run in runs), 2
+                ),
+            }
+        )
+    return {"runs": len(results), "groups": merged, "errors": errors}
+
+
+def _median(values):
+    """Median of an iterable (None if empty)."""
+    values = list(values)
+    return round(statistics.median(values), 3) if values else None
+
+
+# ===========================================================
+# Command Line
+# ===========================================================
+
+
+def _parse_seeds(items):
+    """
+    Seeds from "3", "0-15" or "1,4,9" items.
+
+    Raises:
+        ValueError: Empty or malformed item, or a range ending below its start
+    """
+    seeds = []
+    for item in items:
+        for part in item.split(","):
+            first, dash, last = part.strip().partition("-")
+            if not first.isdigit() or (dash and not last.isdigit()):
+                raise ValueError(f"Bad seed '{part}' (use e.g. 3, 0-15 or 1,4,9)")
+            start, end = int(first), int(last or first)
+            if end < start:
+                raise ValueError(f"Empty seed range '{part}' (end is below start)")
+            seeds.extend(range(start, end + 1))
+    return seeds
+
+
+def main(argv=None):
+    """Run the sweep, print the merged report and return 1 on job errors."""
+    parser = argparse.ArgumentParser(description="Run headless missions in parallel")
+    parser.add_argument(
+        "--missions",
+        nargs="+",
+        default=[None],
+        help="Mission IDs (default: campaign start)",
+    )
+    parser.add_argument(
+        "--seeds", nargs="+", default=["0-7"], help="Seeds, e.g. 0-15 or 1,5"
+    )
+    parser.add_argument(
+        "--policies",
+        nargs="+",
+        choices=sorted(BOT_POLICIES),
+        default=["autopilot"],
+        help="Scripted bot policies",
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=60.0, help="Sim time limit per run"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: all cores)"
+    )
+    parser.add_argument("--render", action="store_true", help="Run the draw pipeline")
+    parser.add_argument(
+        "--json", help="Also write the report and all runs to this file"
+    )
+    parser.add_argument("--log", action="store_true", help="Keep game logging on")
+    args = parser.parse_args(argv)
+
+    try:
+        seeds = _parse_seeds(args.seeds)
+    except ValueError as e:
+        parser.error(str(e))
+
+    LoggerConfig.ENABLE_LOGGING = args.log
+    jobs = make_jobs(
+        args.missions,
+        seeds,
+        args.policies,
+        args.seconds,
+        args.render,
+    )
+    workers = min(args.workers or os.cpu_count() or 1, len(jobs))
+    print(f"{len(jobs)} runs on {workers} worker process(es)")
+
+    done = []
+
+    def progress(result):
+        done.append(result)
+        status = result.get("error") or (
+            f"{result['outcome']}, score {result['score']}, {result['sim_per_wall']}x"
+        )
+        print(
+            f"  [{len(done)}/{len(jobs)}] {result['mission']} {result['policy']} "
+            f"seed {result['seed']}: {status}"
+        )
+
+    start = time.perf_counter()
+    results = run_batch(jobs, workers, args.log, progress)
+    wall = time.perf_counter() - start
+    report = merge_report(results)
+    report["workers"] = workers
+    report["wall_seconds"] = round(wall, 2)
+
+    print(f"\nBatch finished in {wall:.1f} s")
+    print(
+        f"{'mission':<14}{'policy':<11}{'runs':>5}{'clear':>6}{'died':>5}"
+        f"{'score':>9}{'kills':>7}{'level':>7}{'p95 ms':>8}{'max ms':>8}"
+    )
+    for group in report["groups"]:
+        p95 = group["frame_p95_ms"]
+        worst = group["frame_max_ms"]
+        print(
+            f"{group['mission']:<14}{group['policy']:<11}{group['runs']:>5}"
+            f"{group['cleared']:>6}{group['died']:>5}{group['score_mean']:>9.1f}"
+            f"{group['kills_mean']:>7.1f}{group['level_mean']:>7.2f}"
+            f"{p95 if p95 is not None else '-':>8}{worst if worst is not None else '-':>8}"
+        )
+    for error in report["errors"]:
+        print(
+            f"ERROR {error['mission']} {error['policy']} seed {error['seed']}: {error['error']}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**report, "results": results}, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,14 @@ class Display:
     }
     DEFAULT_WINDOW_SIZE: str = "small"
 
+    # Dirty-rect presentation: full flip above this fraction of changed area
+    DIRTY_RECT_THRESHOLD: float = 0.35
+
+    # Presentation strategy ("auto" benchmarks once and saves the winner)
+    PRESENT_STRATEGIES = ("software", "integer", "scaled")
+    DEFAULT_PRESENT_STRATEGY: str = "auto"
+    PRESENT_BENCHMARK_FRAMES: int = 30
+
 
 # ===========================================================
 # Font Configuration
@@ -132,3 +140,97 @@ class Debug:
     HITBOX_VISIBLE: bool = False
     HITBOX_LINE_WIDTH: int = 5
     PROFILING_ENABLED: bool = False
+
+
+class Profiling:
+    """Per-subsystem frame profiler (src/core/debug/frame_profiler.py)."""
+
+    # Start with the profiler recording (also toggled at runtime, F8)
+    ENABLED: bool = False
+
+    # Samples kept per section (600 = 10 seconds of updates at 60 Hz)
+    RING_SIZE: int = 600
+
+    # Where profiler exports and captures are written
+    EXPORT_DIR: str = "profiles"
+
+    # On-demand capture (profile_capture.py); settings.json "debug" overrides
+    CAPTURE_MODE: str = "both"  # "cprofile", "sample" or "both"
+    CAPTURE_FRAMES: int = 120
+    AUTO_CAPTURE_MS: float = 0.0  # Capture after a frame this slow (0 = off)
+    AUTO_CAPTURE_COOLDOWN: float = 10.0  # Seconds between automatic captures
+    SAMPLE_INTERVAL_MS: float = 1.0
+
+
+class Tracing:
+    """Gameplay event trace (src/core/debug/event_trace.py)."""
+
+    # Start tracing at boot (also toggled at runtime, F10)
+    ENABLED: bool = False
+
+    # Events held between flushes; the oldest are dropped when full
+    BUFFER_SIZE: int = 65536
+
+    # Seconds between background writes
+    FLUSH_INTERVAL: float = 0.5
+
+    # Default file type: ".json" (Chrome trace) or ".jsonl"
+    FORMAT: str = ".json"
+
+    # Span per EventManager dispatch (the busiest source)
+    TRACE_DISPATCH: bool = True
+
+    # Span per garbage collection pass
+    TRACE_GC: bool = True
+
+
+# ===========================================================
+# Build Caches
+# ===========================================================
+
+
+class Cache:
+    """On-disk caches for derived assets (safe to delete)."""
+
+    DIR: str = ".cache"
+    BACKGROUNDS: str = ".cache/backgrounds"
+    IMAGE_FORMATS: str = ".cache/image_formats.json"
+    ASSET_BUNDLE: str = ".cache/assets.bundle"
+    CONFIGS: str = ".cache/configs"
+    TIMELINES: str = ".cache/timelines"
+
+
+# ===========================================================
+# Scene Loading
+# ===========================================================
+
+
+class Loading:
+    """Incremental scene preloading behind transitions."""
+
+    # Loading work allowed per frame while a transition plays
+    FRAME_BUDGET_MS: float = 8.0
+
+    # Cacheable scene instances kept alive for warm re-entry
+    SCENE_CACHE_SIZE: int = 2
+
+
+# ===========================================================
+# Wave Spawning
+# ===========================================================
+
+
+class Spawning:
+    """Frame-time budget for wave spawns (WaveScheduler)."""
+
+    # Spawn work allowed per update tick
+    FRAME_BUDGET_MS: float = 2.0
+
+    # Cost assumed for an entity type before it has been measured
+    DEFAULT_COST_MS: float = 0.2
+
+    # Weight of the newest sample in the per-type cost average
+    COST_SMOOTHING: float = 0.25
+
+    # Queued spawns older than this ignore the budget (stage seconds)
+    MAX_DELAY: float = 1.0
@@ -0,0 +1,239 @@
+"""
+headless_runner.py
+------------------
+Deterministic headless simulation of a mission.
+
+Runs MainLoop on SDL's dummy video/audio drivers and steps the scene at
+Physics.FIXED_DT as fast as the CPU allows (no clock throttle), with
+optional rendering and scripted or replayed input. Reports simulated
+seconds per wall-clock second, the basis for benchmarks and soak tests on
+machines without a display.
+
+Determinism:
+- Every RNG stream is seeded before the mission starts (see rng.py)
+- Input comes from a script keyed to simulated time, or from a recording
+  made in the game or in an earlier headless run (see input_sources)
+- The wall-clock spawn budget (Spawning.FRAME_BUDGET_MS) is disabled so
+  spawn timing cannot depend on machine speed
+
+Usage:
+    python -m src.core.runtime.headless_runner 2_Mission --seconds 120
+    python -m src.core.runtime.headless_runner 3_Boss --render --script input.json
+
+    # Record a live boss fight, then profile the same fight headless
+    python main.py --mission 3_Boss --record boss.json
+    python -m src.core.runtime.headless_runner --replay boss.json --profile boss.csv
+    python -m src.core.runtime.headless_runner --replay boss.json --trace boss_trace.json
+"""
+
+import argparse
+import json
+import time
+
+from src.core.debug.debug_logger import DebugLogger, LoggerConfig
+from src.core.debug.event_trace import get_tracer
+from src.core.debug.frame_profiler import get_profiler
+from src.core.runtime.game_settings import Physics, Profiling, Spawning
+from src.core.runtime.main_loop import MainLoop
+from src.core.runtime.session_stats import get_session_stats
+from src.core.services.input_sources import InputRecorder, InputReplay, ScriptedInput
+
+
+class HeadlessRunner:
+    """Runs one mission headless at fixed timestep."""
+
+    def __init__(
+        self, mission=None, render=False, script=None, seed=0, replay=None, record=False
+    ):
+        """
+        Boot the game headless and start a mission.
+
+        Args:
+            mission: Mission ID from Campaigns.json (None = campaign start,
+                     or the recorded mission when replaying)
+            render: Run the draw pipeline every tick
+            script: Input script dict or JSON path (None = autopilot)
+            seed: Master seed for the RNG streams
+            replay: Input recording to play instead of a script; its
+                    mission and seeds override the arguments
+            record: Record this run's input (see self.recorder)
+
+        Raises:
+            ValueError: Unknown mission ID, or mission differs from the replay's
+        """
+        self.render = render
+        self.seed = None if replay else seed
+
+        start = time.perf_counter()
+        self.loop = MainLoop(headless=True)
+        input_manager = self.loop.input_manager
+
+        seeds = None
+        if replay:
+            self.input = InputReplay(input_manager, replay)
+            if mission is not None and mission != self.input.mission:
+                raise ValueError(
+                    f"Mission '{mission}' does not match the replay's '{self.input.mission}'"
+                )
+            mission, seeds = self.input.mission, self.input.seeds
+        else:
+            self.input = ScriptedInput(input_manager, script)
+        input_manager.set_key_source(self.input)
+
+        # Wall-clock spawn budgeting would make runs machine-dependent
+        Spawning.FRAME_BUDGET_MS = float("inf")
+
+        self.mission, self.seeds = self.loop.start_mission(mission, seed, seeds)
+
+        self.recorder = None
+        if record:
+            self.recorder = InputRecorder(input_manager, self.mission, self.seeds)
+            input_manager.set_recorder(self.recorder)
+
+        self.boot_seconds = time.perf_counter() - start
+
+    def run(self, seconds=None):
+        """
+        Simulate a number of game seconds.
+
+        Args:
+            seconds: Simulated seconds to run (None = length of the replay,
+                     or 60 without one)
+
+        Returns:
+            dict: Run summary (see summary())
+        """
+        if seconds is not None:
+            ticks = round(seconds / Physics.FIXED_DT)
+        elif isinstance(self.input, InputReplay):
+            ticks = self.input.ticks
+        else:
+            ticks = round(60.0 / Physics.FIXED_DT)
+
+        start = time.perf_counter()
+        ran = self.loop.run_fixed(
+            ticks, render=self.render, before_tick=self.input.advance
+        )
+        wall = time.perf_counter() - start
+
+        return self.summary(ran, wall)
+
+    def summary(self, ticks, wall_seconds):
+        """
+        Collect the end state of a run.
+
+        Args:
+            ticks: Updates run
+            wall_seconds: Wall-clock time they took
+
+        Returns:
+            dict: Timing and game state
+        """
+        sim_seconds = ticks * Physics.FIXED_DT
+        scenes = self.loop.scenes
+        scene = scenes.active_scene
+        stats = get_session_stats()
+
+        result = {
+            "mission": self.mission,
+            "seed": self.seed,
+            "replay": isinstance(self.input, InputReplay),
+            "render": self.render,
+            "ticks": ticks,
+            "sim_seconds": round(sim_seconds, 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "sim_per_wall": round(sim_seconds / wall_seconds, 2)
+            if wall_seconds
+            else 0.0,
+            "boot_seconds": round(self.boot_seconds, 3),
+            "scene": scenes.active_name,
+            "score": stats.score,
+            "kills": stats.enemies_killed,
+        }
+
+        player = getattr(scene, "player", None)
+        if player is not None:
+            result["player_health"] = player.health
+        level_manager = getattr(scene, "level_manager", None)
+        if level_manager is not None:
+            result["stage"] = level_manager.current_stage_idx
+            result["stage_timer"] = round(level_manager.stage_timer, 3)
+        return result
+
+
+# ===========================================================
+# Command Line
+# ===========================================================
+
+
+def main(argv=None):
+    """Parse arguments, run the simulation and print the summary."""
+    parser = argparse.ArgumentParser(description="Headless mission simulation")
+    parser.add_argument("mission", nargs="?", help="Mission ID from Campaigns.json")
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        help="Simulated seconds to run (default: replay length, else 60)",
+    )
+    parser.add_argument("--render", action="store_true", help="Run the draw pipeline")
+    parser.add_argument("--script", help="Input script JSON (default: autopilot)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--replay", help="Play an input recording instead of a script")
+    parser.add_argument("--record", help="Save this run's input as a recording")
+    parser.add_argument(
+        "--profile", help="Profile subsystems and export to this .csv/.json file"
+    )
+    parser.add_argument(
+        "--trace", help="Record an event timeline to this .json/.jsonl file"
+    )
+    parser.add_argument("--json", action="store_true", help="Print summary as JSON")
+    parser.add_argument("--log", action="store_true", help="Keep game logging on")
+    args = parser.parse_args(argv)
+
+    LoggerConfig.ENABLE_LOGGING = args.log
+    if args.profile:
+        # Keep every tick of the run in the ring buffers when the length is known
+        Profiling.ENABLED = True
+        if args.seconds:
+            ticks = round(args.seconds / Physics.FIXED_DT)
+            Profiling.RING_SIZE = max(Profiling.RING_SIZE, ticks)
+
+    runner = HeadlessRunner(
+        args.mission,
+        args.render,
+        args.script,
+        args.seed,
+        replay=args.replay,
+        record=bool(args.record),
+    )
+    if args.trace:
+        get_tracer().start(args.trace)
+    result = runner.run(args.seconds)
+    if args.trace:
+        get_tracer().stop()
+    if runner.recorder:
+        runner.recorder.save(args.record)
+    if args.profile:
+        get_profiler().export(args.profile)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"{result['mission']}: {result['sim_seconds']:.1f} sim s in "
+            f"{result['wall_seconds']:.2f} wall s = {result['sim_per_wall']:.1f}x "
+            f"({'render' if args.render else 'no render'}, "
+            f"{'replay' if args.replay else f'seed {args.seed}'})"
+        )
+        print(
+            f"  scene {result['scene']}, score {result['score']}, "
+            f"kills {result['kills']}, hp {result.get('player_health')}"
+        )
+        if args.profile:
+            print(get_profiler().format_table())
+    DebugLogger.system("Headless run finished")
+    return result
+
+
+if __name__ == "__main__":
+    main()
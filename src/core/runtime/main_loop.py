@@ -10,22 +10,33 @@ Responsibilities:
 - Manage global debug HUD
 """
 
+import os
 import pygame
 import time
 
-from src.core.runtime.game_settings import Display, Physics, Debug
+from src.core.runtime.game_settings import Display, Physics, Debug, Tracing
 
 from src.core.services.input_manager import InputManager
 from src.core.services.display_manager import DisplayManager
+from src.core.services.asset_bundle import open_bundle
+from src.core.services.asset_loader import get_asset_loader
+from src.core.services.config_cache import get_config_cache
+from src.core.services.rng import seed_all, set_seeds
 from src.core.services.scene_manager import SceneManager
+from src.core.services.settings_manager import get_settings
 
 from src.ui.core.ui_manager import UIManager
 
 from src.core.debug.debug_logger import DebugLogger
 from src.core.debug.debug_hud import DebugHUD
+from src.core.debug.event_trace import get_tracer
+from src.core.debug.frame_profiler import get_profiler
+from src.core.debug.profile_capture import get_profile_capture
 
 from src.graphics.draw_manager import DrawManager
 
+from src.systems.level.level_registry import LevelRegistry
+
 
 class MainLoop:
     """
@@ -38,15 +49,33 @@ class MainLoop:
     # Initialization
     # ===========================================================
 
-    def __init__(self):
-        """Initialize pygame and all core systems."""
+    def __init__(self, headless=False):
+        """
+        Initialize pygame and all core systems.
+
+        Args:
+            headless: Use SDL's dummy video/audio drivers (no window or
+                      sound device) and skip persisting display settings
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         DebugLogger.section("Initializing MainLoop")
+        load_start = get_asset_loader().snapshot()
+        config_start = get_config_cache().snapshot()
 
         self._init_pygame()
         self._init_core_systems()
         self._init_debug_systems()
         self._init_scene_manager()
 
+        DebugLogger.init_entry("AssetLoader")
+        get_asset_loader().report("Startup batch loads", load_start)
+        DebugLogger.init_entry("ConfigCache")
+        get_config_cache().report("Startup configs", config_start)
+
     def _init_pygame(self):
         """Initialize pygame subsystems and window."""
         pygame.init()
@@ -58,11 +87,35 @@ class MainLoop:
         DebugLogger.init_entry("Pygame")
         DebugLogger.init_sub("Configured Icon and Window Caption")
 
+        self._init_asset_bundle()
+
+    def _init_asset_bundle(self):
+        """Map the pre-decoded asset bundle (rebuilt if sources changed)."""
+        start = time.perf_counter()
+        bundle = open_bundle()
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        DebugLogger.init_entry("AssetBundle")
+        if bundle.entries:
+            DebugLogger.init_sub(
+                f"Mapped {len(bundle.entries)} pre-decoded assets ({elapsed:.0f}ms)"
+            )
+        else:
+            DebugLogger.init_sub("No asset bundle, decoding from disk")
+
     def _init_core_systems(self):
         """Initialize display, input, drawing, and UI systems."""
+        strategy = get_settings().get(
+            "graphics", "present_strategy", Display.DEFAULT_PRESENT_STRATEGY
+        )
         self.display = DisplayManager(
-            Display.WIDTH, Display.HEIGHT, Display.DEFAULT_WINDOW_SIZE
+            Display.WIDTH,
+            Display.HEIGHT,
+            Display.DEFAULT_WINDOW_SIZE,
+            present_strategy=strategy if strategy != "auto" else "software",
         )
+        if strategy == "auto" and not self.headless:
+            self._select_present_strategy()
         self.input_manager = InputManager(display_manager=self.display)
         self.draw_manager = DrawManager()
 
@@ -75,11 +128,25 @@ class MainLoop:
         )
         DebugLogger.init_sub("UIManager initialized")
 
+    def _select_present_strategy(self):
+        """Benchmark presentation strategies once and persist the fastest."""
+        best, _ = self.display.benchmark_strategies()
+
+        settings = get_settings()
+        settings.set("graphics", "present_strategy", best)
+        settings.save()
+
     def _init_debug_systems(self):
         """Initialize debug HUD and performance tracking."""
         self.debug_hud = DebugHUD(self.display, self.draw_manager)
+        self.profiler = get_profiler()
+        self.capture = get_profile_capture()
+        self.tracer = get_tracer()
         self._last_perf_warn_time = 0.0
 
+        if get_settings().get("debug", "trace", Tracing.ENABLED):
+            self.tracer.start()
+
         DebugLogger.init_sub(
             "Bound [DisplayManager, DrawManager] dependencies", level=1
         )
@@ -105,6 +172,36 @@ class MainLoop:
         except FileNotFoundError:
             DebugLogger.warn("Missing icon image")
 
+    def start_mission(self, mission=None, seed=0, seeds=None):
+        """
+        Seed the RNG streams and load a mission directly, skipping menus.
+
+        Args:
+            mission: Mission ID from Campaigns.json (None = campaign start)
+            seed: Master seed for every RNG stream
+            seeds: Exact {subsystem: seed} to apply instead (e.g. from a replay)
+
+        Returns:
+            tuple: (mission ID, {subsystem: seed} applied)
+
+        Raises:
+            ValueError: Unknown mission ID
+        """
+        if mission is None:
+            default = LevelRegistry.get_default_start()
+            mission = default.id if default else None
+        if LevelRegistry.get(mission) is None:
+            raise ValueError(f"Unknown mission '{mission}' (see Campaigns.json)")
+
+        if seeds:
+            seeds = dict(seeds)
+            set_seeds(seeds)
+        else:
+            seeds = seed_all(seed)
+
+        self.scenes.set_scene("Game", level_id=mission)
+        return mission, seeds
+
     # ===========================================================
     # Main Loop
     # ===========================================================
@@ -126,23 +223,80 @@ class MainLoop:
             frame_time = self.clock.tick(Display.FPS) / 1000.0
             frame_time = min(frame_time, Physics.MAX_FRAME_TIME)
             accumulator += frame_time
+            work_start = time.perf_counter()
+            self.capture.begin_frame()
 
-            # Process events
-            self._handle_events()
+            with self.tracer.span("frame", "frame"):
+                # Process events
+                self._handle_events()
 
-            # Fixed timestep updates
-            while accumulator >= fixed_dt:
-                self.input_manager.update()
-                self.scenes.update(fixed_dt)
-                accumulator -= fixed_dt
+                # Fixed timestep updates
+                while accumulator >= fixed_dt:
+                    self.input_manager.update()
+                    with self.profiler.scope("update"):
+                        self.scenes.update(fixed_dt)
+                    accumulator -= fixed_dt
+
+                # Render
+                self._draw(frame_time)
 
-            # Render
-            self._draw(frame_time)
+            work_ms = (time.perf_counter() - work_start) * 1000.0
+            self.capture.end_frame(work_ms, self._capture_context)
 
         # Cleanup
+        self.tracer.stop()
         pygame.quit()
         DebugLogger.system("Pygame terminated")
 
+    def run_fixed(self, ticks, render=False, before_tick=None):
+        """
+        Run fixed-timestep updates as fast as possible (no clock throttle).
+
+        Used for headless simulation: every tick advances the game by
+        exactly Physics.FIXED_DT, independent of wall-clock time.
+
+        Args:
+            ticks: Number of updates to run
+            render: Also run the draw pipeline each tick
+            before_tick: Optional callable(dt) run before each update
+                         (e.g. to advance scripted input)
+
+        Returns:
+            int: Ticks actually run (stops early on quit)
+        """
+        fixed_dt = Physics.FIXED_DT
+
+        for tick in range(ticks):
+            if not self.running:
+                return tick
+
+            work_start = time.perf_counter()
+            self.capture.begin_frame()
+            with self.tracer.span("tick", "frame"):
+                self._handle_events()
+                if before_tick:
+                    before_tick(fixed_dt)
+
+                self.input_manager.update()
+                with self.profiler.scope("update"):
+                    self.scenes.update(fixed_dt)
+
+                if render:
+                    self._draw(fixed_dt)
+
+            work_ms = (time.perf_counter() - work_start) * 1000.0
+            self.capture.end_frame(work_ms, self._capture_context)
+
+        return ticks
+
+    def _capture_context(self):
+        """Describe the current game state for profile captures."""
+        context = {"scene": self.scenes.active_name}
+        describe = getattr(self.scenes.active_scene, "profile_context", None)
+        if describe:
+            context.update(describe())
+        return context
+
     # ===========================================================
     # Event Handling
     # ===========================================================
@@ -153,7 +307,7 @@ class MainLoop:
 
         Routes events to:
         1. Quit handling
-        2. System input (F3, F11)
+        2. System input (F3, F8, F9, F10, F11)
         3. Scene-specific handling
         4. Debug HUD
         """
@@ -184,7 +338,7 @@ class MainLoop:
         self.draw_manager.clear()
 
         # Profile and render based on debug state
-        if Debug.PROFILING_ENABLED or Debug.HITBOX_VISIBLE:
+        if Debug.PROFILING_ENABLED or Debug.HITBOX_VISIBLE or self.profiler.enabled:
             self._draw_with_profiling(frame_time)
         else:
             self._draw_simple(frame_time)
@@ -204,7 +358,7 @@ class MainLoop:
 
         # Final render
         self.draw_manager.render(game_surface, debug=False)
-        self.display.render()
+        self.display.render(self.draw_manager.dirty_rects)
 
         # Record basic metrics (FPS only)
         fps = self.clock.get_fps()
@@ -232,11 +386,15 @@ class MainLoop:
         t_render = time.perf_counter()
         game_surface = self.display.get_game_surface()
         self.draw_manager.render(game_surface, debug=True)
-        self.display.render()
+        self.display.render(self.draw_manager.dirty_rects)
         render_time = (time.perf_counter() - t_render) * 1000
 
         # Record metrics
         frame_time_ms = (time.perf_counter() - start_total) * 1000
+        self.profiler.record("draw", frame_time_ms)
+        self.profiler.record("draw.scene", scene_time)
+        self.profiler.record("draw.hud", hud_time)
+        self.profiler.record("draw.render", render_time)
         fps = self.clock.get_fps()
         self.debug_hud.record_frame_metrics(frame_time_ms, scene_time, render_time, fps)
 
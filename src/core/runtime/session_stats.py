@@ -82,6 +82,20 @@ class SessionStats:
         """Remove a custom stat."""
         self._custom_stats.pop(key, None)
 
+    def as_dict(self) -> dict:
+        """Snapshot of all stats (custom stats under "custom")."""
+        return {
+            "score": self.score,
+            "high_score": self.high_score,
+            "total_score": self.total_score,
+            "enemies_killed": self.enemies_killed,
+            "items_collected": self.items_collected,
+            "run_time": round(self.run_time, 3),
+            "max_level_reached": self.max_level_reached,
+            "total_exp_gained": self.total_exp_gained,
+            "custom": dict(self._custom_stats),
+        }
+
     # ===========================================================
     # Lifecycle
     # ===========================================================
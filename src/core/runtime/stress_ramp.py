@@ -0,0 +1,292 @@
+"""
+stress_ramp.py
+--------------
+Finds the heaviest load each subsystem sustains within the frame budget.
+
+For every axis (straight spawns, homing, shooters, item drops, a mix),
+the driver generates stress missions (see stress_mission.py) with
+geometrically rising enemies per second and runs each headless at fixed
+timestep, with the same engine instance. After a warm-up, per-tick frame
+cost (update, plus draw when rendering) is taken from the frame profiler.
+The ramp stops at the first level whose p95 exceeds the budget; the level
+before it is the maximum sustainable load on this machine.
+
+Each level starts after the intro cutscene, the player is made unkillable
+so the load keeps building, and ticks spent in the level-up overlay are
+left out of the statistics.
+
+Usage:
+    python -m src.core.runtime.stress_ramp
+    python -m src.core.runtime.stress_ramp --axes homing shooters --budget 8
+    python -m src.core.runtime.stress_ramp --no-render --json ramp.json
+"""
+
+import argparse
+import json
+import os
+import time
+
+from src.core.debug.debug_logger import DebugLogger, LoggerConfig
+from src.core.debug.frame_profiler import get_profiler
+from src.core.runtime.game_settings import Display, Physics, Profiling, Spawning
+from src.core.runtime.main_loop import MainLoop
+from src.core.services.input_sources import ScriptedInput
+from src.systems.level.stress_mission import (
+    StressConfig,
+    register_stress_mission,
+    write_stress_mission,
+)
+
+# Generated missions (gitignored cache directory)
+OUTPUT_DIR = os.path.join(".cache", "stress")
+
+# StressConfig overrides per axis; the ramp raises enemies_per_second
+AXES = {
+    "spawns": {"homing_ratio": 0.0, "shooter_ratio": 0.0},
+    "homing": {"homing_ratio": 1.0, "shooter_ratio": 0.0},
+    "shooters": {"homing_ratio": 0.0, "shooter_ratio": 1.0, "shots_per_second": 2.0},
+    "items": {"homing_ratio": 0.0, "shooter_ratio": 0.0, "item_drop_chance": 1.0},
+    "mixed": {},
+}
+
+# Player health during a ramp (damage still runs, death never happens)
+_UNKILLABLE_HEALTH = 10**9
+
+
+class StressRamp:
+    """Ramps generated missions on one headless engine."""
+
+    def __init__(self, render=True, warmup=5.0, measure=10.0, seed=0):
+        """
+        Boot the engine headless.
+
+        Args:
+            render: Include the draw pipeline in the frame cost
+            warmup: Simulated seconds before measuring (load builds up)
+            measure: Simulated seconds measured per level
+            seed: Master seed for missions and RNG streams
+        """
+        self.render = render
+        self.warmup_ticks = round(warmup / Physics.FIXED_DT)
+        self.measure_ticks = round(measure / Physics.FIXED_DT)
+        self.seed = seed
+        self._run_index = 0
+
+        # One sample per measured tick must fit in the ring buffers
+        Profiling.RING_SIZE = max(Profiling.RING_SIZE, self.measure_ticks)
+        Spawning.FRAME_BUDGET_MS = float("inf")
+
+        self.loop = MainLoop(headless=True)
+        self.profiler = get_profiler()
+        self.profiler.set_enabled(True)
+
+    # ===========================================================
+    # Single Level
+    # ===========================================================
+
+    def run_level(self, config: StressConfig):
+        """
+        Run one stress configuration and measure its frame cost.
+
+        Args:
+            config: Mission load parameters
+
+        Returns:
+            dict: Frame cost percentiles (ms) and peak live entity counts
+        """
+        self._run_index += 1
+        path = os.path.join(OUTPUT_DIR, f"stress_{os.getpid()}_{self._run_index}.json")
+        level_id = register_stress_mission(write_stress_mission(config, path))
+
+        input_source = ScriptedInput(self.loop.input_manager)
+        self.loop.input_manager.set_key_source(input_source)
+        self.loop.start_mission(level_id, seed=self.seed)
+
+        scene = self.loop.scenes.active_scene
+        scene.player.health = scene.player.max_health = _UNKILLABLE_HEALTH
+
+        # Load starts when the intro cutscene ends (it also resumes spawning)
+        self.loop.run_fixed(1, before_tick=input_source.advance)
+        while scene.cutscene_manager.is_playing:
+            self.loop.run_fixed(1, before_tick=input_source.advance)
+
+        self.loop.run_fixed(
+            self.warmup_ticks, render=self.render, before_tick=input_source.advance
+        )
+        self.profiler.reset()
+
+        gameplay = []
+        peaks = {}
+
+        def before_tick(dt):
+            input_source.advance(dt)
+            gameplay.append(not scene.level_up_ui.is_active)
+            for key, value in scene.profile_context().items():
+                if isinstance(value, int) and value > peaks.get(key, 0):
+                    peaks[key] = value
+
+        start = time.perf_counter()
+        self.loop.run_fixed(
+            self.measure_ticks, render=self.render, before_tick=before_tick
+        )
+        wall = time.perf_counter() - start
+
+        frames = self.profiler.samples("update")
+        if self.render:
+            frames = [u + d for u, d in zip(frames, self.profiler.samples("draw"))]
+        frames = sorted(ms for ms, live in zip(frames, gameplay) if live)
+
+        peaks.pop("stage", None)
+        return {
+            "enemies_per_second": config.enemies_per_second,
+            "frames": len(frames),
+            "p50_ms": _percentile(frames, 50),
+            "p95_ms": _percentile(frames, 95),
+            "max_ms": frames[-1] if frames else 0.0,
+            "wall_seconds": round(wall, 2),
+            "peaks": peaks,
+        }
+
+    # ===========================================================
+    # Ramp
+    # ===========================================================
+
+    def ramp(self, axis, budget_ms, start=2.0, factor=1.5, max_steps=10):
+        """
+        Raise the spawn rate on one axis until the budget is exceeded.
+
+        Args:
+            axis: Name from AXES
+            budget_ms: Allowed p95 frame cost
+            start: First enemies-per-second level
+            factor: Multiplier between levels
+            max_steps: Stop after this many levels even if all pass
+
+        Returns:
+            dict: Per-level results, the last sustainable level and
+                  the first failing one (None if never exceeded)
+        """
+        overrides = AXES[axis]
+        duration = (self.warmup_ticks + self.measure_ticks) * Physics.FIXED_DT + 5.0
+        levels = []
+        sustained = None
+        failed = None
+
+        rate = start
+        for _ in range(max_steps):
+            config = StressConfig(
+                enemies_per_second=round(rate, 2),
+                duration=duration,
+                seed=self.seed,
+                **overrides,
+            )
+            result = self.run_level(config)
+            levels.append(result)
+            DebugLogger.system(
+                f"[{axis}] {result['enemies_per_second']:g}/s: "
+                f"p95 {result['p95_ms']:.2f} ms, peaks {result['peaks']}"
+            )
+            if result["p95_ms"] > budget_ms:
+                failed = result
+                break
+            sustained = result
+            rate *= factor
+
+        return {
+            "axis": axis,
+            "levels": levels,
+            "sustained": sustained,
+            "failed": failed,
+        }
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, -(-pct * len(sorted_values) // 100) - 1))
+    return sorted_values[rank]
+
+
+# ===========================================================
+# Command Line
+# ===========================================================
+
+
+def main(argv=None):
+    """Ramp the selected axes and print the sustainable loads."""
+    parser = argparse.ArgumentParser(
+        description="Find the sustainable load per subsystem"
+    )
+    parser.add_argument(
+        "--axes",
+        nargs="+",
+        choices=sorted(AXES),
+        default=list(AXES),
+        help="Axes to ramp",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1000.0 / Display.FPS,
+        help="p95 frame budget in ms (default: one frame at Display.FPS)",
+    )
+    parser.add_argument("--start", type=float, default=2.0, help="First enemies/second")
+    parser.add_argument(
+        "--factor", type=float, default=1.5, help="Rate multiplier per step"
+    )
+    parser.add_argument("--max-steps", type=int, default=10, help="Levels per axis")
+    parser.add_argument(
+        "--warmup", type=float, default=5.0, help="Sim seconds before measuring"
+    )
+    parser.add_argument(
+        "--measure", type=float, default=10.0, help="Sim seconds measured"
+    )
+    parser.add_argument(
+        "--no-render", action="store_true", help="Skip the draw pipeline"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", help="Also write the full results to this file")
+    parser.add_argument("--log", action="store_true", help="Keep game logging on")
+    args = parser.parse_args(argv)
+
+    LoggerConfig.ENABLE_LOGGING = args.log
+    driver = StressRamp(
+        render=not args.no_render,
+        warmup=args.warmup,
+        measure=args.measure,
+        seed=args.seed,
+    )
+
+    results = [
+        driver.ramp(axis, args.budget, args.start, args.factor, args.max_steps)
+        for axis in args.axes
+    ]
+
+    print(
+        f"\nSustainable load (p95 <= {args.budget:.2f} ms, "
+        f"{'render' if driver.render else 'no render'}):"
+    )
+    print(f"{'axis':<10}{'enemies/s':>10}{'p95 ms':>9}  peak live entities")
+    for result in results:
+        best = result["sustained"]
+        if best is None:
+            print(
+                f"{result['axis']:<10}{'-':>10}{'-':>9}  over budget at the first level"
+            )
+            continue
+        limit = "" if result["failed"] else "  (budget never exceeded)"
+        peaks = ", ".join(f"{k} {v}" for k, v in sorted(best["peaks"].items()))
+        print(
+            f"{result['axis']:<10}{best['enemies_per_second']:>10g}"
+            f"{best['p95_ms']:>9.2f}  {peaks}{limit}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"budget_ms": args.budget, "axes": results}, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
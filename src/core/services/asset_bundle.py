@@ -0,0 +1,399 @@
+"""
+asset_bundle.py
+---------------
+Pre-decoded asset bundle: image pixels and sound PCM in one indexed file.
+
+Startup otherwise decodes every PNG and WAV from disk. The bundle stores
+the decoded buffers once; at runtime the file is memory-mapped and
+surfaces are built with pygame.image.frombuffer() straight from the map
+(no decode, no copy until convert_alpha()).
+
+File layout:
+    MAGIC (8 bytes) | header length (u32 LE) | JSON header | blobs
+    Header: {"version", "pixel_format", "mixer", "entries": {path: entry},
+             "skipped": {path: mtime}}
+    Image entry: {"kind": "image", "offset", "size", "mtime", "width", "height"}
+    Sound entry: {"kind": "sound", "offset", "size", "mtime"}
+
+The bundle is rebuilt automatically when any source file is added,
+removed, or has a different mtime, or when the mixer format changes.
+Sources that failed to decode are recorded as skipped, so they only
+trigger a rebuild once they change.
+Run `python -m src.core.services.asset_bundle` to rebuild it offline.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+
+import pygame
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Cache
+
+
+# ===========================================================
+# Asset Bundle
+# ===========================================================
+
+
+class AssetBundle:
+    """Memory-mapped store of pre-decoded images and sounds."""
+
+    MAGIC = b"202XBNDL"
+    VERSION = 1
+    ALIGN = 16
+
+    # Matches the usual ARGB8888 display surface, so convert_alpha() is a copy
+    PIXEL_FORMAT = "BGRA"
+
+    IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+    SOUND_EXTS = (".wav", ".ogg")
+
+    # (root, kind, extensions) scanned for sources
+    SOURCES = (
+        ("assets/images", "image", IMAGE_EXTS),
+        ("assets/audio/bfx", "sound", SOUND_EXTS),
+        ("assets/audio/ui", "sound", SOUND_EXTS),
+    )
+
+    def __init__(self, path=None):
+        """
+        Initialize an unopened bundle.
+
+        Args:
+            path: Bundle file path (default Cache.ASSET_BUNDLE)
+        """
+        self.path = path or Cache.ASSET_BUNDLE
+        self.entries = {}
+        self.pixel_format = self.PIXEL_FORMAT
+        self._file = None
+        self._mmap = None
+        self._view = None
+        self._data_start = 0
+
+    # ===========================================================
+    # Open / Build
+    # ===========================================================
+
+    def open(self, rebuild=True):
+        """
+        Map the bundle, rebuilding it first if sources changed.
+
+        Args:
+            rebuild: Rebuild a missing or stale bundle (False = use as-is)
+
+        Returns:
+            bool: True if a bundle is mapped
+        """
+        self.close()
+        sources = self._scan_sources()
+        header = self._read_header()
+
+        if rebuild and self._is_stale(header, sources):
+            try:
+                self.build(sources)
+            except (OSError, pygame.error) as e:
+                DebugLogger.warn(f"Asset bundle build failed: {e}")
+                return False
+            header = self._read_header()
+
+        if header is None:
+            return False
+
+        try:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            DebugLogger.warn(f"Failed to map asset bundle: {e}")
+            self.close()
+            return False
+
+        self._view = memoryview(self._mmap)
+        (header_len,) = struct.unpack_from("<I", self._mmap, len(self.MAGIC))
+        self._data_start = len(self.MAGIC) + 4 + header_len
+        self.entries = header["entries"]
+        self.pixel_format = header["pixel_format"]
+        return True
+
+    def close(self):
+        """Release the mapping (surfaces built from it keep their own ref)."""
+        self.entries = {}
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Live frombuffer surfaces still export the map; GC closes it
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def build(self, sources=None):
+        """
+        Decode every source asset and write the bundle file.
+
+        Written to a temp file and swapped in, so a crash never leaves a
+        half-written bundle.
+
+        Args:
+            sources: {path: (kind, mtime)} from _scan_sources()
+        """
+        start = time.perf_counter()
+        sources = sources if sources is not None else self._scan_sources()
+        self.close()
+
+        entries = {}
+        skipped = {}
+        blobs = []
+        offset = 0
+
+        for path, (kind, mtime) in sorted(sources.items()):
+            try:
+                if kind == "image":
+                    surface = pygame.image.load(path)
+                    data = pygame.image.tobytes(surface, self.PIXEL_FORMAT)
+                    entry = {
+                        "width": surface.get_width(),
+                        "height": surface.get_height(),
+                    }
+                else:
+                    data = pygame.mixer.Sound(path).get_raw()
+                    entry = {}
+            except (pygame.error, FileNotFoundError) as e:
+                DebugLogger.warn(f"Bundle skipped {path}: {e}")
+                skipped[path] = mtime
+                continue
+
+            entry.update(
+                {"kind": kind, "offset": offset, "size": len(data), "mtime": mtime}
+            )
+            entries[path] = entry
+            blobs.append(data)
+            offset += len(data)
+            padding = -offset % self.ALIGN
+            if padding:
+                blobs.append(bytes(padding))
+                offset += padding
+
+        header = json.dumps(
+            {
+                "version": self.VERSION,
+                "pixel_format": self.PIXEL_FORMAT,
+                "mixer": list(pygame.mixer.get_init() or ()),
+                "entries": entries,
+                "skipped": skipped,
+            }
+        ).encode("utf-8")
+
+        # Blob offsets are relative to the aligned end of the header
+        prefix = len(self.MAGIC) + 4 + len(header)
+        header_pad = -prefix % self.ALIGN
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header) + header_pad))
+            f.write(header)
+            f.write(b" " * header_pad)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(temp_path, self.path)
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        DebugLogger.init_sub(
+            f"Built asset bundle: {len(entries)} assets, "
+            f"{offset / 1_048_576:.1f} MB in {elapsed:.0f}ms"
+            + (f" ({len(skipped)} skipped)" if skipped else "")
+        )
+
+    # ===========================================================
+    # Lookup
+    # ===========================================================
+
+    def exists(self, path):
+        """Check if a path is in the bundle (no filesystem access)."""
+        return os.path.normpath(path) in self.entries
+
+    def source_mtime(self, path):
+        """Get the bundled source mtime for a path, or None."""
+        entry = self.entries.get(os.path.normpath(path))
+        return entry["mtime"] if entry else None
+
+    def load_surface(self, path):
+        """
+        Build a surface directly over the mapped pixels.
+
+        Args:
+            path: Source image path
+
+        Returns:
+            pygame.Surface or None if not bundled
+        """
+        entry = self._get(path, "image")
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(
+            self._blob(entry), (entry["width"], entry["height"]), self.pixel_format
+        )
+
+    def load_sound(self, path):
+        """
+        Create a Sound from bundled PCM data.
+
+        Args:
+            path: Source sound path
+
+        Returns:
+            pygame.mixer.Sound or None if not bundled
+        """
+        entry = self._get(path, "sound")
+        if entry is None:
+            return None
+        return pygame.mixer.Sound(buffer=self._blob(entry))
+
+    def _get(self, path, kind):
+        """Get an entry of the given kind, or None."""
+        if self._view is None:
+            return None
+        entry = self.entries.get(os.path.normpath(path))
+        if entry is None or entry["kind"] != kind:
+            return None
+        return entry
+
+    def _blob(self, entry):
+        """Slice an entry's data out of the mapped file."""
+        start = self._data_start + entry["offset"]
+        return self._view[start : start + entry["size"]]
+
+    # ===========================================================
+    # Internal: Staleness
+    # ===========================================================
+
+    def _scan_sources(self):
+        """
+        List source assets with their mtimes.
+
+        Sounds are only bundled once the mixer is up, since PCM is stored in
+        the mixer's output format.
+
+        Returns:
+            dict: {normalized path: (kind, mtime)}
+        """
+        include_sounds = bool(pygame.mixer.get_init())
+        sources = {}
+        for root, kind, exts in self.SOURCES:
+            if kind == "sound" and not include_sounds:
+                continue
+            for directory, _, files in os.walk(root):
+                for name in files:
+                    if name.lower().endswith(exts):
+                        path = os.path.normpath(os.path.join(directory, name))
+                        sources[path] = (kind, os.path.getmtime(path))
+        return sources
+
+    def _read_header(self):
+        """Read the JSON header, or None if missing/corrupt/old."""
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(self.MAGIC)) != self.MAGIC:
+                    return None
+                (header_len,) = struct.unpack("<I", f.read(4))
+                header = json.loads(f.read(header_len))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        if header.get("version") != self.VERSION:
+            return None
+        return header
+
+    def _is_stale(self, header, sources):
+        """
+        Check if the bundle is missing or out of date with its sources.
+
+        Sources recorded as skipped count as known, so an undecodable file
+        does not force a rebuild on every start; changing it does.
+        """
+        if header is None:
+            return True
+
+        mixer = list(pygame.mixer.get_init() or ())
+        if mixer and header.get("mixer") != mixer:
+            return True
+
+        known = {path: entry["mtime"] for path, entry in header["entries"].items()}
+        known.update(header.get("skipped", {}))
+        if known.keys() != sources.keys():
+            return True
+        return any(known[path] != mtime for path, (_, mtime) in sources.items())
+
+
+# ===========================================================
+# Module Helpers
+# ===========================================================
+
+
+def asset_exists(path):
+    """
+    Check if an asset exists, answering from the bundle index when possible.
+
+    Args:
+        path: Asset path
+
+    Returns:
+        bool
+    """
+    return get_bundle().exists(path) or os.path.exists(path)
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_BUNDLE = None
+
+
+def get_bundle() -> AssetBundle:
+    """Get the bundle singleton (unopened until open_bundle() is called)."""
+    global _BUNDLE
+    if _BUNDLE is None:
+        _BUNDLE = AssetBundle()
+    return _BUNDLE
+
+
+def open_bundle(rebuild=True) -> AssetBundle:
+    """
+    Open (and if needed rebuild) the bundle singleton.
+
+    Args:
+        rebuild: Rebuild when sources changed
+
+    Returns:
+        AssetBundle
+    """
+    bundle = get_bundle()
+    bundle.open(rebuild=rebuild)
+    return bundle
+
+
+def main():
+    """Rebuild the bundle offline."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    bundle = AssetBundle()
+    bundle.build()
+    bundle.open(rebuild=False)
+    images = sum(1 for e in bundle.entries.values() if e["kind"] == "image")
+    sounds = len(bundle.entries) - images
+    print(f"{bundle.path}: {images} images, {sounds} sounds")
+
+
+if __name__ == "__main__":
+    main()
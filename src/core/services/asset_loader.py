@@ -0,0 +1,310 @@
+"""
+asset_loader.py
+---------------
+Batched asset decoding on a thread pool.
+
+PNG decoding (SDL_image) and WAV loading release the GIL, so a batch of
+files can decode in parallel. Surfaces are handed back to the main thread
+for convert_alpha() (display access stays single-threaded), then parked in
+image_formats so the existing loaders pick them up instead of decoding.
+
+Each batch records wall-clock time and the summed per-task thread CPU time,
+which approximates what the same batch costs when loaded serially.
+"""
+
+import os
+import re
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.services.asset_bundle import asset_exists, get_bundle
+from src.graphics.image_formats import add_preloaded, clear_preloaded, decode_image
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+IMAGE_ROOT = "assets/images"
+
+# Image path tokens in raw config text (quoted or bare YAML scalars)
+_IMAGE_PATH_RE = re.compile(r"[\w./-]+\.(?:png|jpe?g|bmp)\b", re.IGNORECASE)
+
+
+# ===========================================================
+# Asset Loader
+# ===========================================================
+
+
+class AssetLoader:
+    """Thread-pool decoder for batches of image and sound loads."""
+
+    MAX_WORKERS = 4
+
+    def __init__(self, max_workers=None):
+        """
+        Initialize the worker pool.
+
+        Args:
+            max_workers: Thread count (default min(MAX_WORKERS, cpu_count))
+        """
+        self.workers = max_workers or min(self.MAX_WORKERS, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="asset"
+        )
+
+        # Running totals: (assets, wall ms, serial ms)
+        self.total_count = 0
+        self.total_wall_ms = 0.0
+        self.total_serial_ms = 0.0
+
+    # ===========================================================
+    # Batches
+    # ===========================================================
+
+    def preload_images(self, paths):
+        """
+        Decode images in parallel and park them for load_image().
+
+        Args:
+            paths: Iterable of image paths (missing files are skipped)
+
+        Returns:
+            int: Number of images preloaded
+        """
+        return self.finish_images(self.submit_images(paths))
+
+    def submit_images(self, paths):
+        """
+        Start decoding images without waiting for them.
+
+        Args:
+            paths: Iterable of image paths (missing files are skipped)
+
+        Returns:
+            AssetBatch: Handle for finish_images()
+        """
+        paths = [p for p in dict.fromkeys(paths) if asset_exists(p)]
+        return self._submit(decode_image, paths)
+
+    def finish_images(self, batch):
+        """
+        Wait for an image batch and park the surfaces for load_image().
+
+        Args:
+            batch: AssetBatch from submit_images()
+
+        Returns:
+            int: Number of images preloaded
+        """
+        decoded = self._collect(batch)
+
+        # Display-format conversion must happen on the main thread
+        for path, surface in decoded.items():
+            add_preloaded(path, surface.convert_alpha())
+        return len(decoded)
+
+    def load_sounds(self, paths):
+        """
+        Load sounds in parallel.
+
+        Args:
+            paths: Iterable of sound paths
+
+        Returns:
+            dict: {path: pygame.mixer.Sound} for every path that loaded
+        """
+        return self._collect(self._submit(_decode_sound, list(dict.fromkeys(paths))))
+
+    def release_preloaded(self):
+        """Drop preloaded surfaces that no loader consumed."""
+        clear_preloaded()
+
+    def shutdown(self):
+        """Stop the worker threads."""
+        self._pool.shutdown(wait=False)
+
+    # ===========================================================
+    # Reporting
+    # ===========================================================
+
+    def snapshot(self):
+        """
+        Get running totals for later comparison with report().
+
+        Returns:
+            tuple: (assets, wall_ms, serial_ms)
+        """
+        return self.total_count, self.total_wall_ms, self.total_serial_ms
+
+    def report(self, label, since=(0, 0.0, 0.0)):
+        """
+        Log batch time against the serial estimate since a snapshot.
+
+        Args:
+            label: Log prefix (e.g. "GameScene.on_load")
+            since: Earlier snapshot() value
+
+        Returns:
+            float: Milliseconds saved versus the serial path
+        """
+        count = self.total_count - since[0]
+        wall_ms = self.total_wall_ms - since[1]
+        serial_ms = self.total_serial_ms - since[2]
+        saved_ms = serial_ms - wall_ms
+
+        DebugLogger.init_sub(
+            f"{label}: {count} assets in {wall_ms:.0f}ms on {self.workers} threads "
+            f"(serial ~{serial_ms:.0f}ms, saved {saved_ms:.0f}ms)"
+        )
+        return saved_ms
+
+    # ===========================================================
+    # Config Scanning
+    # ===========================================================
+
+    @staticmethod
+    def collect_image_paths(config, root=IMAGE_ROOT):
+        """
+        Find image paths anywhere in a nested config.
+
+        Paths not starting with "assets/" are taken relative to root (the
+        UI YAML convention).
+
+        Args:
+            config: Dict/list tree from a config file (views work too)
+            root: Base directory for relative paths
+
+        Returns:
+            list: Image paths in discovery order
+        """
+        found = []
+        stack = [config]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Mapping):
+                stack.extend(reversed(list(node.values())))
+            elif isinstance(node, (list, tuple)):
+                stack.extend(reversed(node))
+            elif isinstance(node, str) and node.lower().endswith(IMAGE_EXTS):
+                found.append(node if node.startswith("assets/") else f"{root}/{node}")
+        return found
+
+    @staticmethod
+    def scan_image_paths(filepath, root=IMAGE_ROOT):
+        """
+        Find image paths in a config file's text without parsing it.
+
+        Much cheaper than a YAML load when only the paths are needed.
+
+        Args:
+            filepath: Config file path
+            root: Base directory for relative paths
+
+        Returns:
+            list: Image paths in file order
+        """
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return []
+        return [
+            p if p.startswith("assets/") else f"{root}/{p}"
+            for p in _IMAGE_PATH_RE.findall(text)
+        ]
+
+    # ===========================================================
+    # Internal
+    # ===========================================================
+
+    def _submit(self, fn, paths):
+        """
+        Queue fn over paths on the pool.
+
+        Args:
+            fn: Callable(path) -> result, run on worker threads
+            paths: List of paths
+
+        Returns:
+            AssetBatch
+        """
+        futures = [(path, self._pool.submit(_timed, fn, path)) for path in paths]
+        return AssetBatch(futures, time.perf_counter())
+
+    def _collect(self, batch):
+        """
+        Wait for a batch and record its timing.
+
+        Wall time runs from submission to the last task finishing, so a
+        batch collected frames later is not charged for the wait.
+
+        Args:
+            batch: AssetBatch from _submit()
+
+        Returns:
+            dict: {path: result} for tasks that succeeded
+        """
+        results = {}
+        serial_s = 0.0
+        end = batch.start
+        for path, future in batch.futures:
+            try:
+                result, cpu_s, finished = future.result()
+            except (pygame.error, OSError) as e:
+                DebugLogger.warn(
+                    f"Async load failed for {path}: {e}", category="loading"
+                )
+                continue
+            results[path] = result
+            serial_s += cpu_s
+            end = max(end, finished)
+
+        self.total_count += len(results)
+        self.total_wall_ms += (end - batch.start) * 1000.0
+        self.total_serial_ms += serial_s * 1000.0
+        return results
+
+
+class AssetBatch:
+    """Pending decode tasks from AssetLoader.submit_images()."""
+
+    __slots__ = ("futures", "start")
+
+    def __init__(self, futures, start):
+        self.futures = futures
+        self.start = start
+
+    def done(self):
+        """Check if every task finished (collecting will not block)."""
+        return all(future.done() for _, future in self.futures)
+
+
+def _timed(fn, path):
+    """Run fn(path) and return (result, thread CPU seconds, end time)."""
+    start = time.thread_time()
+    result = fn(path)
+    return result, time.thread_time() - start, time.perf_counter()
+
+
+def _decode_sound(path):
+    """Load a sound from the bundle, or decode it from disk."""
+    sound = get_bundle().load_sound(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+    return sound
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_LOADER = None
+
+
+def get_asset_loader() -> AssetLoader:
+    """Get or create the asset loader singleton."""
+    global _LOADER
+    if _LOADER is None:
+        _LOADER = AssetLoader()
+    return _LOADER
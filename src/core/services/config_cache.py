@@ -0,0 +1,351 @@
+"""
+config_cache.py
+---------------
+Compiled cache for JSON and YAML config files.
+
+Parsing text (PyYAML especially, which is pure Python) dominates config
+load time, and several systems read the same files. Parsed data is kept
+at two levels, both keyed by path and validated against the source file's
+mtime and size:
+
+- In-process memo: a marshal snapshot per file. load() unpacks a fresh
+  mutable copy from it; view() returns a shared read-only tree.
+- On disk (Cache.CONFIGS): the same snapshot, so the next run skips the
+  parser entirely. Data marshal cannot encode falls back to pickle.
+
+Run `python -m src.core.services.config_cache` to time cold (parse) versus
+warm (snapshot) loads for every indexed config file.
+"""
+
+import json
+import marshal
+import os
+import pickle
+import time
+from types import MappingProxyType
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Cache
+
+# Bump when the snapshot layout or the compile step changes
+CACHE_VERSION = 1
+
+_MARSHAL = b"M"
+_PICKLE = b"P"
+
+
+# ===========================================================
+# Config Cache
+# ===========================================================
+
+
+class ConfigCache:
+    """Two-level (memory + disk) cache of parsed config files."""
+
+    def __init__(self, cache_dir=None, persist=True):
+        """
+        Initialize an empty cache.
+
+        Args:
+            cache_dir: Snapshot directory (default Cache.CONFIGS)
+            persist: Read and write snapshots on disk
+        """
+        self.cache_dir = cache_dir or Cache.CONFIGS
+        self.persist = persist
+
+        # {normpath: _Entry}
+        self._memo = {}
+
+        # Running totals: (loads, parsed, disk hits, memo hits, load ms, parse ms)
+        self.loads = 0
+        self.parsed = 0
+        self.disk_hits = 0
+        self.memo_hits = 0
+        self.load_ms = 0.0
+        self.parse_ms = 0.0
+
+    # ===========================================================
+    # Public API
+    # ===========================================================
+
+    def load(self, path):
+        """
+        Load a config file as a fresh, mutable object.
+
+        Args:
+            path: .json or .yaml/.yml file path
+
+        Returns:
+            Parsed data (callers may modify it freely)
+
+        Raises:
+            FileNotFoundError, OSError: File missing or unreadable
+            json.JSONDecodeError, yaml.YAMLError: Parse error
+        """
+        start = time.perf_counter()
+        entry = self._get_entry(path)
+        data = _unpack(entry.blob)
+        self.load_ms += (time.perf_counter() - start) * 1000.0
+        return data
+
+    def view(self, path):
+        """
+        Load a config file as a shared read-only tree.
+
+        Dicts become MappingProxyType and lists become tuples. No copy is
+        made after the first call, so this is the cheapest way to read a
+        config that is never modified.
+
+        Args:
+            path: .json or .yaml/.yml file path
+
+        Returns:
+            Frozen parsed data
+
+        Raises:
+            Same as load()
+        """
+        start = time.perf_counter()
+        entry = self._get_entry(path)
+        if entry.frozen is None:
+            entry.frozen = _freeze(_unpack(entry.blob))
+        self.load_ms += (time.perf_counter() - start) * 1000.0
+        return entry.frozen
+
+    def invalidate(self, path=None):
+        """
+        Drop memoized entries (disk snapshots revalidate by themselves).
+
+        Args:
+            path: File to drop, or None for all
+        """
+        if path is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(os.path.normpath(path), None)
+
+    # ===========================================================
+    # Reporting
+    # ===========================================================
+
+    def snapshot(self):
+        """
+        Get running totals for later comparison with report().
+
+        Returns:
+            tuple: (loads, parsed, disk_hits, memo_hits, load_ms, parse_ms)
+        """
+        return (
+            self.loads,
+            self.parsed,
+            self.disk_hits,
+            self.memo_hits,
+            self.load_ms,
+            self.parse_ms,
+        )
+
+    def report(self, label, since=(0, 0, 0, 0, 0.0, 0.0)):
+        """
+        Log config load time against the cold (parse everything) estimate.
+
+        Every snapshot stores how long its file took to parse, so warm
+        loads still know what a cold load would have cost.
+
+        Args:
+            label: Log prefix (e.g. "Startup configs")
+            since: Earlier snapshot() value
+
+        Returns:
+            float: Milliseconds saved versus parsing every load
+        """
+        now = self.snapshot()
+        loads, parsed, disk, memo = (now[i] - since[i] for i in range(4))
+        load_ms = now[4] - since[4]
+        cold_ms = now[5] - since[5]
+        saved_ms = cold_ms - load_ms
+
+        DebugLogger.init_sub(
+            f"{label}: {loads} loads in {load_ms:.1f}ms "
+            f"({parsed} parsed, {disk} from disk, {memo} memoized; "
+            f"cold ~{cold_ms:.1f}ms, saved {saved_ms:.1f}ms)"
+        )
+        return saved_ms
+
+    # ===========================================================
+    # Internal
+    # ===========================================================
+
+    def _get_entry(self, path):
+        """Return a valid entry for path from memo, disk, or a fresh parse."""
+        key = os.path.normpath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        self.loads += 1
+
+        entry = self._memo.get(key)
+        if entry is not None and entry.stamp == stamp:
+            self.memo_hits += 1
+            self.parse_ms += entry.parse_ms
+            return entry
+
+        entry = self._read_snapshot(key, stamp)
+        if entry is not None:
+            self.disk_hits += 1
+        else:
+            entry = self._compile(key, stamp)
+            self.parsed += 1
+            self._write_snapshot(key, entry)
+
+        self.parse_ms += entry.parse_ms
+        self._memo[key] = entry
+        return entry
+
+    def _compile(self, path, stamp):
+        """Parse a config file and pack it into a new entry."""
+        start = time.perf_counter()
+        data = _parse(path)
+        parse_ms = (time.perf_counter() - start) * 1000.0
+
+        # load_config() ignores top-level notes; drop them once here
+        if isinstance(data, dict):
+            data.pop("_notes", None)
+        return _Entry(stamp, _pack(data), parse_ms)
+
+    def _snapshot_path(self, path):
+        """Snapshot file for a config path."""
+        name = path.replace(os.sep, "__").replace(":", "_")
+        return os.path.join(self.cache_dir, name + ".bin")
+
+    def _read_snapshot(self, path, stamp):
+        """Load a disk snapshot if it matches the source stamp."""
+        if not self.persist:
+            return None
+        try:
+            with open(self._snapshot_path(path), "rb") as f:
+                version, mtime_ns, size, parse_ms, blob = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != CACHE_VERSION or (mtime_ns, size) != stamp:
+            return None
+        return _Entry(stamp, blob, parse_ms)
+
+    def _write_snapshot(self, path, entry):
+        """Store an entry on disk (atomic replace, failures are non-fatal)."""
+        if not self.persist:
+            return
+        target = self._snapshot_path(path)
+        record = (CACHE_VERSION, *entry.stamp, entry.parse_ms, entry.blob)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp = f"{target}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                marshal.dump(record, f)
+            os.replace(temp, target)
+        except OSError as e:
+            DebugLogger.warn(f"Config cache write failed for {path}: {e}")
+
+
+class _Entry:
+    """Memoized config: source stamp, packed data, lazy frozen view."""
+
+    __slots__ = ("stamp", "blob", "parse_ms", "frozen")
+
+    def __init__(self, stamp, blob, parse_ms):
+        self.stamp = stamp
+        self.blob = blob
+        self.parse_ms = parse_ms
+        self.frozen = None
+
+
+# ===========================================================
+# Helpers
+# ===========================================================
+
+
+def _parse(path):
+    """Parse JSON or YAML text."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def _pack(data):
+    """Serialize data, preferring marshal (fastest to load)."""
+    try:
+        return _MARSHAL + marshal.dumps(data)
+    except ValueError:
+        # e.g. YAML timestamps
+        return _PICKLE + pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+
+def _unpack(blob):
+    """Deserialize data from _pack()."""
+    if blob[:1] == _MARSHAL:
+        return marshal.loads(blob[1:])
+    return pickle.loads(blob[1:])
+
+
+def _freeze(data):
+    """Recursively convert dicts and lists to read-only equivalents."""
+    if isinstance(data, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(v) for v in data)
+    return data
+
+
+# ===========================================================
+# Singleton Access
+# ===========================================================
+
+_CACHE = None
+
+
+def get_config_cache() -> ConfigCache:
+    """Get or create the config cache singleton."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ConfigCache()
+    return _CACHE
+
+
+# ===========================================================
+# Offline Report
+# ===========================================================
+
+
+def main():
+    """Time cold and warm loads of every indexed JSON/YAML config."""
+    from src.core.services.config_manager import get_indexed_files
+
+    paths = sorted(
+        p
+        for p in get_indexed_files().values()
+        if p.endswith((".json", ".yaml", ".yml"))
+    )
+
+    def timed(fn):
+        start = time.perf_counter()
+        for path in paths:
+            fn(path)
+        return (time.perf_counter() - start) * 1000.0
+
+    cold_ms = timed(_parse)
+    cache = ConfigCache()
+    timed(cache.load)  # Ensure snapshots exist
+    disk_ms = timed(ConfigCache().load)
+    memo_ms = timed(cache.load)
+    view_ms = timed(cache.view)
+
+    print(f"{len(paths)} config files")
+    print(f"  cold (parse):      {cold_ms:8.2f}ms")
+    print(f"  warm (disk):       {disk_ms:8.2f}ms")
+    print(f"  warm (memo copy):  {memo_ms:8.2f}ms")
+    print(f"  warm (memo view):  {view_ms:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,9 @@ config_manager.py
 Universal configuration loader for engine and game config.
 
 Features:
-- Supports .json and .py config files
+- Supports .json, .yaml and .py config files
 - Builds file index once at startup for O(1) lookups
+- Parsed JSON/YAML is cached in memory and on disk (see config_cache)
 - Recursively merges defaults
 - Ignores '_notes' keys for human-readable configs
 """
@@ -13,7 +14,9 @@ Features:
 import os
 import json
 import importlib.util
+from types import MappingProxyType
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.config_cache import get_config_cache
 
 
 # ===========================================================
@@ -33,6 +36,8 @@ SEARCH_DIRS = [
 
 _FILE_INDEX = None
 
+_EMPTY_VIEW = MappingProxyType({})
+
 
 # ===========================================================
 # Public API
@@ -54,13 +59,9 @@ def load_config(filename, default_dict=None, strict=False):
     if default_dict is None:
         default_dict = {}
 
-    # Resolve path (absolute paths pass through, others use index)
-    if os.path.isabs(filename) and os.path.exists(filename):
-        path = filename
-    else:
-        path = _resolve_search_path(filename)
+    path = _resolve_path(filename)
 
-    # Load and merge
+    # Load and merge (cached data is already a private copy)
     try:
         if path.endswith(".py"):
             data = _load_py_module(path)
@@ -69,6 +70,8 @@ def load_config(filename, default_dict=None, strict=False):
         else:
             data = _load_json(path)
 
+        if not default_dict and isinstance(data, dict):
+            return data
         return _merge_dicts(default_dict, data)
 
     except (json.JSONDecodeError, FileNotFoundError, IOError) as e:
@@ -80,6 +83,27 @@ def load_config(filename, default_dict=None, strict=False):
         return default_dict.copy()
 
 
+def load_config_view(filename):
+    """
+    Load a JSON/YAML config as a shared read-only view.
+
+    Cheaper than load_config() for data that is only read: no copy or
+    merge per call. Dicts are MappingProxyType and lists are tuples.
+
+    Args:
+        filename: Filename or full path (.json or .yaml)
+
+    Returns:
+        Mapping: Frozen config, or an empty mapping if it failed to load
+    """
+    path = _resolve_path(filename)
+    try:
+        return get_config_cache().view(path)
+    except (json.JSONDecodeError, FileNotFoundError, IOError) as e:
+        DebugLogger.warn(f"Failed to load {path}: {e}", category="loading")
+        return _EMPTY_VIEW
+
+
 def build_file_index():
     """Scan config directories and cache all file paths. Call once at startup."""
     global _FILE_INDEX
@@ -116,6 +140,13 @@ def get_indexed_files():
 # ===========================================================
 
 
+def _resolve_path(filename):
+    """Absolute paths pass through, others use the index."""
+    if os.path.isabs(filename) and os.path.exists(filename):
+        return filename
+    return _resolve_search_path(filename)
+
+
 def _resolve_search_path(filename):
     """O(1) lookup from pre-built index."""
     if _FILE_INDEX is None:
@@ -143,9 +174,8 @@ def _resolve_search_path(filename):
 
 
 def _load_json(path):
-    """Load JSON config file."""
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    """Load JSON config file (through the config cache)."""
+    data = get_config_cache().load(path)
     DebugLogger.system(f"Loaded {os.path.basename(path)}", category="loading")
     return data
 
@@ -168,11 +198,8 @@ def _load_py_module(path):
 
 
 def _load_yaml(path):
-    """Load YAML config file."""
-    import yaml
-
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    """Load YAML config file (through the config cache)."""
+    data = get_config_cache().load(path)
     DebugLogger.system(f"Loaded {os.path.basename(path)}", category="loading")
     return data or {}
 
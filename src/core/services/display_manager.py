@@ -7,9 +7,13 @@ Responsibilities:
 - Window creation and fullscreen toggling
 - Aspect ratio preservation with letterboxing
 - Screen-to-game coordinate conversion
-- Render scaling pipeline
+- Render scaling pipeline (full flip or dirty-rect updates)
+- Presentation strategy selection (software, integer, SCALED)
 """
 
+import time
+from fractions import Fraction
+
 import pygame
 
 from src.core.debug.debug_logger import DebugLogger
@@ -21,8 +25,18 @@ class DisplayManager:
     Manages window display with software-based scaling.
 
     Uses CPU-based pygame.transform.scale() for reliable cross-platform behavior.
-    Hardware acceleration (pygame.SCALED) was rejected due to inconsistent
-    mouse coordinate mapping and platform-dependent behavior.
+    Hardware acceleration (pygame.SCALED) is opt-in as a presentation strategy
+    because mouse mapping and renderer availability vary by platform.
+
+    Strategies (Display.PRESENT_STRATEGIES):
+        software: Fractional transform.scale to fit the window
+        integer:  Largest whole factor that fits, the rest is letterboxed
+                  (1:1 is a plain blit); chosen in settings, never by benchmark
+        scaled:   pygame.SCALED, the renderer stretches the logical surface
+
+    Rendering the game at window resolution with a scaled camera is not a
+    strategy: sprites, UI and the dirty-rect diff all work in fixed 1280x720
+    game space, so it would mean a world-space camera through every draw call.
 
     Performance: ~2ms overhead per frame at 1080p, acceptable for 2D games.
     """
@@ -31,7 +45,13 @@ class DisplayManager:
     # Initialization
     # ===========================================================
 
-    def __init__(self, game_width=1280, game_height=720, window_size="small"):
+    def __init__(
+        self,
+        game_width=1280,
+        game_height=720,
+        window_size="small",
+        present_strategy="software",
+    ):
         """
         Initialize display system.
 
@@ -39,32 +59,46 @@ class DisplayManager:
             game_width: Logical game resolution width
             game_height: Logical game resolution height
             window_size: Initial window preset ("small", "medium", "large")
+            present_strategy: Presentation strategy name (see class docstring)
         """
         DebugLogger.init_entry("DisplayManager")
 
         # Core dimensions
         self.game_width = game_width
         self.game_height = game_height
-        self.game_surface = pygame.Surface((game_width, game_height))
+        self._offscreen_surface = pygame.Surface((game_width, game_height))
+        self.game_surface = self._offscreen_surface
 
         # Window state
         self.window = None
         self.window_size_preset = window_size
         self.is_fullscreen = False
+        if present_strategy not in Display.PRESENT_STRATEGIES:
+            DebugLogger.warn(f"Unknown present strategy: {present_strategy}")
+            present_strategy = "software"
+        self.present_strategy = present_strategy
 
         # Scaling state (calculated in _calculate_scale)
         self.scale = 1.0
         self.offset_x = 0
         self.offset_y = 0
         self.scaled_size = (game_width, game_height)
+        self._dirty_align = 1  # Game px step that maps to whole window px
 
         # Render cache
         self._letterbox_bars = None
         self._scaled_surface_cache = None
         self._display_dirty = True
 
-        # Create initial window
-        self._create_window(silent=True)
+        # Create initial window (SCALED needs a renderer, fall back without one)
+        try:
+            self._create_window(silent=True)
+        except pygame.error as e:
+            DebugLogger.warn(
+                f"Present strategy '{self.present_strategy}' unavailable: {e}"
+            )
+            self.present_strategy = "software"
+            self._create_window(silent=True)
 
         mode = (
             "Fullscreen"
@@ -72,6 +106,7 @@ class DisplayManager:
             else f"Windowed ({game_width}x{game_height})"
         )
         DebugLogger.init_sub(f"Display Mode: {mode}", level=1)
+        DebugLogger.init_sub(f"Present Strategy: {self.present_strategy}", level=1)
 
     # ===========================================================
     # Window Management
@@ -101,9 +136,11 @@ class DisplayManager:
         self.window_size_preset = size_preset
         window_w, window_h = Display.WINDOW_SIZES[size_preset]
 
-        self.window = pygame.display.set_mode(
-            (window_w, window_h), pygame.DOUBLEBUF | pygame.HWSURFACE
-        )
+        if self.present_strategy == "scaled":
+            # Resizing keeps the existing renderer; set_mode would recreate it
+            self._resize_scaled_window((window_w, window_h))
+        else:
+            self._set_mode(fullscreen=False)
         self._calculate_scale()
 
         DebugLogger.state(
@@ -114,6 +151,89 @@ class DisplayManager:
         """Force display refresh on next render (for external changes)."""
         self._display_dirty = True
 
+    def set_present_strategy(self, strategy: str) -> bool:
+        """
+        Switch presentation strategy and recreate the window.
+
+        Falls back to the previous strategy if the window cannot be created
+        (e.g. no renderer for SCALED).
+
+        Args:
+            strategy: Strategy name from Display.PRESENT_STRATEGIES
+
+        Returns:
+            bool: True if the strategy is now active
+        """
+        if strategy not in Display.PRESENT_STRATEGIES:
+            DebugLogger.warn(f"Unknown present strategy: {strategy}")
+            return False
+        if strategy == self.present_strategy:
+            return True
+
+        previous = self.present_strategy
+        self.present_strategy = strategy
+        try:
+            self._create_window(fullscreen=self.is_fullscreen, silent=True)
+        except pygame.error as e:
+            DebugLogger.warn(f"Present strategy '{strategy}' unavailable: {e}")
+            self.present_strategy = previous
+            self._create_window(fullscreen=self.is_fullscreen, silent=True)
+            return False
+
+        DebugLogger.state(f"Present strategy → {strategy}", category="display")
+        return True
+
+    def get_strategy_candidates(self) -> list:
+        """
+        Strategies worth benchmarking for the current window.
+
+        Integer scaling is left out: at a whole fit ratio it runs the same
+        transform.scale as software, and at any other ratio it wins only by
+        shrinking the picture, which the benchmark must not decide.
+
+        Returns:
+            list: Strategy names
+        """
+        return ["software", "scaled"]
+
+    def benchmark_strategies(self, frames: int = None) -> tuple:
+        """
+        Time a full-frame present for each candidate strategy.
+
+        Leaves the fastest strategy active. Strategies that fail to create a
+        window are skipped. Ties keep the earlier (simpler) candidate.
+
+        Args:
+            frames: Presents to time per strategy (after one warm-up)
+
+        Returns:
+            tuple: (best_strategy, {strategy: ms_per_present})
+        """
+        frames = frames or Display.PRESENT_BENCHMARK_FRAMES
+        original = self.present_strategy
+        results = {}
+
+        for strategy in self.get_strategy_candidates():
+            if not self.set_present_strategy(strategy):
+                continue
+
+            self.game_surface.fill((32, 32, 48))
+            self.render()
+
+            start = time.perf_counter()
+            for _ in range(frames):
+                self.render()
+            elapsed = time.perf_counter() - start
+
+            results[strategy] = elapsed * 1000.0 / frames
+
+        best = min(results, key=results.get) if results else original
+        self.set_present_strategy(best)
+
+        summary = ", ".join(f"{name}={ms:.2f}ms" for name, ms in results.items())
+        DebugLogger.init_sub(f"Present Benchmark: {summary} → {best}", level=1)
+        return best, results
+
     # ===========================================================
     # Rendering Pipeline
     # ===========================================================
@@ -122,27 +242,113 @@ class DisplayManager:
         """Get the logical game surface (always 1280x720)."""
         return self.game_surface
 
-    def render(self):
+    def render(self, dirty_rects=None):
         """
         Scale and render game surface to window with letterboxing.
 
         Pipeline:
         1. Refresh letterbox bars if window changed (cached)
-        2. Scale game_surface to window size (expensive, ~2ms)
-        3. Flip display buffer
+        2. Present only dirty regions when few changed (see _present_dirty)
+        3. Otherwise scale game_surface to window size (expensive, ~2ms)
+        4. Flip display buffer
+
+        Args:
+            dirty_rects: Changed game-space rects from DrawManager,
+                         or None to present the full frame
         """
         if self._display_dirty:
             self._refresh_display_cache()
+            dirty_rects = None
 
-        # Scale game surface to cached destination
-        pygame.transform.scale(
-            self.game_surface, self.scaled_size, dest_surface=self._scaled_surface_cache
-        )
+        if dirty_rects is not None and self._present_dirty(dirty_rects):
+            return
+
+        if self.present_strategy == "scaled":
+            # game_surface is the display surface; the renderer does the scaling
+            pass
+        elif self.scale == 1.0:
+            # 1:1 needs no resampling, a plain blit is ~3x cheaper
+            self._scaled_surface_cache.blit(self.game_surface, (0, 0))
+        else:
+            # Scale game surface to cached destination
+            pygame.transform.scale(
+                self.game_surface,
+                self.scaled_size,
+                dest_surface=self._scaled_surface_cache,
+            )
 
         pygame.display.flip()
 
+    def _present_dirty(self, dirty_rects) -> bool:
+        """
+        Scale and present only the changed regions.
+
+        Rects are snapped to the scale's repeat step so each region maps to
+        whole window pixels and matches the full-frame scale.
+
+        Args:
+            dirty_rects: Changed rects in game space
+
+        Returns:
+            bool: False if too much changed and a full flip is needed
+        """
+        changed_area = sum(rect.width * rect.height for rect in dirty_rects)
+        game_area = self.game_width * self.game_height
+        if changed_area > game_area * Display.DIRTY_RECT_THRESHOLD:
+            return False
+
+        game_rect = self.game_surface.get_rect()
+        if self.present_strategy == "scaled":
+            rects = [rect.clip(game_rect) for rect in dirty_rects]
+            rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+            if rects:
+                pygame.display.update(rects)
+            return True
+
+        align = self._dirty_align
+        window_rects = []
+
+        for rect in dirty_rects:
+            rect = rect.clip(game_rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            left = (rect.left // align) * align
+            top = (rect.top // align) * align
+            right = min(-(-rect.right // align) * align, self.game_width)
+            bottom = min(-(-rect.bottom // align) * align, self.game_height)
+            src = pygame.Rect(left, top, right - left, bottom - top)
+
+            dest = pygame.Rect(
+                round(src.x * self.scale),
+                round(src.y * self.scale),
+                round(src.width * self.scale),
+                round(src.height * self.scale),
+            ).clip(self._scaled_surface_cache.get_rect())
+            if dest.width <= 0 or dest.height <= 0:
+                continue
+
+            if self.scale == 1.0:
+                self._scaled_surface_cache.blit(self.game_surface, dest, src)
+            else:
+                pygame.transform.scale(
+                    self.game_surface.subsurface(src),
+                    dest.size,
+                    dest_surface=self._scaled_surface_cache.subsurface(dest),
+                )
+            window_rects.append(dest.move(self.offset_x, self.offset_y))
+
+        if window_rects:
+            pygame.display.update(window_rects)
+        return True
+
     def _refresh_display_cache(self):
         """Rebuild letterbox bars and scaled surface cache."""
+        if self.present_strategy == "scaled":
+            self._scaled_surface_cache = None
+            self._display_dirty = False
+            return
+
         if self._letterbox_bars:
             for surface, position in self._letterbox_bars:
                 self.window.blit(surface, position)
@@ -202,28 +408,72 @@ class DisplayManager:
             fullscreen: Create fullscreen window if True
             silent: Suppress debug logging if True
         """
+        self._set_mode(fullscreen)
+        self.is_fullscreen = fullscreen
+        self._calculate_scale()
+
+        if not silent:
+            if fullscreen:
+                mode = "Fullscreen"
+            else:
+                window_w, window_h = self._target_window_size()
+                mode = f"Windowed ({window_w}x{window_h})"
+            DebugLogger.init_sub(f"Display Mode: {mode}", level=1)
+
+    def _set_mode(self, fullscreen: bool):
+        """
+        Call set_mode for the active strategy and bind the game surface.
+
+        SCALED mode draws straight into the display surface at logical size,
+        so game_surface aliases the window. The other strategies keep an
+        offscreen surface and scale it themselves.
+
+        Args:
+            fullscreen: Create fullscreen window if True
+        """
+        window_size = self._target_window_size()
+
+        if self.present_strategy == "scaled":
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else 0)
+            self.window = pygame.display.set_mode(
+                (self.game_width, self.game_height), flags
+            )
+            if not fullscreen:
+                self._resize_scaled_window(window_size)
+            self.game_surface = self.window
+            return
+
         if fullscreen:
             self.window = pygame.display.set_mode(
                 (0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE
             )
-            self.is_fullscreen = True
         else:
-            window_w, window_h = Display.WINDOW_SIZES.get(
-                self.window_size_preset, (self.game_width, self.game_height)
-            )
             self.window = pygame.display.set_mode(
-                (window_w, window_h), pygame.DOUBLEBUF | pygame.HWSURFACE
+                window_size, pygame.DOUBLEBUF | pygame.HWSURFACE
             )
-            self.is_fullscreen = False
+        self.game_surface = self._offscreen_surface
 
-        self._calculate_scale()
+    def _target_window_size(self) -> tuple:
+        """Window size for the current preset."""
+        return Display.WINDOW_SIZES.get(
+            self.window_size_preset, (self.game_width, self.game_height)
+        )
 
-        if not silent:
-            if fullscreen:
-                mode = "Fullscreen"
-            else:
-                mode = f"Windowed ({window_w}x{window_h})"
-            DebugLogger.init_sub(f"Display Mode: {mode}", level=1)
+    def _resize_scaled_window(self, window_size: tuple):
+        """
+        Grow a SCALED window to the preset size.
+
+        set_mode() sizes SCALED windows by the logical resolution, so the OS
+        window is resized through the SDL2 window handle afterwards.
+        """
+        if window_size == (self.game_width, self.game_height):
+            return
+        try:
+            from pygame._sdl2.video import Window
+
+            Window.from_display_module().size = window_size
+        except (ImportError, AttributeError, pygame.error) as e:
+            DebugLogger.warn(f"SCALED window resize unavailable: {e}")
 
     # ===========================================================
     # Internal: Scaling Calculations
@@ -235,6 +485,16 @@ class DisplayManager:
 
         Updates: scale, offset_x, offset_y, scaled_size, letterbox_bars
         """
+        if self.present_strategy == "scaled":
+            # Renderer letterboxes itself and mouse events arrive in game space
+            self.scale = 1.0
+            self.offset_x = self.offset_y = 0
+            self.scaled_size = (self.game_width, self.game_height)
+            self._dirty_align = 1
+            self._letterbox_bars = None
+            self._display_dirty = True
+            return
+
         window_size = self.window.get_size()
         window_width, window_height = window_size
 
@@ -242,6 +502,9 @@ class DisplayManager:
         scale_x = window_width / self.game_width
         scale_y = window_height / self.game_height
         self.scale = min(scale_x, scale_y)
+        if self.present_strategy == "integer" and self.scale >= 1:
+            # Pixel-perfect: largest whole factor <= fit, letterbox the rest
+            self.scale = float(int(self.scale))
 
         # Compute scaled dimensions
         scaled_width = int(self.game_width * self.scale)
@@ -252,6 +515,9 @@ class DisplayManager:
         self.offset_x = (window_width - scaled_width) // 2
         self.offset_y = (window_height - scaled_height) // 2
 
+        # Dirty-rect alignment step (e.g. 1.5x -> 2 game px = 3 window px)
+        self._dirty_align = Fraction(self.scale).limit_denominator(8).denominator
+
         # Create letterbox bar surfaces
         self._create_letterbox_bars(window_size)
         self._display_dirty = True
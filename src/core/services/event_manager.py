@@ -8,6 +8,8 @@ Enables items, enemies, and player to communicate without direct dependencies.
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Type
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.event_trace import get_tracer
+from src.core.runtime.game_settings import Tracing
 
 
 # ===========================================================
@@ -169,7 +171,19 @@ class EventManager:
         if event_type not in self._subscribers:
             return
 
-        for callback in list(self._subscribers[event_type]):
+        subscribers = self._subscribers[event_type]
+        tracer = get_tracer()
+        if tracer.enabled and Tracing.TRACE_DISPATCH:
+            args = {"subscribers": len(subscribers)}
+            with tracer.span(event_type.__name__, "event", args):
+                self._notify(subscribers, event)
+        else:
+            self._notify(subscribers, event)
+
+    @staticmethod
+    def _notify(subscribers, event):
+        """Call each subscriber, logging (not raising) callback errors."""
+        for callback in list(subscribers):
             try:
                 callback(event)
             except Exception as e:
@@ -208,6 +222,18 @@ class EventManager:
             return len(self._subscribers.get(event_type, []))
         return sum(len(subs) for subs in self._subscribers.values())
 
+    def subscriber_counts(self) -> Dict[str, int]:
+        """
+        Get subscriber counts for every event type.
+
+        Returns:
+            {event class name: number of subscribers}
+        """
+        return {
+            event_type.__name__: len(subs)
+            for event_type, subs in self._subscribers.items()
+        }
+
 
 # ===========================================================
 # Singleton Access
@@ -13,6 +13,9 @@ Provides:
 import pygame
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.event_trace import get_tracer
+from src.core.debug.frame_profiler import get_profiler
+from src.core.debug.profile_capture import get_profile_capture
 from src.core.runtime.game_settings import Debug, Input
 
 
@@ -41,6 +44,9 @@ DEFAULT_KEY_BINDINGS = {
     "system": {
         "toggle_debug": [pygame.K_F3],
         "toggle_fullscreen": [pygame.K_F11],
+        "toggle_profiler": [pygame.K_F8],
+        "profile_capture": [pygame.K_F9],
+        "toggle_trace": [pygame.K_F10],
     },
 }
 
@@ -83,6 +89,10 @@ class InputManager:
         self.display_manager = display_manager
         self.context = "gameplay"
 
+        # Keyboard state provider (replaced for scripted/headless input)
+        self._key_source = pygame.key.get_pressed
+        self._recorder = None
+
         # Build lookup tables
         self._init_lookup_tables()
         self._init_action_registry()
@@ -201,7 +211,7 @@ class InputManager:
 
     def _sync_action_states_on_context_switch(self):
         """Reset edge states and sync held state to current key state."""
-        keys = pygame.key.get_pressed()
+        keys = self._key_source()
 
         for action_name, state in self._actions.items():
             state["pressed"] = False
@@ -277,9 +287,46 @@ class InputManager:
     # Frame Update
     # ===========================================================
 
+    def set_key_source(self, source=None):
+        """
+        Replace the keyboard with another key state provider.
+
+        Args:
+            source: Callable returning an object indexable by key code
+                    (like pygame.key.get_pressed()), or None for the keyboard
+        """
+        self._key_source = source or pygame.key.get_pressed
+
+    def set_recorder(self, recorder=None):
+        """
+        Record the key state of every update().
+
+        Args:
+            recorder: Object with record(keys) (e.g. InputRecorder), or None to stop
+        """
+        self._recorder = recorder
+
+    def key_for_action(self, action: str):
+        """
+        Get the primary key bound to an action in any context.
+
+        Args:
+            action: Action name (e.g. "attack", "confirm")
+
+        Returns:
+            int: pygame key code, or None if unbound
+        """
+        for keys_by_action in self._action_to_keys_cache.values():
+            keys = keys_by_action.get(action)
+            if keys:
+                return keys[0]
+        return None
+
     def update(self):
         """Poll all input sources. Call once per frame."""
-        keys = pygame.key.get_pressed()
+        keys = self._key_source()
+        if self._recorder:
+            self._recorder.record(keys)
 
         # Auto-hide cursor based on input device
         self._update_cursor_visibility(keys)
@@ -488,6 +535,19 @@ class InputManager:
             Debug.HITBOX_VISIBLE = debug_hud.visible
             DebugLogger.action(f"Debug HUD: {'ON' if debug_hud.visible else 'OFF'}")
 
+        elif self._is_system_key_pressed("toggle_profiler", event.key, system_bindings):
+            path = get_profiler().toggle_session()
+            DebugLogger.action(
+                f"Frame profiler: {'OFF, exported ' + path if path else 'ON'}"
+            )
+
+        elif self._is_system_key_pressed("profile_capture", event.key, system_bindings):
+            get_profile_capture().request()
+
+        elif self._is_system_key_pressed("toggle_trace", event.key, system_bindings):
+            tracing = get_tracer().toggle()
+            DebugLogger.action(f"Event trace: {'ON' if tracing else 'OFF'}")
+
     def _is_system_key_pressed(self, action: str, key: int, bindings: dict) -> bool:
         """Check if key matches a system action binding."""
         return key in bindings.get(action, ())
@@ -0,0 +1,325 @@
+"""
+input_sources.py
+----------------
+Key state providers that stand in for the keyboard.
+
+InputManager reads keys through a replaceable source (set_key_source()),
+so headless runs can feed it scripted input tick by tick. Sources return
+a KeyState, which answers `keys[key_code]` like pygame.key.get_pressed().
+
+Script format (JSON or dict):
+    {
+        "loop": 2.0,
+        "steps": [
+            {"at": 0.0, "until": 1.0, "actions": ["move_left", "attack"]},
+            {"at": 1.0, "until": 2.0, "actions": ["move_right", "attack"]}
+        ]
+    }
+
+Times are simulated seconds; "loop" (optional) repeats the script with
+that period. Actions are InputManager action names from any context.
+
+Recordings (InputRecorder -> InputReplay) store which actions were held
+on every fixed update, run-length encoded, together with the mission and
+the per-subsystem RNG seeds (see rng.py) the run started from:
+    {
+        "version": 1,
+        "mission": "3_Boss",
+        "fixed_dt": 0.01667,
+        "seeds": {"boss": 123, ...},
+        "actions": ["attack", "bomb", ...],
+        "ticks": 3600,
+        "runs": [[120, 0], [45, 5], ...]    # [ticks, held-action bitmask]
+    }
+
+Only polled key state is recorded; mouse input and handlers that react
+to KEYDOWN events directly (menus, pause) are not.
+"""
+
+import json
+
+from src.core.runtime.game_settings import Physics
+
+from src.core.debug.debug_logger import DebugLogger
+
+RECORDING_VERSION = 1
+
+# Weave across the screen while firing; Return pulses dismiss level-up
+# and other menus without interrupting the held fire key
+AUTOPILOT_SCRIPT = {
+    "loop": 2.0,
+    "steps": [
+        {"at": 0.0, "until": 1.0, "actions": ["move_left", "attack"]},
+        {"at": 1.0, "until": 2.0, "actions": ["move_right", "attack"]},
+        {"at": 1.9, "until": 2.0, "actions": ["confirm"]},
+    ],
+}
+
+# Scripted bot policies for batch runs (all pulse confirm so level-ups resolve)
+BOT_POLICIES = {
+    "autopilot": AUTOPILOT_SCRIPT,
+    # Hold position and fire
+    "turret": {
+        "loop": 2.0,
+        "steps": [
+            {"at": 0.0, "until": 2.0, "actions": ["attack"]},
+            {"at": 1.9, "until": 2.0, "actions": ["confirm"]},
+        ],
+    },
+    # Box pattern across the lower screen while firing
+    "dodger": {
+        "loop": 3.2,
+        "steps": [
+            {"at": 0.0, "until": 0.8, "actions": ["move_left", "attack"]},
+            {"at": 0.8, "until": 1.6, "actions": ["move_up", "attack"]},
+            {"at": 1.6, "until": 2.4, "actions": ["move_right", "attack"]},
+            {"at": 2.4, "until": 3.2, "actions": ["move_down", "attack"]},
+            {"at": 3.1, "until": 3.2, "actions": ["confirm"]},
+        ],
+    },
+    # Weave without firing (survival baseline)
+    "pacifist": {
+        "loop": 2.0,
+        "steps": [
+            {"at": 0.0, "until": 1.0, "actions": ["move_left"]},
+            {"at": 1.0, "until": 2.0, "actions": ["move_right"]},
+            {"at": 1.9, "until": 2.0, "actions": ["confirm"]},
+        ],
+    },
+}
+
+
+class KeyState:
+    """Pressed-key set indexable like pygame.key.get_pressed()."""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __iter__(self):
+        # One truthy entry per pressed key, so any(keys) works as with pygame
+        return iter([True] * len(self.pressed))
+
+
+class ScriptedInput:
+    """Plays a timed action script as key state, advanced per update tick."""
+
+    def __init__(self, input_manager, script=None):
+        """
+        Compile a script against the current key bindings.
+
+        Args:
+            input_manager: InputManager (for action -> key lookup)
+            script: Script dict, path to a JSON script, or None for autopilot
+        """
+        if script is None:
+            script = AUTOPILOT_SCRIPT
+        elif isinstance(script, str):
+            with open(script, "r", encoding="utf-8") as f:
+                script = json.load(f)
+
+        self.loop = script.get("loop")
+        self.time = 0.0
+        self._steps = []
+        for step in script.get("steps", []):
+            keys = []
+            for action in step.get("actions", []):
+                key = input_manager.key_for_action(action)
+                if key is None:
+                    DebugLogger.warn(f"Input script: unknown action '{action}'")
+                else:
+                    keys.append(key)
+            self._steps.append((step.get("at", 0.0), step.get("until"), keys))
+
+        self._state = self._resolve(0.0)
+
+    def advance(self, dt):
+        """
+        Move the script forward one tick.
+
+        Args:
+            dt: Simulated seconds
+        """
+        self.time += dt
+        self._state = self._resolve(self.time)
+
+    def __call__(self):
+        """Key state for the current tick (InputManager key source)."""
+        return self._state
+
+    def _resolve(self, t):
+        """Build the key state active at script time t."""
+        if self.loop:
+            t %= self.loop
+        pressed = set()
+        for start, until, keys in self._steps:
+            if start <= t and (until is None or t < until):
+                pressed.update(keys)
+        return KeyState(pressed)
+
+
+# ===========================================================
+# Recording and Replay
+# ===========================================================
+
+
+class InputRecorder:
+    """Records held actions once per fixed update (see InputManager.set_recorder)."""
+
+    def __init__(self, input_manager, mission=None, seeds=None):
+        """
+        Start an empty recording.
+
+        Args:
+            input_manager: InputManager whose bindings define the actions
+            mission: Mission ID the recording starts in
+            seeds: {subsystem: seed} applied at the start of the mission
+        """
+        self.mission = mission
+        self.seeds = dict(seeds or {})
+
+        # Every non-system action, each with its own bit
+        bound = {}
+        for context, actions in input_manager.key_bindings.items():
+            if context == "system":
+                continue
+            for action, keys in actions.items():
+                bound.setdefault(action, set()).update(keys)
+        self.actions = sorted(bound)
+        self._bits = [(1 << i, tuple(bound[a])) for i, a in enumerate(self.actions)]
+
+        self.ticks = 0
+        self._runs = []
+
+    def record(self, keys):
+        """
+        Append one tick of key state.
+
+        Args:
+            keys: Key state indexable by key code
+        """
+        mask = 0
+        for bit, codes in self._bits:
+            for code in codes:
+                if keys[code]:
+                    mask |= bit
+                    break
+
+        self.ticks += 1
+        runs = self._runs
+        if runs and runs[-1][1] == mask:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, mask])
+
+    def save(self, path):
+        """
+        Write the recording as JSON.
+
+        Args:
+            path: Output file path
+        """
+        data = {
+            "version": RECORDING_VERSION,
+            "mission": self.mission,
+            "fixed_dt": Physics.FIXED_DT,
+            "seeds": self.seeds,
+            "actions": self.actions,
+            "ticks": self.ticks,
+            "runs": self._runs,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        DebugLogger.system(
+            f"Saved input recording: {self.ticks} ticks, {len(self._runs)} runs -> {path}"
+        )
+
+
+class InputReplay:
+    """Plays an InputRecorder file back as key state, one tick per advance()."""
+
+    def __init__(self, input_manager, path):
+        """
+        Load a recording and map its actions to the current key bindings.
+
+        Args:
+            input_manager: InputManager (for action -> key lookup)
+            path: Recording file from InputRecorder.save()
+
+        Raises:
+            ValueError: Unsupported recording version or timestep
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported input recording version: {data.get('version')}"
+            )
+        if abs(data.get("fixed_dt", 0.0) - Physics.FIXED_DT) > 1e-9:
+            raise ValueError(
+                f"Recording timestep {data.get('fixed_dt')} != Physics.FIXED_DT "
+                f"{Physics.FIXED_DT}"
+            )
+
+        self.mission = data.get("mission")
+        self.seeds = data.get("seeds", {})
+        self.ticks = data.get("ticks", 0)
+        self.tick = 0
+
+        keys = []
+        for action in data["actions"]:
+            key = input_manager.key_for_action(action)
+            if key is None:
+                DebugLogger.warn(f"Input replay: unknown action '{action}'")
+            keys.append(key)
+        self._keys = keys
+
+        self._runs = data["runs"]
+        self._run_idx = 0
+        self._run_left = self._runs[0][0] if self._runs else 0
+        self._states = {}
+        self._state = KeyState()
+
+    @property
+    def finished(self) -> bool:
+        """True once every recorded tick has been played."""
+        return self.tick >= self.ticks
+
+    def advance(self, dt):
+        """
+        Move to the next recorded tick.
+
+        Args:
+            dt: Simulated seconds (always one fixed step)
+        """
+        if self._run_left <= 0:
+            self._run_idx += 1
+            if self._run_idx >= len(self._runs):
+                self._state = KeyState()
+                return
+            self._run_left = self._runs[self._run_idx][0]
+
+        self._run_left -= 1
+        self.tick += 1
+        self._state = self._state_for(self._runs[self._run_idx][1])
+
+    def __call__(self):
+        """Key state for the current tick (InputManager key source)."""
+        return self._state
+
+    def _state_for(self, mask):
+        """KeyState for a held-action bitmask (cached per mask)."""
+        state = self._states.get(mask)
+        if state is None:
+            pressed = [
+                key
+                for i, key in enumerate(self._keys)
+                if key is not None and mask & (1 << i)
+            ]
+            state = self._states[mask] = KeyState(pressed)
+        return state
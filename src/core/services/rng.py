@@ -0,0 +1,120 @@
+"""
+rng.py
+------
+Per-subsystem random number generators.
+
+Each subsystem draws from its own random.Random instead of the global
+random module, so a replay can restore every stream exactly and purely
+visual randomness (particles, audio variation) cannot shift gameplay
+randomness (item drops, boss attack choice) when it changes.
+
+Usage:
+    from src.core.services.rng import get_rng
+    _rng = get_rng("items")
+
+    if _rng.random() < drop_chance:
+        ...
+
+Seeding reseeds the existing instances in place, so module-level
+references taken at import stay valid.
+"""
+
+import random
+from contextlib import contextmanager
+
+from src.core.debug.debug_logger import DebugLogger
+
+# Known streams (get_rng() also accepts new names)
+SUBSYSTEMS = (
+    "spawns",  # Randomized wave positions
+    "enemies",  # Enemy movement choices
+    "boss",  # Boss wander and attack selection
+    "items",  # Drop rolls and pickup scatter
+    "upgrades",  # Level-up choices
+    "effects",  # Gameplay effects (nuke pulse)
+    "particles",  # Visual only
+    "audio",  # Sound variation
+)
+
+_STREAMS = {}
+_SEEDS = {}
+
+
+def get_rng(name: str) -> random.Random:
+    """
+    Get the random generator for a subsystem.
+
+    Args:
+        name: Subsystem name (see SUBSYSTEMS)
+
+    Returns:
+        random.Random: Shared instance for that subsystem
+    """
+    rng = _STREAMS.get(name)
+    if rng is None:
+        rng = _STREAMS[name] = random.Random()
+    return rng
+
+
+def derive_seeds(master: int) -> dict:
+    """
+    Derive one seed per subsystem from a master seed.
+
+    Args:
+        master: Master seed
+
+    Returns:
+        dict: {subsystem: seed}
+    """
+    names = sorted(set(SUBSYSTEMS) | set(_STREAMS))
+    return {name: random.Random(f"{master}/{name}").getrandbits(32) for name in names}
+
+
+def set_seeds(seeds: dict):
+    """
+    Reseed subsystem generators.
+
+    Args:
+        seeds: {subsystem: seed}; subsystems not listed keep their state
+    """
+    for name, seed in seeds.items():
+        get_rng(name).seed(seed)
+        _SEEDS[name] = seed
+    DebugLogger.state(f"Seeded {len(seeds)} RNG streams", category="system")
+
+
+def seed_all(master: int) -> dict:
+    """
+    Reseed every subsystem from a master seed.
+
+    Args:
+        master: Master seed
+
+    Returns:
+        dict: {subsystem: seed} as applied (store it to replay the run)
+    """
+    seeds = derive_seeds(master)
+    set_seeds(seeds)
+    return seeds
+
+
+def get_seeds() -> dict:
+    """Seeds applied since startup, by subsystem."""
+    return dict(_SEEDS)
+
+
+@contextmanager
+def preserved_state():
+    """
+    Restore every stream's state on exit.
+
+    For work that must not consume gameplay randomness, such as probe
+    instances built once per process, whose draws would otherwise make
+    a run depend on what ran before it in the same process.
+    """
+    saved = {name: rng.getstate() for name, rng in _STREAMS.items()}
+    try:
+        yield
+    finally:
+        for name, state in saved.items():
+            _STREAMS[name].setstate(state)
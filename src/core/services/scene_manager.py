@@ -4,10 +4,18 @@ scene_manager.py
 Simplified scene coordinator - direct class registration.
 """
 
+import os
+from collections import OrderedDict
+
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.event_trace import get_tracer
+from src.core.runtime.game_settings import Loading
 from src.scenes.scene_state import SceneState
 from src.core.services.service_locator import ServiceLocator
 from src.core.runtime.session_stats import get_session_stats
+from src.core.services.asset_loader import get_asset_loader
+from src.core.services.config_manager import DATA_ROOT
+from src.core.services.scene_preloader import ScenePreloader
 
 from src.systems.entity_management.entity_registry import EntityRegistry
 from src.systems.level.level_registry import LevelRegistry
@@ -19,6 +27,9 @@ from src.scenes.main_menu_scene import MainMenuScene
 from src.scenes.mission_select_scene import MissionSelectScene
 from src.scenes.game_scene import GameScene
 from src.scenes.settings_scene import SettingsScene
+from src.scenes.transitions.transitions import InstantTransition
+
+UI_CONFIG_DIR = os.path.join(DATA_ROOT, "ui")
 
 
 class SceneManager:
@@ -84,24 +95,67 @@ class SceneManager:
         self._transition_new_scene = None
         self._transition_new_name = None
         self._fade_in_overlay = None
+        self._preloader = None
+        self._transition_reuse_data = None  # scene_data for a cached scene
+
+        # Cacheable scene instances (LRU, name -> scene)
+        self._scene_cache = OrderedDict()
 
         DebugLogger.init_sub(f"Registered scenes: {list(self.scene_classes.keys())}")
 
+        self._preload_startup_images()
+
         # Start with main menu
         self.set_scene("MainMenu")
 
+    def _preload_startup_images(self):
+        """Decode menu backgrounds and UI images in one threaded batch."""
+        loader = get_asset_loader()
+        paths = []
+        for scene_class in self.scene_classes.values():
+            paths += loader.collect_image_paths(
+                getattr(scene_class, "BACKGROUND_CONFIG", {})
+            )
+
+        for directory, _, files in os.walk(UI_CONFIG_DIR):
+            for name in sorted(files):
+                if name.endswith((".yaml", ".yml")):
+                    paths += loader.scan_image_paths(os.path.join(directory, name))
+
+        count = loader.preload_images(paths)
+        DebugLogger.init_sub(f"Preloaded {count} menu/UI images")
+
     # ===========================================================
     # Scene Control
     # ===========================================================
-    def set_scene(self, name: str, transition=None, **scene_data):
+    def set_scene(self, name: str, transition=None, preload=False, **scene_data):
         """
         Switch to another scene.
 
         Args:
             name: Scene name ("MainMenu", "Game", etc.)
             transition: ITransition instance (None = instant)
+            preload: Build the scene over several frames while the
+                transition plays; the switch waits until loading is done
             **scene_data: Data to pass to on_load() hook
         """
+        tracer = get_tracer()
+        if not tracer.enabled:
+            self._set_scene(name, transition, preload, scene_data)
+            return
+
+        args = {
+            "from": self._active_name,
+            "to": name,
+            "cached": name in self._scene_cache,
+            "preload": preload,
+            "transition": type(transition).__name__ if transition else None,
+        }
+        with tracer.span(f"set_scene {name}", "scene", args):
+            self._set_scene(name, transition, preload, scene_data)
+
+    def _set_scene(self, name, transition, preload, scene_data):
+        """Body of set_scene() (see there)."""
         # Block new transitions while one is active
         if self._active_transition:
             return
@@ -114,8 +168,36 @@ class SceneManager:
         prev_name = self._active_name or "None"
         DebugLogger.system(f"Transitioning [{prev_name}] → [{name}]")
 
-        # 1. Create new scene
         scene_class = self.scene_classes[name]
+
+        # Cached scenes are reset in place once the old scene has exited
+        cached = self._scene_cache.get(name)
+        if cached is not None:
+            self._scene_cache.move_to_end(name)
+            DebugLogger.state(f"Reusing cached {name}")
+            self._switch_to_cached(name, cached, transition, scene_data)
+            return
+
+        # Preload: the transition holds until the scene has finished loading
+        if preload:
+            self._preloader = ScenePreloader(
+                name, scene_class, self.services, scene_data
+            )
+            self.ui_manager.register_binding("scene_loader", self._preloader)
+
+            transition = transition or InstantTransition()
+            transition.ready = False
+            self._active_transition = transition
+            self._transition_old_scene = self._active_scene
+            self._transition_old_name = self._active_name
+            self._transition_new_scene = None
+            self._transition_new_name = name
+            DebugLogger.state(
+                f"Preloading {name} behind {transition.__class__.__name__}"
+            )
+            return
+
+        # 1. Create new scene
         new_scene = scene_class(self.services)
 
         # 2. Load new scene
@@ -139,22 +221,86 @@ class SceneManager:
             DebugLogger.state(f"Exiting {self._active_name}")
             self._active_scene.state = SceneState.EXITING
             self._active_scene.on_exit()
+            self._dispose_if_uncached(self._active_scene)
 
             # Clear scene-local entities
             self.services.clear_entities()
 
-        # 5. Activate new scene
-        self._active_scene = new_scene
+        # 5. Activate and enter new scene
+        self._activate(name, new_scene)
+
+    def _switch_to_cached(self, name, scene, transition, scene_data):
+        """
+        Switch to a cached scene instance, resetting it via on_reuse().
+
+        The reset runs after the old scene exits, since the cached scene
+        may be the one currently active (restart).
+
+        Args:
+            name: Scene name
+            scene: Cached scene instance
+            transition: ITransition instance (None = instant)
+            scene_data: Data for on_reuse()
+        """
+        if transition is not None:
+            self._active_transition = transition
+            self._transition_old_scene = self._active_scene
+            self._transition_old_name = self._active_name
+            self._transition_new_scene = scene
+            self._transition_new_name = name
+            self._transition_reuse_data = scene_data
+            DebugLogger.state(f"Starting transition: {transition.__class__.__name__}")
+            return
+
+        if self._active_scene:
+            DebugLogger.state(f"Exiting {self._active_name}")
+            self._active_scene.state = SceneState.EXITING
+            self._active_scene.on_exit()
+            self._dispose_if_uncached(self._active_scene)
+            self.services.clear_entities()
+
+        scene.state = SceneState.LOADING
+        scene.on_reuse(**scene_data)
+        self._activate(name, scene)
+
+    def _activate(self, name, scene):
+        """
+        Make a loaded scene active, enter it, and cache it if cacheable.
+
+        Args:
+            name: Scene name
+            scene: Loaded scene instance
+        """
+        self._active_scene = scene
         self._active_name = name
-        new_scene.state = SceneState.ACTIVE
+        scene.state = SceneState.ACTIVE
         DebugLogger.section(f"Active Scene: {name}")
+        get_tracer().instant("scene.active", "scene", {"scene": name})
 
-        # 6. Enter scene
         DebugLogger.state(f"Entering {name}")
-        new_scene.on_enter()
+        scene.on_enter()
 
-        # 7. Switch input context
-        self.input_manager.set_context(new_scene.input_context)
+        if scene.cacheable:
+            self._scene_cache[name] = scene
+            self._scene_cache.move_to_end(name)
+            while len(self._scene_cache) > Loading.SCENE_CACHE_SIZE:
+                evicted, evicted_scene = self._scene_cache.popitem(last=False)
+                DebugLogger.state(f"Evicted cached scene {evicted}")
+                # The active scene is disposed when it exits instead
+                if evicted_scene is not scene:
+                    evicted_scene.on_dispose()
+
+        self.input_manager.set_context(scene.input_context)
+
+    def _dispose_if_uncached(self, scene):
+        """
+        Dispose an exited scene unless the cache keeps it for re-entry.
+
+        Args:
+            scene: Scene that just ran on_exit()
+        """
+        if scene not in self._scene_cache.values():
+            scene.on_dispose()
 
     def pause_active_scene(self):
         """Pause the currently active scene."""
@@ -237,6 +383,21 @@ class SceneManager:
         else:
             self.input_manager.set_context(self._active_scene.input_context)
 
+    @property
+    def load_progress(self) -> float:
+        """Preload progress of the incoming scene (1.0 when not loading)."""
+        return self._preloader.progress if self._preloader else 1.0
+
+    @property
+    def active_scene(self):
+        """Currently active scene instance (None before the first set_scene)."""
+        return self._active_scene
+
+    @property
+    def active_name(self) -> str:
+        """Name of the currently active scene."""
+        return self._active_name
+
     # ===========================================================
     # Event, Update, Draw Delegation
     # ===========================================================
@@ -250,11 +411,20 @@ class SceneManager:
         """Update active scene or transition."""
         # Handle active transition
         if self._active_transition:
+            if self._preloader:
+                self._active_transition.ready = self._preloader.update()
+
             transition_complete = self._active_transition.update(dt)
 
             if transition_complete:
                 DebugLogger.state("Transition complete")
 
+                # Take the finished scene from the preloader
+                if self._preloader:
+                    self._transition_new_scene = self._preloader.scene
+                    self.ui_manager.unregister_binding("scene_loader")
+                    self._preloader = None
+
                 # Get fade-in overlay before clearing transition
                 if hasattr(self._active_transition, "create_fade_in_overlay"):
                     self._fade_in_overlay = (
@@ -266,14 +436,15 @@ class SceneManager:
                     DebugLogger.state(f"Exiting {self._transition_old_name}")
                     self._transition_old_scene.state = SceneState.EXITING
                     self._transition_old_scene.on_exit()
+                    self._dispose_if_uncached(self._transition_old_scene)
                     self.services.clear_entities()
 
-                # Activate new scene
-                self._active_scene = self._transition_new_scene
-                self._active_name = self._transition_new_name
-                self._active_scene.state = SceneState.ACTIVE
-                DebugLogger.section(f"Active Scene: {self._active_name}")
-                self._active_scene.on_enter()
+                # Reset a cached scene now that the old one has exited
+                new_scene = self._transition_new_scene
+                new_name = self._transition_new_name
+                if self._transition_reuse_data is not None:
+                    new_scene.state = SceneState.LOADING
+                    new_scene.on_reuse(**self._transition_reuse_data)
 
                 # Cleanup
                 self._active_transition = None
@@ -281,9 +452,10 @@ class SceneManager:
                 self._transition_old_name = None
                 self._transition_new_scene = None
                 self._transition_new_name = None
+                self._transition_reuse_data = None
 
-                # Switch input context
-                self.input_manager.set_context(self._active_scene.input_context)
+                # Activate new scene
+                self._activate(new_name, new_scene)
             return
 
         # Update fade-in overlay (add AFTER the transition block, before pause handling)
@@ -322,6 +494,13 @@ class SceneManager:
 
     def draw(self, draw_manager):
         """Render active scene or transition."""
+        # Static scenes opt into dirty-rect presentation (never mid-transition)
+        draw_manager.dirty_tracking = bool(
+            self._active_scene
+            and self._active_scene.dirty_rect_present
+            and not self._active_transition
+        )
+
         # Render transition if active
         if self._active_transition:
             self._active_transition.draw(
@@ -0,0 +1,110 @@
+"""
+scene_preloader.py
+------------------
+Builds the next scene a few steps per frame while a transition plays.
+
+Loading runs on the main thread (scene construction and surface conversion
+need the display) but is split into steps under a per-frame time budget,
+so the fade keeps animating instead of freezing on one long frame. Pure
+decoding inside a step can still run on the AssetLoader thread pool.
+
+Steps:
+    1. Construct the scene
+    2. on_load(**scene_data)
+    3. Each step from scene.preload_steps()
+
+A step returning False is not finished (e.g. waiting on worker threads)
+and is retried next frame.
+"""
+
+import time
+from collections import deque
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Loading
+from src.scenes.scene_state import SceneState
+
+
+class ScenePreloader:
+    """Incremental scene loader with a bindable progress value."""
+
+    def __init__(self, name, scene_class, services, scene_data):
+        """
+        Queue the loading steps for a scene.
+
+        Args:
+            name: Scene name (for logging)
+            scene_class: Scene class to construct
+            services: ServiceLocator passed to the scene
+            scene_data: Keyword arguments for on_load()
+        """
+        self.name = name
+        self.scene = None
+        self.progress = 0.0
+        self.done = False
+
+        self._scene_class = scene_class
+        self._services = services
+        self._scene_data = scene_data
+        self._steps = deque([self._construct, self._load])
+        self._total = len(self._steps)
+        self._completed = 0
+        self._elapsed_ms = 0.0
+
+    def update(self, budget_ms=Loading.FRAME_BUDGET_MS):
+        """
+        Run loading steps until the frame budget is spent.
+
+        At least one step runs per call, so a step longer than the budget
+        still makes progress.
+
+        Args:
+            budget_ms: Milliseconds of loading allowed this frame
+
+        Returns:
+            bool: True once every step has finished
+        """
+        if self.done:
+            return True
+
+        start = time.perf_counter()
+        while self._steps:
+            if self._steps[0]() is False:
+                break
+            self._steps.popleft()
+            self._completed += 1
+            if (time.perf_counter() - start) * 1000.0 >= budget_ms:
+                break
+
+        self._elapsed_ms += (time.perf_counter() - start) * 1000.0
+        self.progress = self._completed / self._total
+        self.done = not self._steps
+
+        if self.done:
+            DebugLogger.state(
+                f"Preloaded {self.name} in {self._total} steps "
+                f"({self._elapsed_ms:.0f}ms of frame time)"
+            )
+        return self.done
+
+    def finish(self):
+        """Run all remaining steps now (blocking)."""
+        while not self.update(budget_ms=float("inf")):
+            time.sleep(0.001)
+
+    # ===========================================================
+    # Steps
+    # ===========================================================
+
+    def _construct(self):
+        """Create the scene instance."""
+        self.scene = self._scene_class(self._services)
+        self.scene.state = SceneState.LOADING
+        DebugLogger.state(f"Loading {self.name}")
+
+    def _load(self):
+        """Run on_load() and queue the scene's own preload steps."""
+        self.scene.on_load(**self._scene_data)
+        steps = self.scene.preload_steps()
+        self._steps.extend(steps)
+        self._total += len(steps)
@@ -27,6 +27,7 @@ class SettingsManager:
             "vsync": True,
             "fullscreen": False,
             "resolution": [1280, 720],
+            "present_strategy": "auto",
         },
         "audio": {
             "master_volume": 100,
@@ -35,6 +36,11 @@ class SettingsManager:
             "muted": False,
         },
         "controls": {"mouse_sensitivity": 1.0},
+        "debug": {
+            "capture_mode": "both",
+            "capture_frames": 120,
+            "auto_capture_ms": 0,
+        },
     }
 
     def __init__(self, settings_file=None):
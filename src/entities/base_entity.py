@@ -22,14 +22,15 @@ Rendering Modes
    Entity(x, y, shape_data={...})
 """
 
-import os
 import pygame
 from typing import Optional
 
 from src.core.debug.debug_logger import DebugLogger
 from src.core.runtime.game_settings import Layers, Bounds, Display
+from src.core.services.asset_bundle import asset_exists
 from src.entities.entity_state import LifecycleState
 from src.entities.entity_types import EntityCategory, CollisionTags
+from src.graphics.image_formats import load_image
 
 
 class BaseEntity:
@@ -288,6 +289,14 @@ class BaseEntity:
             self._anim_manager.stop()
         self.anim_context = {}
 
+        # Scratch state animation effects keep on the entity (shake origin,
+        # death particle timer); left over, the next death shakes around the
+        # position of the previous one
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            for attr in ("_shake_origin", "_death_emit_timer"):
+                instance_dict.pop(attr, None)
+
         self.sync_rect()
 
     # ===================================================================
@@ -572,24 +581,17 @@ class BaseEntity:
         if image_path is None:
             return None
 
-        if not os.path.exists(image_path):
+        if not asset_exists(image_path):
             DebugLogger.warn(f"Image not found: {image_path}")
             return None
 
         try:
-            img = pygame.image.load(image_path).convert_alpha()
-
-            if isinstance(scale, (int, float)):
-                new_size = (int(img.get_width() * scale), int(img.get_height() * scale))
-            elif isinstance(scale, (list, tuple)) and len(scale) == 2:
-                new_size = (
-                    int(img.get_width() * scale[0]),
-                    int(img.get_height() * scale[1]),
-                )
-            else:
-                return img
+            if not isinstance(scale, (int, float)) and not (
+                isinstance(scale, (list, tuple)) and len(scale) == 2
+            ):
+                scale = None
 
-            return pygame.transform.scale(img, new_size)
+            return load_image(image_path, scale=scale, sprite=True)
 
         except pygame.error as e:
             DebugLogger.fail(f"Pygame error loading {image_path}: {e}")
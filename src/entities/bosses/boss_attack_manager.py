@@ -4,10 +4,13 @@ boss_attack_manager.py
 Boss attack state machine.
 """
 
-import random
 import pygame
 
 from src.entities.bosses.boss_attacks import ATTACK_REGISTRY
+from src.core.debug.event_trace import get_tracer
+from src.core.services.rng import get_rng
+
+_rng = get_rng("boss")
 
 
 class BossAttackManager:
@@ -40,6 +43,7 @@ class BossAttackManager:
         elif self.state == "ATTACKING":
             self.current_attack.update(dt)
             if not self.current_attack.is_active:
+                self._trace_state("IDLE", type(self.current_attack).__name__)
                 self.state = "IDLE"
                 self.timer = 0.0
                 self.current_attack = None
@@ -57,12 +61,25 @@ class BossAttackManager:
                 )
 
     def _start_random_attack(self):
-        attack_name = random.choice(list(self.attacks.keys()))
+        attack_name = _rng.choice(list(self.attacks.keys()))
         self.current_attack = self.attacks[attack_name]
         self.current_attack.start()
+        self._trace_state("ATTACKING", attack_name)
         self.state = "ATTACKING"
         self.timer = 0.0
 
+    def _trace_state(self, new_state, attack):
+        """Record a state machine transition in the event trace."""
+        tracer = get_tracer()
+        if tracer.enabled:
+            args = {
+                "from": self.state,
+                "to": new_state,
+                "attack": attack,
+                "hp_ratio": round(self.boss.health / self.boss.max_health, 3),
+            }
+            tracer.instant("boss.state", "boss", args)
+
     def get_movement_override(self):
         if self.current_attack and self.current_attack.is_active:
             return self.current_attack.get_movement_override()
@@ -5,7 +5,6 @@ Base class and concrete attack implementations.
 """
 
 import math
-import random
 import pygame
 
 from src.core.services.event_manager import get_events, ScreenShakeEvent
@@ -14,6 +13,9 @@ from src.core.runtime.game_settings import Display, Layers
 from src.graphics.particles.particle_manager import DebrisEmitter
 from src.entities.environments.hazard_mine import TimedMine
 from src.audio.sound_manager import get_sound_manager
+from src.core.services.rng import get_rng
+
+_rng = get_rng("boss")
 
 # =====================
 # ATTACK REGISTRY
@@ -551,7 +553,7 @@ class MineCharge(BossAttack):
     def _on_start(self):
         self.phase = "warn"
         self.phase_timer = 0.0
-        self.charge_direction = random.choice([-1, 1])
+        self.charge_direction = _rng.choice([-1, 1])
         self.boss.entrance_complete = True
 
         get_sound_manager().play_bfx("boss_charge_load")
@@ -7,7 +7,6 @@ Each part has independent health and can be destroyed.
 
 import pygame
 import math
-import random
 
 from src.audio.sound_manager import get_sound_manager
 from src.entities.enemies.base_enemy import BaseEnemy
@@ -28,7 +27,12 @@ from src.graphics.particles.particle_manager import DebrisEmitter, ParticleEmitt
 
 from src.core.services.config_manager import load_config
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.event_trace import get_tracer
 from src.core.runtime.game_settings import Debug
+from src.core.services.rng import get_rng
+
+_rng = get_rng("boss")
+_fx_rng = get_rng("particles")
 
 
 class EnemyBoss(BaseEnemy):
@@ -195,7 +199,7 @@ class EnemyBoss(BaseEnemy):
         # Noise-based hover settings
         self.wander_radius = 100
         self.noise_time = 0.0
-        self.noise_seed = random.randint(0, 10000)
+        self.noise_seed = _rng.randint(0, 10000)
         self.hover_velocity = pygame.Vector2(0, 0)
         self.bob_time = 0.0
 
@@ -335,6 +339,7 @@ class EnemyBoss(BaseEnemy):
     def _on_part_destroyed(self, part_name: str):
         """Called when a part is destroyed."""
         DebugLogger.state(f"Part '{part_name}' destroyed.", category="enemy")
+        get_tracer().instant("boss.part_destroyed", "boss", {"part": part_name})
 
     # ===================================================================
     # Update Logic
@@ -357,6 +362,7 @@ class EnemyBoss(BaseEnemy):
         self._death_timer = 0.0
         self._explosion_timer = 0.0
         self._shake_origin = (self.pos.x, self.pos.y)
+        get_tracer().instant("boss.phase", "boss", {"phase": "shake", "source": source})
 
         # Stop boss attacks
         self.attack_manager.state = "IDLE"
@@ -392,6 +398,7 @@ class EnemyBoss(BaseEnemy):
             if self._death_timer >= 2.0:
                 self._death_phase = "explode"
                 self._death_timer = 0.0
+                get_tracer().instant("boss.phase", "boss", {"phase": "explode"})
                 self._spawn_final_explosion()
                 get_sound_manager().play_bfx("boss_final_explosion")
 
@@ -399,6 +406,7 @@ class EnemyBoss(BaseEnemy):
             # Boss already invisible, wait for explosion to finish
             if self._death_timer >= 1.5:
                 self.death_state = LifecycleState.DEAD
+                get_tracer().instant("boss.phase", "boss", {"phase": "dead"})
                 get_events().dispatch(SpawnPauseEvent(paused=False))
                 get_events().dispatch(BossDeathEvent(boss_type="boss"))
 
@@ -419,8 +427,8 @@ class EnemyBoss(BaseEnemy):
     def _spawn_random_explosion(self):
         """Spawn explosion at random point on boss."""
         bounds = self.get_full_bounds()
-        x = random.randint(bounds.left + 20, bounds.right - 20)
-        y = random.randint(bounds.top + 20, bounds.bottom - 20)
+        x = _fx_rng.randint(bounds.left + 20, bounds.right - 20)
+        y = _fx_rng.randint(bounds.top + 20, bounds.bottom - 20)
         ParticleEmitter.burst("boss_explosion", (x, y), count=15)
 
         # Screen shake on each explosion
@@ -435,8 +443,8 @@ class EnemyBoss(BaseEnemy):
 
         # Clustered bursts around center (small random offset)
         for _ in range(6):
-            offset_x = random.randint(-40, 40)
-            offset_y = random.randint(-40, 40)
+            offset_x = _fx_rng.randint(-40, 40)
+            offset_y = _fx_rng.randint(-40, 40)
             ParticleEmitter.burst(
                 "boss_explosion_final",
                 (center_x + offset_x, center_y + offset_y),
@@ -11,7 +11,6 @@ Responsibilities
 """
 
 import pygame
-import random
 
 from src.core.runtime.game_settings import Display, Layers
 from src.core.debug.debug_logger import DebugLogger
@@ -25,6 +24,9 @@ from src.graphics.particles.particle_manager import ParticleEmitter
 from src.systems.entity_management.entity_registry import EntityRegistry
 
 from src.core.services.event_manager import get_events, EnemyDiedEvent
+from src.core.services.rng import get_rng
+
+_rng = get_rng("enemies")
 
 
 class BaseEnemy(BaseEntity):
@@ -344,7 +346,7 @@ class BaseEnemy(BaseEntity):
         options = self._DIRECTION_MAP.get(edge, {}).get(lookup_key, [(0, 1)])
 
         # Choose and return
-        chosen = random.choice(options)
+        chosen = _rng.choice(options)
 
         return pygame.Vector2(chosen)
 
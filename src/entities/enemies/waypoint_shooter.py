@@ -20,6 +20,7 @@ from src.entities.enemies.base_enemy import BaseEnemy
 from src.entities.entity_types import EntityCategory
 
 from src.core.debug.debug_logger import DebugLogger
+from src.graphics.image_formats import load_image
 
 
 class WaypointShooter(BaseEnemy):
@@ -97,13 +98,9 @@ class WaypointShooter(BaseEnemy):
         # Load and scale bullet image
         bullet_image_path = defaults.get("bullet_image", "assets/images/null.png")
         bullet_scale = defaults.get("bullet_scale", 0.3)
-        bullet_img = pygame.image.load(bullet_image_path).convert_alpha()
-        original_size = bullet_img.get_size()
-        new_size = (
-            int(original_size[0] * bullet_scale),
-            int(original_size[1] * bullet_scale),
+        self.bullet_image = load_image(
+            bullet_image_path, scale=bullet_scale, sprite=True
         )
-        self.bullet_image = pygame.transform.scale(bullet_img, new_size)
 
         image_path = defaults.get("image", "assets/images/null.png")
         hitbox_config = defaults.get("hitbox", {})
@@ -114,9 +111,7 @@ class WaypointShooter(BaseEnemy):
         # Load sprite
         # ============================
         # Calculate scale from target size
-        img = pygame.image.load(image_path).convert_alpha()
-        w, h = img.get_size()
-        img = pygame.transform.scale(img, (int(w * scale), int(h * scale)))
+        img = load_image(image_path, scale=scale, sprite=True)
 
         super().__init__(
             x,
@@ -12,7 +12,6 @@ Responsibilities
 """
 
 import pygame
-import random
 import math
 
 from src.core.runtime.game_settings import Display, Layers
@@ -28,6 +27,10 @@ from src.entities.player.player_effects import apply_item_effects
 from src.systems.entity_management.entity_registry import EntityRegistry
 
 from src.graphics.particles.particle_manager import ParticleEmitter
+from src.core.services.rng import get_rng
+
+_rng = get_rng("items")
+_fx_rng = get_rng("particles")
 
 
 class BaseItem(BaseEntity):
@@ -133,7 +136,7 @@ class BaseItem(BaseEntity):
         self.bounce_enabled = bounce
         if bounce:
             # Random initial direction
-            angle = random.uniform(0, 360)
+            angle = _rng.uniform(0, 360)
             self.velocity = pygame.Vector2(
                 speed * math.cos(math.radians(angle)),
                 speed * math.sin(math.radians(angle)),
@@ -218,8 +221,8 @@ class BaseItem(BaseEntity):
                 count = self.item_data.get("particle_count", 12)
                 # Sparkle effect: spawn particles at random offsets around player
                 for _ in range(count):
-                    offset_x = random.uniform(-24, 24)
-                    offset_y = random.uniform(-24, 24)
+                    offset_x = _fx_rng.uniform(-24, 24)
+                    offset_y = _fx_rng.uniform(-24, 24)
                     pos = (other.pos.x + offset_x, other.pos.y + offset_y)
                     ParticleEmitter.burst(particle_preset, pos, count=1)
 
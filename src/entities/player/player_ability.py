@@ -7,7 +7,6 @@ Handles player combat-related systems:
 """
 
 import math
-import random
 
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.bullets.bullet_straight import StraightBullet
@@ -17,6 +16,9 @@ from src.graphics.particles.particle_manager import (
     ParticleEmitter,
     Particle,
 )
+from src.core.services.rng import get_rng
+
+_rng = get_rng("particles")
 
 
 # Charge color gradient: blue -> cyan -> yellow -> white
@@ -178,14 +180,14 @@ def _emit_charge_particles_inward(player, dt: float):
             # OUTWARD burst - radiating "ready" effect
             count = 4
             for _ in range(count):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(120, 200)
+                angle = _rng.uniform(0, 2 * math.pi)
+                speed = _rng.uniform(120, 200)
 
                 # Spawn at center, move outward
                 vx = math.cos(angle) * speed
                 vy = math.sin(angle) * speed
-                size = random.randint(4, 8)
-                lifetime = random.uniform(0.3, 0.5)
+                size = _rng.randint(4, 8)
+                lifetime = _rng.uniform(0.3, 0.5)
 
                 particle = Particle(
                     x=cx,
@@ -203,17 +205,17 @@ def _emit_charge_particles_inward(player, dt: float):
             # INWARD gathering - charging effect
             count = 2 + int(charge_ratio * 3)
             for _ in range(count):
-                angle = random.uniform(0, 2 * math.pi)
-                spawn_dist = random.uniform(40, 70)
+                angle = _rng.uniform(0, 2 * math.pi)
+                spawn_dist = _rng.uniform(40, 70)
 
                 spawn_x = cx + math.cos(angle) * spawn_dist
                 spawn_y = cy + math.sin(angle) * spawn_dist
 
-                speed = random.uniform(150, 250)
+                speed = _rng.uniform(150, 250)
                 vx = -math.cos(angle) * speed
                 vy = -math.sin(angle) * speed
 
-                size = random.randint(3, 6 + int(charge_ratio * 3))
+                size = _rng.randint(3, 6 + int(charge_ratio * 3))
                 lifetime = spawn_dist / speed
 
                 particle = Particle(
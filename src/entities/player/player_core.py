@@ -5,13 +5,12 @@ Defines the minimal Player entity core used to coordinate all components.
 """
 
 import pygame
-import random
-import os
 
 from src.core.runtime.game_settings import Display, Layers
 from src.core.runtime.session_stats import get_session_stats
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.asset_bundle import asset_exists
 from src.core.services.config_manager import load_config
 from src.core.services.event_manager import get_events, EnemyDiedEvent
 
@@ -26,7 +25,11 @@ from src.entities.player import player_ability
 from src.entities.player.player_logic import damage_collision
 from src.entities.player.player_state import PlayerEffectState
 
+from src.graphics.image_formats import load_image
 from src.graphics.particles.particle_manager import ParticleEmitter
+from src.core.services.rng import get_rng
+
+_rng = get_rng("particles")
 
 
 class PlayerInput:
@@ -91,9 +94,8 @@ class Player(BaseEntity):
             if image is None:
                 sprite_path = render.get("sprite", {}).get("path")
                 # Calculate scale factor from original image size
-                if sprite_path and os.path.exists(sprite_path):
-                    temp_img = pygame.image.load(sprite_path).convert_alpha()
-                    image = pygame.transform.scale(temp_img, size)
+                if sprite_path and asset_exists(sprite_path):
+                    image = load_image(sprite_path, size=size, sprite=True)
 
                 else:
                     DebugLogger.warn(f"Missing sprite: {sprite_path}, using fallback.")
@@ -112,6 +114,7 @@ class Player(BaseEntity):
 
         # Spawn position
         x, y = self._compute_spawn_position(x, y, size, image)
+        self._spawn_pos = (x, y)
 
         # ========================================
         # 3. Base Entity Init
@@ -134,42 +137,8 @@ class Player(BaseEntity):
         # ========================================
         # 4. Core Stats
         # ========================================
-        self.velocity = pygame.Vector2(0, 0)
-        self.virtual_pos = pygame.Vector2(x, y)
-        self.clamped_x = False
-        self.clamped_y = False
-
-        # Cutscene control
-        self.input_locked = False
-
-        self.base_speed = core["speed"]
-        self.health = core["health"]
-        self.max_health = self.health
-
-        # Buff particle emitters (stat_name -> ParticleEmitter)
-        self._buff_emitters = {}
-
-        # Player stats - load from progression config
-        self.exp = 0
-        self.level = 1
         self._exp_table = self._build_exp_table()
-        self.exp_required = self._exp_table[self.level]
-
-        self.visible = True
-        self.layer = Layers.PLAYER
-        self.collision_tag = CollisionTags.PLAYER
-        self.category = EntityCategory.PLAYER
-        self.state = InteractionState.DEFAULT
-
-        # Stress system
-        stress_cfg = cfg.get("stress", {})
-        self.stress = 0.0
-        self.stress_max = stress_cfg.get("max", 10.0)
-        self.stress_threshold = stress_cfg.get("threshold", 8.0)
-        self.stress_decay_rate = stress_cfg.get("decay_rate", 4.0)
-        self.stress_grace_period = stress_cfg.get("grace_period", 1.0)
-        self.stress_per_damage = stress_cfg.get("per_damage", 1.0)
-        self._time_since_damage = 0.0
+        self._init_core_stats(x, y)
 
         # 5. Visual State System
         self.health_thresholds = health_cfg["thresholds"]
@@ -214,7 +183,77 @@ class Player(BaseEntity):
         self._bullet_manager = None
         self._shooting_enabled = False
 
-        combat_cfg = cfg.get("combat", {})
+        self._init_combat_stats()
+
+        # ========================================
+        # 7. Global Ref & Status
+        # ========================================
+        self._rotation_enabled = False  # Players don't rotate
+        self._death_frames = []  # No death animation frames for player
+        self.state_manager = StateManager(self, cfg.get("state_effects", {}))
+        self._shield = None
+        self._item_shield = None
+        self._item_shield_timer = 0.0
+        self._item_shield_duration = 0.0
+
+        self._collision_manager = None
+        self._spawn_manager = None
+
+        get_events().subscribe(EnemyDiedEvent, self._on_enemy_died)
+
+        DebugLogger.init_entry("Player Initialized")
+        DebugLogger.init_sub(f"Location: ({x:.1f}, {y:.1f})")
+        DebugLogger.init_sub(f"Render Mode: {self.render_mode}")
+
+    def _init_core_stats(self, x, y):
+        """
+        Set movement, health, progression and stress to their starting values.
+
+        Args:
+            x: Spawn X position
+            y: Spawn Y position
+        """
+        core = self.cfg["core_attributes"]
+
+        self.velocity = pygame.Vector2(0, 0)
+        self.virtual_pos = pygame.Vector2(x, y)
+        self.clamped_x = False
+        self.clamped_y = False
+
+        # Cutscene control
+        self.input_locked = False
+
+        self.base_speed = core["speed"]
+        self.health = core["health"]
+        self.max_health = self.health
+
+        # Buff particle emitters (stat_name -> ParticleEmitter)
+        self._buff_emitters = {}
+
+        # Player stats - load from progression config
+        self.exp = 0
+        self.level = 1
+        self.exp_required = self._exp_table[self.level]
+
+        self.visible = True
+        self.layer = Layers.PLAYER
+        self.collision_tag = CollisionTags.PLAYER
+        self.category = EntityCategory.PLAYER
+        self.state = InteractionState.DEFAULT
+
+        # Stress system
+        stress_cfg = self.cfg.get("stress", {})
+        self.stress = 0.0
+        self.stress_max = stress_cfg.get("max", 10.0)
+        self.stress_threshold = stress_cfg.get("threshold", 8.0)
+        self.stress_decay_rate = stress_cfg.get("decay_rate", 4.0)
+        self.stress_grace_period = stress_cfg.get("grace_period", 1.0)
+        self.stress_per_damage = stress_cfg.get("per_damage", 1.0)
+        self._time_since_damage = 0.0
+
+    def _init_combat_stats(self):
+        """Set primary, spread and collision attack values from config."""
+        combat_cfg = self.cfg.get("combat", {})
 
         # Primary attack
         primary = combat_cfg.get("primary", {})
@@ -242,25 +281,34 @@ class Player(BaseEntity):
         self.damage = collision.get("damage", 1)
         self.knockback = collision.get("knockback", 200)
 
-        # ========================================
-        # 7. Global Ref & Status
-        # ========================================
-        self._rotation_enabled = False  # Players don't rotate
-        self._death_frames = []  # No death animation frames for player
-        self.state_manager = StateManager(self, cfg.get("state_effects", {}))
-        self._shield = None
-        self._item_shield = None
-        self._item_shield_timer = 0.0
-        self._item_shield_duration = 0.0
+    def reset_for_level(self):
+        """
+        Return to the starting state for a new run (warm restart).
 
-        self._collision_manager = None
-        self._spawn_manager = None
+        Keeps images, the hitbox and manager links; stats, upgrades,
+        buffs and shields from the previous run are discarded.
+        """
+        x, y = self._spawn_pos
+        self.reset(x, y)
 
-        get_events().subscribe(EnemyDiedEvent, self._on_enemy_died)
+        self._despawn_shield()
+        self._despawn_item_shield()
 
-        DebugLogger.init_entry("Player Initialized")
-        DebugLogger.init_sub(f"Location: ({x:.1f}, {y:.1f})")
-        DebugLogger.init_sub(f"Render Mode: {self.render_mode}")
+        self._init_core_stats(x, y)
+        self._init_combat_stats()
+        self._shooting_enabled = self._bullet_manager is not None
+        self.state_manager = StateManager(self, self.cfg.get("state_effects", {}))
+
+        sprite = self._sprite_config
+        self.setup_sprite(
+            health=self.health,
+            thresholds_dict=sprite["thresholds"],
+            color_states=sprite["colors"],
+            image_states=sprite["images"],
+            render_mode=sprite["render_mode"],
+        )
+        if self.hitbox is not None:
+            self.hitbox.update()
 
     # ===========================================================
     # Helper Methods
@@ -284,9 +332,7 @@ class Player(BaseEntity):
     @staticmethod
     def _load_and_scale(path, size):
         """Load and scale a single image state."""
-        temp_img = pygame.image.load(path).convert_alpha()
-        scale = (size[0] / temp_img.get_width(), size[1] / temp_img.get_height())
-        return BaseEntity.load_and_scale_image(path, scale)
+        return load_image(path, size=size, sprite=True)
 
     @staticmethod
     def _build_exp_table():
@@ -505,8 +551,8 @@ class Player(BaseEntity):
                     emitter.emit_continuous(pos, dt)
                 else:
                     # Sparkle box effect for fire_rate and others
-                    offset_x = random.uniform(-24, 24)
-                    offset_y = random.uniform(-24, 24)
+                    offset_x = _rng.uniform(-24, 24)
+                    offset_y = _rng.uniform(-24, 24)
                     pos = (self.pos.x + offset_x, self.pos.y + offset_y)
                     emitter.emit_continuous(pos, dt)
             else:
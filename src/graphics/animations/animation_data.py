@@ -5,10 +5,10 @@ Centralized animation data loading and caching.
 Entities never touch this directly - AnimationManager handles lookup.
 """
 
-import os
-import pygame
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.asset_bundle import asset_exists
 from src.core.services.config_manager import load_config
+from src.graphics.image_formats import load_image
 
 _DATA = None
 _FRAME_CACHE = {}  # {(path, scale): Surface}
@@ -28,15 +28,12 @@ def _load_frame(path, scale=1.0):
     if cache_key in _FRAME_CACHE:
         return _FRAME_CACHE[cache_key]
 
-    if not os.path.exists(path):
+    if not asset_exists(path):
         DebugLogger.warn(f"Animation frame not found: {path}")
         return None
 
     try:
-        img = pygame.image.load(path).convert_alpha()
-        if scale != 1.0:
-            new_size = (int(img.get_width() * scale), int(img.get_height() * scale))
-            img = pygame.transform.scale(img, new_size)
+        img = load_image(path, scale=scale, sprite=True)
         _FRAME_CACHE[cache_key] = img
         return img
     except Exception as e:
@@ -135,5 +135,5 @@ def recovery_player(entity, t):
     if t >= 1.0:
         entity.image = entity._base_image.copy()
         entity.image.set_alpha(255)
-        if hasattr(entity, "_base_image"):
-            del entity._base_image
+        # Clear, don't delete: BaseEntity.reset() reads it on warm restarts
+        entity._base_image = None
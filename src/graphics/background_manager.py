@@ -7,13 +7,18 @@ Provides multi-layer scrolling backgrounds with:
 - Per-layer scroll speeds
 - Camera-based parallax effects
 - Runtime controls (pause, speed, parallax)
-- Seamless tiling
+- Seamless tiling from a precomposed wrap-around strip cache
 """
 
+import hashlib
+import os
+
 import pygame
 import math
 import random
 from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Cache
+from src.graphics.image_formats import load_image
 
 
 class BackgroundLayer:
@@ -22,8 +27,15 @@ class BackgroundLayer:
 
     Handles auto-scrolling and camera-based parallax for one image layer.
     Automatically tiles to fill the screen.
+
+    The tile is pre-composed once into a wrap-around strip cache (whole tiles
+    covering at least the screen), so a frame costs at most four area blits
+    instead of one full blit per visible tile.
     """
 
+    # Alpha layers with less coverage than this are RLE-encoded
+    RLE_MAX_COVERAGE = 0.5
+
     __slots__ = (
         "scroll_speed",
         "parallax",
@@ -35,6 +47,8 @@ class BackgroundLayer:
         "height",
         "screen_width",
         "screen_height",
+        "opaque",
+        "_strip_cache",
     )
 
     def __init__(self, image_path, scroll_speed, parallax_factor, screen_size):
@@ -56,6 +70,10 @@ class BackgroundLayer:
         # Screen dimensions
         self.screen_width, self.screen_height = screen_size
 
+        # Strip cache (built lazily, see _build_strip_cache)
+        self.opaque = False
+        self._strip_cache = None
+
         # Load image
         self._load_image(image_path)
 
@@ -67,7 +85,7 @@ class BackgroundLayer:
             image_path: Path to image file
         """
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
+            self.image = load_image(image_path)
             DebugLogger.init_sub(f"Loaded background: {image_path}")
         except Exception as e:
             # Fallback: create colored surface
@@ -77,9 +95,66 @@ class BackgroundLayer:
 
         self.width = self.image.get_width()
         self.height = self.image.get_height()
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop the strip cache after self.image is modified."""
+        self._strip_cache = None
+        self.opaque = self._is_opaque(self.image)
+
+    @staticmethod
+    def _is_opaque(image):
+        """Check if every pixel of an image is fully opaque."""
+        if not image.get_flags() & pygame.SRCALPHA:
+            return image.get_colorkey() is None
+        mask = pygame.mask.from_surface(image, threshold=254)
+        return mask.count() == image.get_width() * image.get_height()
+
+    def _build_strip_cache(self):
+        """
+        Pre-compose the tile into a screen-covering wrap-around surface.
+
+        The cache size is a whole number of tiles, so wrapping the cache is
+        the same as wrapping the tile. Opaque layers are stored with
+        convert() (no per-pixel alpha); sparse alpha layers are RLE-encoded
+        so transparent runs are skipped during the blit.
+
+        Returns:
+            pygame.Surface: Cached strip surface
+        """
+        cols = max(1, -(-self.screen_width // self.width))
+        rows = max(1, -(-self.screen_height // self.height))
+        size = (cols * self.width, rows * self.height)
+
+        if self.opaque:
+            cache = pygame.Surface(size).convert()
+        else:
+            cache = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            cache.fill((0, 0, 0, 0))
+
+        # Tiles never overlap: MAX onto the cleared cache copies per-pixel
+        # alpha exactly (a normal blit of RLE alpha would not keep dest alpha)
+        per_pixel = self.image.get_flags() & pygame.SRCALPHA
+        blend = pygame.BLEND_RGBA_MAX if per_pixel and not self.opaque else 0
+        cache.blits(
+            [
+                (self.image, (col * self.width, row * self.height), None, blend)
+                for col in range(cols)
+                for row in range(rows)
+            ],
+            doreturn=False,
+        )
+
+        if not self.opaque:
+            coverage = pygame.mask.from_surface(cache, threshold=0).count()
+            if coverage < size[0] * size[1] * self.RLE_MAX_COVERAGE:
+                cache.set_alpha(255, pygame.RLEACCEL)
+
+        self._strip_cache = cache
+        return cache
 
     def random_scatter_objects(
-        self, object_paths, count, min_distance=50, max_attempts=50
+        self, object_paths, count, min_distance=50, max_attempts=50, seed=None
     ):
         """
         Scatters objects onto the background layer.
@@ -88,11 +163,15 @@ class BackgroundLayer:
         2. Ensures a minimum separation distance (min_distance) from existing objects.
         3. Calculates distance considering the map's seamless wrapping (Toroidal Check).
 
+        Placed positions are bucketed in a wrapping grid of cells at least
+        min_distance wide, so each candidate only checks its 3x3 neighbourhood.
+
         Args:
             object_paths (list): List of image file paths.
             count (int): Target number of objects to place.
             min_distance (int): Minimum distance between objects (in pixels).
             max_attempts (int): Maximum number of retries if position selection fails.
+            seed (int): RNG seed for a reproducible layout (None = random).
         """
         if not object_paths:
             return
@@ -102,17 +181,27 @@ class BackgroundLayer:
         loaded_objs = []
 
         for path in object_paths:
-            img = pygame.image.load(path).convert_alpha()
+            img = load_image(path, sprite=True)
             loaded_objs.append(img)
 
         if not loaded_objs:
             return
 
-        placed_positions = []
+        rng = random.Random(seed)
+
+        # Toroidal grid: cells evenly divide the map and are >= min_distance
+        cols = max(1, int(self.width // max(min_distance, 1)))
+        rows = max(1, int(self.height // max(min_distance, 1)))
+        cell_w = self.width / cols
+        cell_h = self.height / rows
+        grid = {}
+        min_dist_sq = min_distance * min_distance
+        half_w = self.width / 2
+        half_h = self.height / 2
 
         for _ in range(count):
-            img = random.choice(loaded_objs)
-            angle = random.uniform(0, 360)
+            img = rng.choice(loaded_objs)
+            angle = rng.uniform(0, 360)
             img = pygame.transform.rotate(img, angle)
 
             w, h = img.get_size()
@@ -121,24 +210,32 @@ class BackgroundLayer:
             best_x, best_y = 0, 0
 
             for attempt in range(max_attempts):
-                cx = random.randint(0, self.width - 1)
-                cy = random.randint(0, self.height - 1)
+                cx = rng.randint(0, self.width - 1)
+                cy = rng.randint(0, self.height - 1)
+                gx = int(cx // cell_w)
+                gy = int(cy // cell_h)
 
-                # Distance Check
+                # Distance Check (neighbouring cells only)
                 conflict = False
-                for px, py in placed_positions:
-                    dx = abs(cx - px)
-                    dy = abs(cy - py)
-
-                    if dx > self.width / 2:
-                        dx = self.width - dx
-                    if dy > self.height / 2:
-                        dy = self.height - dy
-
-                    dist = (dx * dx + dy * dy) ** 0.5
-
-                    if dist < min_distance:
-                        conflict = True
+                neighbours = {
+                    ((gx + ox) % cols, (gy + oy) % rows)
+                    for ox in (-1, 0, 1)
+                    for oy in (-1, 0, 1)
+                }
+                for cell in neighbours:
+                    for px, py in grid.get(cell, ()):
+                        dx = abs(cx - px)
+                        dy = abs(cy - py)
+
+                        if dx > half_w:
+                            dx = self.width - dx
+                        if dy > half_h:
+                            dy = self.height - dy
+
+                        if dx * dx + dy * dy < min_dist_sq:
+                            conflict = True
+                            break
+                    if conflict:
                         break
 
                 if not conflict:
@@ -147,7 +244,7 @@ class BackgroundLayer:
                     break
 
             if valid_pos:
-                placed_positions.append((best_x, best_y))
+                grid.setdefault((gx, gy), []).append((best_x, best_y))
 
                 self.image.blit(img, (best_x, best_y))
 
@@ -162,6 +259,8 @@ class BackgroundLayer:
             else:
                 DebugLogger.warn("Could not find valid position for an object")
 
+        # Blitting onto the tile never lowers its opacity, only the cache is stale
+        self._strip_cache = None
         DebugLogger.init_sub("Decoration complete.")
 
     # ===========================================================
@@ -203,20 +302,87 @@ class BackgroundLayer:
         """
         Draw tiled background to surface.
 
+        Blits the visible window of the strip cache, split at the cache's
+        wrap seams (1 blit, 2 if one axis wraps, 4 if both do).
+
         Args:
             surface: Target pygame surface
         """
-        tiles_x = (self.screen_width // self.width) + 2
-        tiles_y = (self.screen_height // self.height) + 2
+        cache = self._strip_cache or self._build_strip_cache()
+        cache_w, cache_h = cache.get_size()
+        screen_w, screen_h = self.screen_width, self.screen_height
+
+        # Screen pixel 0 shows tile pixel ceil(offset) (matches floor(-offset))
+        src_x = math.ceil(self.render_offset_x) % cache_w
+        src_y = math.ceil(self.render_offset_y) % cache_h
+
+        first_w = min(cache_w - src_x, screen_w)
+        first_h = min(cache_h - src_y, screen_h)
+        rest_w = screen_w - first_w
+        rest_h = screen_h - first_h
+
+        blits = [(cache, (0, 0), (src_x, src_y, first_w, first_h))]
+        if rest_w > 0:
+            blits.append((cache, (first_w, 0), (0, src_y, rest_w, first_h)))
+        if rest_h > 0:
+            blits.append((cache, (0, first_h), (src_x, 0, first_w, rest_h)))
+        if rest_w > 0 and rest_h > 0:
+            blits.append((cache, (first_w, first_h), (0, 0, rest_w, rest_h)))
+
+        surface.blits(blits, doreturn=False)
+
+
+class DecorationCache:
+    """
+    On-disk cache of pre-composited decorated background images.
+
+    A decorated map is saved as a finished PNG keyed by level id, seed,
+    scatter parameters and the mtimes of every source image, so a cache hit
+    replaces the base image load and the whole scatter pass.
+    """
+
+    @staticmethod
+    def path_for(level_id, seed, base_path, object_paths, **params):
+        """
+        Build the cache file path for a decoration.
+
+        Args:
+            level_id: Level identifier
+            seed: Scatter RNG seed
+            base_path: Base background image path
+            object_paths: Decoration image paths
+            **params: Scatter parameters (count, min_distance, ...)
 
-        start_x = math.floor(-self.render_offset_x)
-        start_y = math.floor(-self.render_offset_y)
+        Returns:
+            str: Cache file path (may not exist yet)
+        """
+        sources = []
+        for path in [base_path, *object_paths]:
+            try:
+                sources.append((path, os.path.getmtime(path)))
+            except OSError:
+                sources.append((path, None))
+
+        key = repr((level_id, seed, sorted(params.items()), sources))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        safe_id = "".join(c if c.isalnum() else "_" for c in str(level_id))
+        return os.path.join(Cache.BACKGROUNDS, f"{safe_id}_{digest}.png")
+
+    @staticmethod
+    def store(path, surface):
+        """
+        Save a decorated image to the cache.
 
-        for tx in range(tiles_x):
-            for ty in range(tiles_y):
-                x = start_x + tx * self.width  # Clean integer math
-                y = start_y + ty * self.height
-                surface.blit(self.image, (x, y))
+        Args:
+            path: Cache file path from path_for()
+            surface: Finished decorated surface
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            pygame.image.save(surface, path)
+            DebugLogger.init_sub(f"Cached decorated background: {path}")
+        except (OSError, pygame.error) as e:
+            DebugLogger.warn(f"Failed to cache background {path}: {e}")
 
 
 class BackgroundManager:
@@ -371,8 +537,14 @@ class BackgroundManager:
         """
         Render all layers bottom-up.
 
+        An opaque bottom layer overwrites every pixel, so the clear is only
+        needed when it has transparency.
+
         Args:
             surface: Target pygame surface
         """
+        if self.layers and not self.layers[0].opaque:
+            surface.fill((0, 0, 0))
+
         for layer in self.layers:
             layer.render(surface)
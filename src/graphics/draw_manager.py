@@ -6,7 +6,9 @@ Centralized rendering manager for batching and layered draw calls.
 Responsibilities:
 - Load and cache images
 - Maintain layered draw queue
+- Retained draw lists for static / slowly-changing layers
 - Render queued surfaces and shapes
+- Track changed regions for dirty-rect presentation
 - Debug overlay rendering
 """
 
@@ -16,11 +18,88 @@ import os
 import pygame
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Layers
+from src.core.services.asset_bundle import asset_exists
+from src.graphics.image_formats import load_image
+
+
+class RetainedLayer:
+    """
+    Cached draw list rebuilt only when one of its contributors invalidates it.
+
+    The builder callback receives this layer and re-queues its items through
+    queue_draw(). With flatten=True the items are composed once into a single
+    surface, drawn at the retained layer's z-order.
+    """
+
+    __slots__ = ("name", "layer", "builder", "flatten", "layers", "dirty")
+
+    def __init__(self, name, layer, builder, flatten=False):
+        """
+        Initialize retained layer.
+
+        Args:
+            name: Registry identifier
+            layer: Default render layer for queued items
+            builder: Callable(retained_layer) that queues all items
+            flatten: Compose items into one cached surface if True
+        """
+        self.name = name
+        self.layer = layer
+        self.builder = builder
+        self.flatten = flatten
+        self.layers = {}  # {layer: [(surface, rect), ...]}
+        self.dirty = True
+
+    def invalidate(self):
+        """Request rebuild on next queue (call when a contributor changes)."""
+        self.dirty = True
+
+    def queue_draw(self, surface, rect, layer=None):
+        """
+        Queue a surface into the retained list (builder use only).
+
+        Args:
+            surface: pygame.Surface to draw
+            rect: Position rectangle (copied)
+            layer: Render layer (defaults to retained layer)
+        """
+        if surface is None or rect is None:
+            return
+
+        if layer is None:
+            layer = self.layer
+        self.layers.setdefault(layer, []).append((surface, pygame.Rect(rect)))
+
+    def rebuild(self):
+        """Re-run the builder and refresh cached items."""
+        self.layers = {}
+        self.builder(self)
+        if self.flatten:
+            self._flatten()
+        self.dirty = False
+
+    def _flatten(self):
+        """Compose all items into one surface covering their bounds."""
+        items = [item for key in sorted(self.layers) for item in self.layers[key]]
+        if not items:
+            return
+
+        bounds = items[0][1].unionall([rect for _, rect in items[1:]])
+        flat = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        flat.blits(
+            [(surf, rect.move(-bounds.x, -bounds.y)) for surf, rect in items],
+            doreturn=False,
+        )
+        self.layers = {self.layer: [(flat, bounds)]}
 
 
 class DrawManager:
     """Handles all rendering operations with layered batching."""
 
+    # Layers at or above this value are screen-space and never shaken
+    SHAKE_LAYER_LIMIT = Layers.UI
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -36,6 +115,9 @@ class DrawManager:
         self._layer_keys_cache = []
         self._layers_dirty = False
 
+        # Retained layers (registered once, rebuilt on invalidate)
+        self.retained_layers = {}  # {name: RetainedLayer}
+
         # Background (reference only, not owned)
         self.background = None
         self.bg_manager = None
@@ -51,6 +133,15 @@ class DrawManager:
         self.shake_intensity = 0.0
         self.shake_duration = 0.0
 
+        # Dirty-rect tracking (toggled per frame by SceneManager)
+        self.dirty_tracking = False
+        self.dirty_rects = None  # None = whole frame changed
+        self._prev_frame_keys = None
+        self._prev_frame_refs = []  # Keeps surface ids stable between frames
+        self._prev_bg_state = None
+        self._forced_dirty = []
+        self._full_redraw = True
+
         DebugLogger.init_entry("DrawManager")
 
     # ===========================================================
@@ -67,17 +158,14 @@ class DrawManager:
             scale: Scaling factor (default 1.0)
         """
         try:
-            img = pygame.image.load(path).convert_alpha()
+            img = load_image(path, scale=scale)
+            if scale != 1.0:
+                DebugLogger.state(f"Scaled '{key}' to {img.get_size()} ({scale:.2f}x)")
         except FileNotFoundError:
             DebugLogger.warn(f"Missing image at {path}")
             img = pygame.Surface((40, 40))
             img.fill((255, 255, 255))
 
-        if scale != 1.0:
-            w, h = img.get_size()
-            img = pygame.transform.scale(img, (int(w * scale), int(h * scale)))
-            DebugLogger.state(f"Scaled '{key}' to {img.get_size()} ({scale:.2f}x)")
-
         self.images[key] = img
 
     def load_icon(self, name, size=(24, 24)):
@@ -97,8 +185,7 @@ class DrawManager:
 
         path = os.path.join("assets", "images", "icons", f"{name}.png")
         try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, size)
+            img = load_image(path, size=size)
             DebugLogger.action(f"Loaded icon '{name}' ({size[0]}x{size[1]})")
         except FileNotFoundError:
             img = pygame.Surface(size, pygame.SRCALPHA)
@@ -160,15 +247,10 @@ class DrawManager:
         # Try loading from path
         if image_path:
             try:
-                img = pygame.image.load(image_path).convert_alpha()
                 if scale != 1.0:
-                    new_size = (
-                        int(img.get_width() * scale),
-                        int(img.get_height() * scale),
-                    )
-                    img = pygame.transform.scale(img, new_size)
+                    img = load_image(image_path, scale=scale, sprite=True)
                 else:
-                    img = pygame.transform.scale(img, size)
+                    img = load_image(image_path, size=size, sprite=True)
                 self.images[cache_key] = img
                 DebugLogger.action(
                     f"Loaded entity image: {entity_type} from {image_path}"
@@ -205,6 +287,21 @@ class DrawManager:
         self.debug_hitboxes.clear()
         self.debug_obbs.clear()
 
+    def mark_dirty(self, rect=None):
+        """
+        Flag a region as changed outside the draw queue.
+
+        Needed for surfaces edited in place (same object, same rect), which
+        dirty-rect tracking cannot detect on its own.
+
+        Args:
+            rect: Changed region, or None for the whole frame
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._forced_dirty.append(pygame.Rect(rect))
+
     def trigger_shake(self, intensity=8.0, duration=0.3):
         """Start screen shake effect."""
         self.shake_intensity = intensity
@@ -216,8 +313,6 @@ class DrawManager:
         if self.shake_timer > 0:
             self.shake_timer -= dt
             t = self.shake_timer / self.shake_duration if self.shake_duration > 0 else 0
-            import math
-
             self.shake_offset = (
                 int(math.sin(self.shake_timer * 50) * self.shake_intensity * t),
                 int(math.cos(self.shake_timer * 40) * self.shake_intensity * t),
@@ -244,6 +339,65 @@ class DrawManager:
 
         self.surface_layers[layer].append((surface, rect))
 
+    # ===========================================================
+    # Retained Layers
+    # ===========================================================
+
+    def register_retained(self, name, layer, builder, flatten=False):
+        """
+        Register a retained layer.
+
+        Args:
+            name: Unique identifier
+            layer: Default render layer
+            builder: Callable(retained_layer) that queues the layer's items
+            flatten: Compose items into one cached surface if True
+
+        Returns:
+            RetainedLayer: Handle for invalidate() / queue_retained()
+        """
+        retained = RetainedLayer(name, layer, builder, flatten)
+        self.retained_layers[name] = retained
+        DebugLogger.state(f"Registered retained layer '{name}'", category="drawing")
+        return retained
+
+    def unregister_retained(self, name):
+        """Remove a retained layer by name."""
+        self.retained_layers.pop(name, None)
+
+    def get_retained(self, name):
+        """
+        Get retained layer by name.
+
+        Returns:
+            RetainedLayer or None
+        """
+        return self.retained_layers.get(name)
+
+    def queue_retained(self, retained):
+        """
+        Composite a retained layer into this frame.
+
+        Rebuilds only if invalidated; otherwise extends the layer queues
+        with the cached blit lists.
+
+        Args:
+            retained: RetainedLayer handle or registered name
+        """
+        if isinstance(retained, str):
+            retained = self.retained_layers.get(retained)
+            if retained is None:
+                return
+
+        if retained.dirty:
+            retained.rebuild()
+
+        for layer, items in retained.layers.items():
+            if layer not in self.surface_layers:
+                self.surface_layers[layer] = []
+                self._layers_dirty = True
+            self.surface_layers[layer].extend(items)
+
     def draw_entity(self, entity, layer=0):
         """
         Queue entity with image and rect attributes.
@@ -391,6 +545,12 @@ class DrawManager:
         """
         Render all queued items to target surface.
 
+        Screen shake is applied once by scrolling the finished world pass
+        (background + layers below SHAKE_LAYER_LIMIT), so its cost does not
+        depend on how many items are queued. UI layers are drawn unshaken.
+        Unlike per-item offsets, this shakes the background with the world;
+        the strip uncovered by the scroll is refilled from the background.
+
         Args:
             target_surface: Main display surface
             debug: Log render stats if True
@@ -407,24 +567,34 @@ class DrawManager:
             self._layers_dirty = False
 
         # Render layers
+        shake_pending = self.shake_offset != (0, 0)
         for layer in self._layer_keys_cache:
+            if shake_pending and layer >= self.SHAKE_LAYER_LIMIT:
+                self._apply_shake(target_surface)
+                shake_pending = False
+
             if layer in self.surface_layers and self.surface_layers[layer]:
-                if self.shake_offset != (0, 0):
-                    shifted = [
-                        (surf, rect.move(self.shake_offset))
-                        for surf, rect in self.surface_layers[layer]
-                    ]
-                    target_surface.blits(shifted)
-                else:
-                    target_surface.blits(self.surface_layers[layer])
+                target_surface.blits(self.surface_layers[layer], doreturn=False)
 
             if layer in self.shape_layers:
                 for shape_type, rect, color, kwargs in self.shape_layers[layer]:
                     self._draw_shape(target_surface, shape_type, rect, color, **kwargs)
 
+        # World-only frame (no UI layers queued)
+        if shake_pending:
+            self._apply_shake(target_surface)
+
         # Debug overlays
         self._render_debug(target_surface)
 
+        # Changed regions for DisplayManager (None = present full frame)
+        if self.dirty_tracking:
+            self.dirty_rects = self._collect_dirty_rects()
+        else:
+            self.dirty_rects = None
+            self._prev_frame_keys = None
+            self._prev_frame_refs = []
+
         if debug:
             surface_count = sum(len(items) for items in self.surface_layers.values())
             shape_count = sum(len(items) for items in self.shape_layers.values())
@@ -433,6 +603,25 @@ class DrawManager:
                 category="drawing",
             )
 
+    def _apply_shake(self, target_surface):
+        """Scroll the world pass by shake_offset and refill the exposed edges."""
+        dx, dy = self.shake_offset
+        target_surface.scroll(dx, dy)
+
+        # scroll() leaves the vacated strips holding the old pixels
+        width, height = target_surface.get_size()
+        strips = []
+        if dx:
+            strips.append(pygame.Rect(0 if dx > 0 else width + dx, 0, abs(dx), height))
+        if dy:
+            strips.append(pygame.Rect(0, 0 if dy > 0 else height + dy, width, abs(dy)))
+
+        clip = target_surface.get_clip()
+        for strip in strips:
+            target_surface.set_clip(strip)
+            self._render_background(target_surface)
+        target_surface.set_clip(clip)
+
     def _render_background(self, target_surface):
         """Render background (scrolling, static, or fallback)."""
         if self.bg_manager is not None:
@@ -445,6 +634,60 @@ class DrawManager:
                 self._bg_cache.fill((50, 50, 100))
             target_surface.blit(self._bg_cache, (0, 0))
 
+    def _collect_dirty_rects(self):
+        """
+        Diff this frame's queue against the previous one.
+
+        Items are keyed by (surface id, layer, rect); anything added, moved,
+        swapped or removed contributes its rect. Background motion, shake,
+        shapes and debug overlays fall back to a full frame.
+
+        Returns:
+            list[pygame.Rect] or None: Changed regions, None for full frame
+        """
+        keys = set()
+        refs = []
+        for layer, items in self.surface_layers.items():
+            for surf, rect in items:
+                keys.add((id(surf), layer, rect[0], rect[1], rect[2], rect[3]))
+                refs.append(surf)
+
+        bg_state = self._background_state()
+        has_shapes = any(self.shape_layers.values())
+        full = (
+            self._full_redraw
+            or self._prev_frame_keys is None
+            or bg_state != self._prev_bg_state
+            or self.shake_offset != (0, 0)
+            or has_shapes
+            or self.debug_hitboxes
+            or self.debug_obbs
+        )
+
+        if full:
+            dirty = None
+        else:
+            dirty = [pygame.Rect(key[2:]) for key in keys ^ self._prev_frame_keys]
+            dirty.extend(self._forced_dirty)
+
+        self._prev_frame_keys = keys
+        self._prev_frame_refs = refs
+        self._prev_bg_state = bg_state
+        self._forced_dirty = []
+        self._full_redraw = False
+        return dirty
+
+    def _background_state(self):
+        """Snapshot of background scroll state for change detection."""
+        if self.bg_manager is not None:
+            return tuple(
+                (id(layer.image), layer.render_offset_x, layer.render_offset_y)
+                for layer in self.bg_manager.layers
+            )
+        if self.background is not None:
+            return id(self.background)
+        return None
+
     def _render_debug(self, target_surface):
         """Render debug hitboxes and OBBs."""
         for rect, color, width in self.debug_hitboxes:
@@ -470,10 +713,9 @@ class DrawManager:
         """
         fallback_path = "assets/images/null.png"
 
-        if os.path.exists(fallback_path):
+        if asset_exists(fallback_path):
             try:
-                img = pygame.image.load(fallback_path).convert_alpha()
-                return pygame.transform.scale(img, size)
+                return load_image(fallback_path, size=size, sprite=True)
             except Exception as e:
                 DebugLogger.warn(f"Failed to load fallback {fallback_path}: {e}")
 
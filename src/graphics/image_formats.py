@@ -0,0 +1,359 @@
+"""
+image_formats.py
+----------------
+Per-image surface format selection for faster blits.
+
+Each source image is scanned once and classified by its alpha channel:
+- opaque:    no transparency -> convert() (plain copy blit)
+- colorkey:  alpha is only 0/255 -> convert() + colorkey (RLE)
+- rle_alpha: sparse soft alpha -> convert_alpha() + RLEACCEL
+- alpha:     dense soft alpha -> convert_alpha() (default path)
+
+Decisions are stored in a manifest (Cache.IMAGE_FORMATS) keyed by path and
+validated by mtime, so the scan runs only when a source image changes.
+All loaders go through load_image(), which applies the format last (after
+scaling, since transform.scale drops RLE).
+
+Run `python -m src.graphics.image_formats` to rebuild the manifest for
+assets/images and print the estimated blit time saved per image.
+"""
+
+import atexit
+import json
+import os
+import time
+
+import pygame
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Cache
+from src.core.services.asset_bundle import get_bundle
+
+# ===========================================================
+# Formats
+# ===========================================================
+
+OPAQUE = "opaque"
+COLORKEY = "colorkey"
+RLE_ALPHA = "rle_alpha"
+FULL_ALPHA = "alpha"
+
+# Alpha images with less visible coverage than this are RLE-encoded
+RLE_MAX_COVERAGE = 0.5
+
+# Candidate colorkeys, first one unused by the image wins
+_KEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253))
+
+_MANIFEST = None  # {path: {"mtime", "format", "key", "coverage"}}
+_MANIFEST_DIRTY = False
+
+_PRELOADED = {}  # {normalized path: convert_alpha() surface} from AssetLoader
+
+
+# ===========================================================
+# Classification
+# ===========================================================
+
+
+def classify(surface):
+    """
+    Pick the fastest blit format for a surface's alpha channel.
+
+    Args:
+        surface: Surface with per-pixel alpha (convert_alpha())
+
+    Returns:
+        dict: {"format", "key", "coverage"}
+    """
+    width, height = surface.get_size()
+    area = max(width * height, 1)
+
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return {"format": OPAQUE, "key": None, "coverage": 1.0}
+
+    opaque_count = pygame.mask.from_surface(surface, threshold=254).count()
+    visible_count = pygame.mask.from_surface(surface, threshold=0).count()
+    coverage = visible_count / area
+
+    if opaque_count == area:
+        return {"format": OPAQUE, "key": None, "coverage": 1.0}
+
+    if opaque_count == visible_count:
+        key = _find_unused_key(surface)
+        if key is not None:
+            return {"format": COLORKEY, "key": key, "coverage": coverage}
+
+    if coverage < RLE_MAX_COVERAGE:
+        return {"format": RLE_ALPHA, "key": None, "coverage": coverage}
+    return {"format": FULL_ALPHA, "key": None, "coverage": coverage}
+
+
+def _find_unused_key(surface):
+    """Return a colorkey not used by any visible pixel, or None."""
+    visible = pygame.mask.from_surface(surface, threshold=0)
+    for key in _KEY_CANDIDATES:
+        matches = pygame.mask.from_threshold(surface, key, (1, 1, 1, 255))
+        if matches.overlap_area(visible, (0, 0)) == 0:
+            return list(key)
+    return None
+
+
+def apply_format(surface, entry, sprite=False, smooth=False):
+    """
+    Convert a surface to the format chosen for its source image.
+
+    Args:
+        surface: Loaded (and already scaled) surface with per-pixel alpha
+        entry: Manifest entry from classify()
+        sprite: Keep per-pixel alpha (image is rotated, flashed or faded)
+        smooth: Image was smoothscaled, so a colorkey would fringe
+
+    Returns:
+        pygame.Surface: Converted surface
+    """
+    fmt = entry["format"]
+
+    # Rotation pads with the top-left pixel and BLEND_RGB_ADD flashes break
+    # colorkeys, so dynamic sprites only get the alpha formats
+    if sprite and fmt in (OPAQUE, COLORKEY):
+        fmt = FULL_ALPHA
+    if smooth and fmt == COLORKEY:
+        fmt = FULL_ALPHA
+
+    if fmt == OPAQUE:
+        return surface.convert()
+
+    if fmt == COLORKEY:
+        key = tuple(entry["key"])
+        converted = pygame.Surface(surface.get_size()).convert()
+        converted.fill(key)
+        converted.blit(surface, (0, 0))
+        converted.set_colorkey(key, pygame.RLEACCEL)
+        return converted
+
+    if fmt == RLE_ALPHA:
+        surface.set_alpha(255, pygame.RLEACCEL)
+
+    return surface
+
+
+# ===========================================================
+# Manifest
+# ===========================================================
+
+
+def _load_manifest():
+    """Load the format manifest once."""
+    global _MANIFEST
+    if _MANIFEST is None:
+        try:
+            with open(Cache.IMAGE_FORMATS, "r", encoding="utf-8") as f:
+                _MANIFEST = json.load(f)
+        except (OSError, ValueError):
+            _MANIFEST = {}
+    return _MANIFEST
+
+
+def save_manifest():
+    """Write the manifest if new images were classified."""
+    global _MANIFEST_DIRTY
+    if not _MANIFEST_DIRTY:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(Cache.IMAGE_FORMATS), exist_ok=True)
+        with open(Cache.IMAGE_FORMATS, "w", encoding="utf-8") as f:
+            json.dump(_MANIFEST, f, indent=1, sort_keys=True)
+        _MANIFEST_DIRTY = False
+    except OSError as e:
+        DebugLogger.warn(f"Failed to save image format manifest: {e}")
+
+
+def get_format(path, surface):
+    """
+    Get the manifest entry for an image, classifying it if stale.
+
+    Args:
+        path: Source image path
+        surface: Freshly loaded convert_alpha() surface of that path
+
+    Returns:
+        dict: Manifest entry
+    """
+    global _MANIFEST_DIRTY
+    manifest = _load_manifest()
+    key = os.path.normpath(path)
+
+    mtime = get_bundle().source_mtime(path)
+    if mtime is None:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+
+    entry = manifest.get(key)
+    if entry is None or entry.get("mtime") != mtime:
+        entry = classify(surface)
+        entry["mtime"] = mtime
+        manifest[key] = entry
+        if not _MANIFEST_DIRTY:
+            atexit.register(save_manifest)
+        _MANIFEST_DIRTY = True
+    return entry
+
+
+# ===========================================================
+# Loading
+# ===========================================================
+
+
+def decode_image(path):
+    """
+    Get raw pixels for an image without touching the display.
+
+    Safe to call from worker threads (see AssetLoader); the result still
+    needs convert_alpha() on the main thread.
+
+    Args:
+        path: Image file path
+
+    Returns:
+        pygame.Surface: Unconverted surface
+    """
+    raw = get_bundle().load_surface(path)
+    if raw is None:
+        raw = pygame.image.load(path)
+    return raw
+
+
+def add_preloaded(path, surface):
+    """
+    Park a converted surface for the next load_image() of path.
+
+    Each preloaded surface is used once; later loads of the same path
+    decode normally.
+
+    Args:
+        path: Source image path
+        surface: convert_alpha() surface of that path
+    """
+    _PRELOADED[os.path.normpath(path)] = surface
+
+
+def clear_preloaded():
+    """Drop all preloaded surfaces."""
+    _PRELOADED.clear()
+
+
+def load_image(path, size=None, scale=None, sprite=False, smooth=False):
+    """
+    Load an image, scale it, and apply its manifest format.
+
+    Pixels come from a surface preloaded by AssetLoader, then the
+    pre-decoded asset bundle, otherwise the file is decoded from disk.
+
+    Args:
+        path: Image file path
+        size: Target (width, height), overrides scale
+        scale: Float or (x, y) scale factor
+        sprite: Keep per-pixel alpha (see apply_format)
+        smooth: Use smoothscale instead of scale
+
+    Returns:
+        pygame.Surface
+
+    Raises:
+        FileNotFoundError, pygame.error: Same as pygame.image.load
+    """
+    img = _PRELOADED.pop(os.path.normpath(path), None)
+    if img is None:
+        img = decode_image(path).convert_alpha()
+    entry = get_format(path, img)
+
+    if size is None and scale is not None and scale != 1.0:
+        if isinstance(scale, (list, tuple)):
+            sx, sy = scale
+        else:
+            sx = sy = scale
+        size = (int(img.get_width() * sx), int(img.get_height() * sy))
+
+    if size is not None and tuple(size) != img.get_size():
+        resize = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        img = resize(img, tuple(size))
+
+    return apply_format(img, entry, sprite=sprite, smooth=smooth)
+
+
+# ===========================================================
+# Offline Report
+# ===========================================================
+
+
+def _time_blit(surface, target, repeats):
+    """Average milliseconds for one blit of surface onto target."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        target.blit(surface, (0, 0))
+    return (time.perf_counter() - start) * 1000.0 / repeats
+
+
+def build_report(root="assets/images", repeats=20):
+    """
+    Classify every image under root and estimate blit savings.
+
+    Times one blit of the default convert_alpha() surface against the
+    optimized surface (static usage) onto a display-format target.
+
+    Args:
+        root: Directory to scan
+        repeats: Blits timed per variant
+
+    Returns:
+        list: (path, format, baseline_ms, optimized_ms) tuples
+    """
+    rows = []
+    for directory, _, files in os.walk(root):
+        for name in sorted(files):
+            if not name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                baseline = pygame.image.load(path).convert_alpha()
+            except pygame.error as e:
+                DebugLogger.warn(f"Skipping {path}: {e}")
+                continue
+
+            entry = get_format(path, baseline)
+            optimized = apply_format(baseline.copy(), entry)
+
+            target = pygame.Surface(baseline.get_size()).convert()
+            target.blit(optimized, (0, 0))  # Warm-up (builds RLE data)
+            base_ms = _time_blit(baseline, target, repeats)
+            opt_ms = _time_blit(optimized, target, repeats)
+            rows.append((path, entry["format"], base_ms, opt_ms))
+
+    save_manifest()
+    return rows
+
+
+def main():
+    """Rebuild the manifest and print the estimated blit savings."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    rows = build_report()
+    total_base = sum(row[2] for row in rows)
+    total_opt = sum(row[3] for row in rows)
+
+    print(f"{'image':<56} {'format':<10} {'alpha ms':>9} {'opt ms':>9}")
+    for path, fmt, base_ms, opt_ms in rows:
+        print(f"{path:<56} {fmt:<10} {base_ms:>9.3f} {opt_ms:>9.3f}")
+    print(
+        f"\n{len(rows)} images, one blit each: {total_base:.2f}ms -> "
+        f"{total_opt:.2f}ms (saves {total_base - total_opt:.2f}ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,13 @@ Usage:
 """
 
 import pygame
-import random
 import math
 
 from src.core.runtime.game_settings import Display, Layers, Debug
 from src.core.services.config_manager import load_config
+from src.core.services.rng import get_rng
+
+_rng = get_rng("particles")
 
 
 # ===========================================================
@@ -181,7 +183,7 @@ class Particle:
         if wobble:
             age = 1.0 - (self.lifetime / self.max_lifetime)
             wobble_mult = 1.0 + (age * spread_growth)
-            self.x += random.uniform(-wobble, wobble) * wobble_mult * dt
+            self.x += _rng.uniform(-wobble, wobble) * wobble_mult * dt
 
         self.lifetime -= dt
 
@@ -302,6 +304,11 @@ class ParticleEmitter:
     _active_particles = []
     _particle_limit = 500
 
+    @classmethod
+    def active_count(cls):
+        """Number of live particles across all emitters."""
+        return len(cls._active_particles)
+
     def __init__(self, preset_name, emit_rate=30):
         """
         Args:
@@ -335,10 +342,10 @@ class ParticleEmitter:
                 break
 
             # Random properties from preset
-            color = random.choice(preset["colors"])
-            size = random.randint(*preset["size_range"])
-            speed = random.uniform(*preset["speed_range"])
-            lifetime = random.uniform(*preset["lifetime"])
+            color = _rng.choice(preset["colors"])
+            size = _rng.randint(*preset["size_range"])
+            speed = _rng.uniform(*preset["speed_range"])
+            lifetime = _rng.uniform(*preset["lifetime"])
 
             # Direction with spread
             base_dir = direction or preset.get("direction") or (0, 0)
@@ -346,7 +353,7 @@ class ParticleEmitter:
 
             if spread == 360:
                 # Radial burst
-                angle = random.uniform(0, 360)
+                angle = _rng.uniform(0, 360)
             else:
                 # Cone spread
                 base_angle = (
@@ -354,7 +361,7 @@ class ParticleEmitter:
                     if base_dir != (0, 0)
                     else -90
                 )
-                angle = base_angle + random.uniform(-spread / 2, spread / 2)
+                angle = base_angle + _rng.uniform(-spread / 2, spread / 2)
 
             rad = math.radians(angle)
             vx = math.cos(rad) * speed
@@ -488,16 +495,16 @@ class DebrisEmitter:
                 break
 
             # Random spawn position anywhere within rect
-            x = random.uniform(spawn_rect.left, spawn_rect.right)
-            y = random.uniform(spawn_rect.top, spawn_rect.bottom)
+            x = _rng.uniform(spawn_rect.left, spawn_rect.right)
+            y = _rng.uniform(spawn_rect.top, spawn_rect.bottom)
 
             # Random properties
-            color = random.choice(self.colors)
-            size = random.randint(*self.size_range)
-            speed = random.uniform(*self.speed_range)
+            color = _rng.choice(self.colors)
+            size = _rng.randint(*self.size_range)
+            speed = _rng.uniform(*self.speed_range)
 
             # Launch upward with slight horizontal drift
-            vx = random.uniform(-30, 30)
+            vx = _rng.uniform(-30, 30)
             vy = -speed  # Negative = upward
 
             particle = DebrisParticle(
@@ -619,37 +626,37 @@ class ParticleOverlay:
         if self.spawn_area:
             # Custom area: (x, y, width, height)
             ax, ay, aw, ah = self.spawn_area
-            x = random.randint(int(ax), int(ax + aw))
-            y = random.randint(int(ay), int(ay + ah))
+            x = _rng.randint(int(ax), int(ax + aw))
+            y = _rng.randint(int(ay), int(ay + ah))
         else:
             # Edge spawn based on direction
             if direction[1] < 0:  # Moving up
-                x = random.randint(0, self.width)
+                x = _rng.randint(0, self.width)
                 y = self.height + 10
             elif direction[1] > 0:  # Moving down
-                x = random.randint(0, self.width)
+                x = _rng.randint(0, self.width)
                 y = -10
             elif direction[0] < 0:  # Moving left
                 x = self.width + 10
-                y = random.randint(0, self.height)
+                y = _rng.randint(0, self.height)
             elif direction[0] > 0:  # Moving right
                 x = -10
-                y = random.randint(0, self.height)
+                y = _rng.randint(0, self.height)
             else:
-                x = random.randint(0, self.width)
-                y = random.randint(0, self.height)
+                x = _rng.randint(0, self.width)
+                y = _rng.randint(0, self.height)
 
         # Random properties
-        color = random.choice(preset["colors"])
-        size = random.randint(*preset["size_range"])
-        speed = random.uniform(*speed_range)
+        color = _rng.choice(preset["colors"])
+        size = _rng.randint(*preset["size_range"])
+        speed = _rng.uniform(*speed_range)
         lifetime_range = self.lifetime_override or preset.get("lifetime", (1.0, 3.0))
-        lifetime = random.uniform(*lifetime_range)
+        lifetime = _rng.uniform(*lifetime_range)
         spread = preset.get("spread", 0)
 
         # Direction with spread
         base_angle = math.degrees(math.atan2(direction[1], direction[0]))
-        angle = base_angle + random.uniform(-spread / 2, spread / 2)
+        angle = base_angle + _rng.uniform(-spread / 2, spread / 2)
         rad = math.radians(angle)
 
         particle = Particle(
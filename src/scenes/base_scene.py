@@ -26,8 +26,14 @@ class BaseScene(ABC):
         input_context: Input context for this scene ("gameplay" or "ui")
         services: ServiceLocator for accessing managers and systems
         bg_manager: Scene-owned background manager (optional)
+        dirty_rect_present: Present only changed regions (mostly static scenes)
+        cacheable: SceneManager keeps the instance and calls on_reuse() instead
+            of rebuilding it on the next set_scene()
     """
 
+    dirty_rect_present = False
+    cacheable = False
+
     def __init__(self, services):
         """
         Initialize scene with service locator.
@@ -68,6 +74,33 @@ class BaseScene(ABC):
         """Called when scene becomes active."""
         pass
 
+    def on_reuse(self, **scene_data):
+        """
+        Called instead of construction + on_load() when a cached instance
+        is re-entered. Reset per-run state here, keep loaded resources.
+        """
+        self.on_load(**scene_data)
+
+    def on_dispose(self):
+        """
+        Called once after the final on_exit(), when the SceneManager drops
+        the instance (not cached, or evicted). Release global hooks here,
+        e.g. EventManager subscriptions made at construction.
+        """
+        pass
+
+    def preload_steps(self):
+        """
+        Extra loading work to run ahead of on_enter() (set_scene preload).
+
+        Each callable runs in its own slice of a frame while the transition
+        plays; returning False means "not ready, call again next frame".
+
+        Returns:
+            list: Zero-argument callables
+        """
+        return []
+
     def on_pause(self):
         """Called when scene is paused (e.g., pause menu appears)."""
         pass
@@ -84,7 +117,7 @@ class BaseScene(ABC):
     # Background System
     # ===========================================================
 
-    def _setup_background(self, config):
+    def _setup_background(self, config, attach=True):
         """
         Setup scrolling background for this scene.
 
@@ -94,6 +127,9 @@ class BaseScene(ABC):
         Args:
             config: Background configuration dict with 'layers' list
                     Example: {"layers": [{"image": "path.png", "scroll_speed": [0, 30]}]}
+            attach: Hand it to the DrawManager now; pass False while
+                    preloading behind another scene, then call
+                    _attach_background() on activation
         """
 
         if not config or "layers" not in config:
@@ -111,14 +147,19 @@ class BaseScene(ABC):
                 parallax=tuple(layer_config.get("parallax", [0.4, 0.6])),
             )
 
-        # Pass reference to draw manager for rendering
-        self.draw_manager.bg_manager = self.bg_manager
+        if attach:
+            self._attach_background()
 
         DebugLogger.init_sub(
             f"Background initialized for {self.__class__.__name__} "
             f"({self.bg_manager.layer_count} layers)"
         )
 
+    def _attach_background(self):
+        """Pass the background reference to the draw manager for rendering."""
+        if self.draw_manager:
+            self.draw_manager.bg_manager = self.bg_manager
+
     def _update_background(self, dt, focal_point=None):
         """
         Update scrolling background.
@@ -132,14 +173,14 @@ class BaseScene(ABC):
 
     def _clear_background(self):
         """Remove background when leaving scene."""
+        # Clear draw manager reference (unless a preloaded scene already took it)
+        if self.draw_manager and self.draw_manager.bg_manager is self.bg_manager:
+            self.draw_manager.bg_manager = None
+
         if self.bg_manager:
             self.bg_manager.clear_layers()
             self.bg_manager = None
 
-        # Clear draw manager reference
-        if self.draw_manager:
-            self.draw_manager.bg_manager = None
-
         DebugLogger.action(f"Background cleared for {self.__class__.__name__}")
 
     # ===========================================================
@@ -10,6 +10,7 @@ import pygame
 import os
 
 from src.core.runtime.game_settings import Display, Fonts
+from src.graphics.image_formats import load_image
 
 
 def _render_text_or_separator(
@@ -492,15 +493,9 @@ class ImageBlinkRevealAction(CutsceneAction):
 
     def on_start(self):
         # Load and scale image
-        import pygame
         from src.core.runtime.game_settings import Display
 
-        self._surface = pygame.image.load(self.image_path).convert_alpha()
-
-        if self.scale != 1.0:
-            w = int(self._surface.get_width() * self.scale)
-            h = int(self._surface.get_height() * self.scale)
-            self._surface = pygame.transform.smoothscale(self._surface, (w, h))
+        self._surface = load_image(self.image_path, scale=self.scale, smooth=True)
 
         self._rect = self._surface.get_rect(
             center=(Display.WIDTH // 2, Display.HEIGHT // 2 + self.y_offset)
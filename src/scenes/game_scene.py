@@ -18,27 +18,37 @@ Features:
     - Background parallax integration
 """
 
+import os
+import time
+import zlib
+
 import pygame
 
 # Core - Debug & Settings
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.frame_profiler import get_profiler
 from src.core.runtime.game_settings import Debug, Display
 from src.core.runtime.session_stats import get_session_stats
 
 # Core - Runtime & Services
+from src.core.services.asset_loader import get_asset_loader
+from src.core.services.config_manager import load_config_view
 from src.core.services.event_manager import (
     get_events,
     EnemyDiedEvent,
     ScreenShakeEvent,
     SpawnPauseEvent,
+    BulletClearEvent,
     BossDeathEvent,
     BossSpawnEvent,
 )
 
 # Entities
 from src.entities.entity_state import LifecycleState
+from src.entities.entity_types import EntityCategory
 
-# Graphics - Particles
+# Graphics
+from src.graphics.background_manager import DecorationCache
 from src.graphics.particles.particle_manager import ParticleEmitter
 
 # Scenes
@@ -74,8 +84,30 @@ from src.audio.sound_manager import get_sound_manager
 # ===========================================================
 
 MAPS_PATH = "assets/images/maps/"
+
+# Configs whose images are batch-decoded in on_load: (config, image root)
+LEVEL_ASSET_CONFIGS = (
+    ("enemies.json", "assets/images"),
+    ("bullets.json", "assets/images"),
+    ("bosses.json", "assets/images"),
+    ("animations.json", "assets/images"),
+    ("items.json", "assets/images/sprites/items"),
+)
 BGM_PATH = "assets/audio/bgm/"
 
+# Rock decoration scattered over snow maps (cached per level + seed)
+SNOW_DECORATION = {
+    "object_paths": [
+        "assets/images/maps/rock_1.png",
+        "assets/images/maps/rock_2.png",
+        "assets/images/maps/rock_3.png",
+        "assets/images/maps/rock_4.png",
+        "assets/images/maps/rock_5.png",
+    ],
+    "count": 7,
+    "min_distance": 200,
+}
+
 # Default background for levels without explicit config
 DEFAULT_BACKGROUND = {
     "layers": [
@@ -103,6 +135,9 @@ class GameScene(BaseScene):
     animated stat reveals.
     """
 
+    # Kept by SceneManager; re-entry goes through reset_for_level()
+    cacheable = True
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -127,6 +162,15 @@ class GameScene(BaseScene):
         self.current_level_idx = 0
         self.selected_level_id = None
 
+        # --- Preload State ---
+        self._asset_batch = None  # Pending AssetLoader decode batch
+        self._asset_load_start = None  # AssetLoader snapshot for reporting
+        self._prepared_level_id = None  # Level loaded ahead of on_enter()
+        self._current_level_id = None
+
+        # HUD trees built on first entry, re-registered on warm restarts
+        self._hud_elements = []
+
         # --- Game State ---
         self.game_over_shown = False
 
@@ -157,6 +201,11 @@ class GameScene(BaseScene):
 
         DebugLogger.section("GameScene Initialized")
 
+    @property
+    def dirty_rect_present(self):
+        """Frozen frames (pause, game over) present only changed regions."""
+        return self.state == SceneState.PAUSED or self.game_over_shown
+
     def _init_systems(self, services):
         """
         Initialize all game subsystems via GameSystemInitializer.
@@ -176,6 +225,7 @@ class GameScene(BaseScene):
         self.level_manager = systems["level_manager"]
         self.effects_manager = systems["effects_manager"]
         self.hazard_manager = systems["hazard_manager"]
+        self.item_manager = systems["item_manager"]
         self.spawn_manager._effects_manager = self.effects_manager
         self.ui = systems["ui"]
         self.player.services = self.services
@@ -223,17 +273,92 @@ class GameScene(BaseScene):
             else:
                 self.campaign = []
 
+        self._submit_level_assets()
+
+    def preload_steps(self):
+        """
+        Load level data and assets ahead of on_enter() (set_scene preload).
+
+        Returns:
+            list: Steps run by ScenePreloader while the transition plays
+        """
+        return [
+            lambda: self._finish_level_assets(wait=False),
+            lambda: self.ui.loader.preload("hud/player_hud.yaml"),
+            lambda: self.ui.loader.preload("screens/game_over.yaml"),
+            self._prepare_start_level,
+        ]
+
+    def _submit_level_assets(self):
+        """
+        Start decoding this level's images in one threaded batch.
+
+        Covers the level background, entity and item sprites, boss weapons
+        and explosion frames. The normal loaders pick the surfaces up during
+        on_enter() and at spawn time; leftovers are dropped in on_exit().
+        """
+        loader = get_asset_loader()
+        self._asset_load_start = loader.snapshot()
+        paths = []
+
+        level_config = self._select_level_config()
+        if level_config:
+            level_data = load_config_view(level_config.path)
+            layers = self._build_background_config(level_data)["layers"]
+            paths += [layer["image"] for layer in layers]
+
+            decoration = self._get_decoration_cache(
+                level_data, level_config.id, paths[0]
+            )
+            if decoration and os.path.exists(decoration[0]):
+                paths[0] = decoration[0]
+
+        for filename, root in LEVEL_ASSET_CONFIGS:
+            paths += loader.collect_image_paths(load_config_view(filename), root=root)
+
+        self._asset_batch = loader.submit_images(paths)
+
+    def _finish_level_assets(self, wait=True):
+        """
+        Hand the decoded level images to the loaders.
+
+        Args:
+            wait: Block until decoding finishes
+
+        Returns:
+            bool: False if still decoding and wait is False
+        """
+        if self._asset_batch is None:
+            return True
+        if not wait and not self._asset_batch.done():
+            return False
+
+        loader = get_asset_loader()
+        loader.finish_images(self._asset_batch)
+        loader.report("GameScene.on_load", self._asset_load_start)
+        self._asset_batch = None
+        return True
+
     def on_enter(self):
         """
         Start gameplay when scene becomes active.
 
         Called after transition completes. Sets up audio, UI, and starts level.
         """
-        # Audio
+        self._finish_level_assets()
+
+        # Entities are scene-local and cleared when the old scene exits
+        self.services.register_entity("player", self.player)
 
         # UI setup
         self.ui.register_binding("player", self.player)
-        self.ui.load_hud("hud/player_hud.yaml")
+        if self._hud_elements:
+            for element in self._hud_elements:
+                self.ui.register_hud(element)
+        else:
+            hud_start = len(self.ui.hud_elements)
+            self.ui.load_hud("hud/player_hud.yaml")
+            self._hud_elements = self.ui.hud_elements[hud_start:]
         # Hide HUD initially - cutscene will slide it in
         self._hide_hud_for_intro()
         self.ui.load_screen("game_over", "screens/game_over.yaml")
@@ -262,6 +387,7 @@ class GameScene(BaseScene):
             anchor = getattr(element, "parent_anchor", "center")
             offset = self.ui.ANCHOR_TO_OFFSET.get(anchor, (0, -300))
             element._slide_offset = offset
+            element.invalidate()
 
     def _on_boss_spawn(self, event):
         """Play boss intro cinematic."""
@@ -301,8 +427,66 @@ class GameScene(BaseScene):
         ParticleEmitter.clear_all()
         self.effects_manager.clear()
         self._clear_background()
+        get_asset_loader().release_preloaded()
         self.ui.clear_hud()
         self.ui.hide_screen("game_over")
+        # UIManager outlives the scene; its binding would keep the player alive
+        self.ui.unregister_binding("player")
+
+        get_events().unsubscribe(ScreenShakeEvent, self._on_screen_shake)
+        get_events().unsubscribe(BossDeathEvent, self._on_boss_death)
+        get_events().unsubscribe(BossSpawnEvent, self._on_boss_spawn)
+
+    def on_dispose(self):
+        """Unsubscribe the scene and its systems so the instance can be freed."""
+        events = get_events()
+        events.unsubscribe(EnemyDiedEvent, self._on_enemy_died)
+        events.unsubscribe(EnemyDiedEvent, self.player._on_enemy_died)
+        events.unsubscribe(EnemyDiedEvent, self.item_manager.on_enemy_died)
+        events.unsubscribe(BulletClearEvent, self.bullet_manager._on_bullet_clear)
+        events.unsubscribe(
+            SpawnPauseEvent, self.level_manager.wave_scheduler._on_spawn_pause
+        )
+
+    def on_reuse(self, campaign_name=None, level_id=None, **scene_data):
+        """Warm restart from the SceneManager cache."""
+        self.reset_for_level(level_id, campaign_name=campaign_name, **scene_data)
+
+    def reset_for_level(self, level_id=None, campaign_name=None, **scene_data):
+        """
+        Reset per-run state so this instance can play a level again.
+
+        Keeps the player, managers and their pools, loaded images and
+        UI trees; only entities, level progress and player stats reset.
+
+        Args:
+            level_id: Level to start (None = campaign start)
+            campaign_name: Campaign to load
+            **scene_data: Additional scene parameters
+        """
+        start = time.perf_counter()
+
+        # Entities back to their pools
+        self.spawn_manager.reset()
+        self.bullet_manager.clear()
+        self.hazard_manager.clear_all()
+        self.effects_manager.clear()
+
+        # Player and per-run UI state
+        self.player.reset_for_level()
+        self.last_player_level = self.player.level
+        if self.level_up_ui.is_active:
+            self.level_up_ui.hide()
+        self.overlay.alpha = 0
+        self.overlay.fade_out()
+        self.cutscene_manager = CutsceneManager()
+        self._intro_complete = False
+        self.current_level_idx = 0
+
+        self.on_load(campaign_name=campaign_name, level_id=level_id, **scene_data)
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        DebugLogger.state(f"GameScene reset for level {level_id} ({elapsed:.1f}ms)")
 
     def on_pause(self):
         """Pause gameplay and show pause overlay."""
@@ -429,29 +613,62 @@ class GameScene(BaseScene):
             2. First level in campaign
             3. Default start level from registry
         """
+        level_config = self._select_level_config()
+        if level_config:
+            self._load_level(level_config)
+
+    def _select_level_config(self):
+        """
+        Pick the level to start (see _start_level for priority).
+
+        Returns:
+            Level config, or None if nothing is available
+        """
         level_registry = self.services.get_global("level_registry")
 
         # Priority 1: Specific level selected
         if self.selected_level_id:
             level_config = level_registry.get(self.selected_level_id)
             if level_config:
-                self._load_level(level_config)
-                return
+                return level_config
 
         # Priority 2: First level in campaign
         if self.campaign and len(self.campaign) > 0:
-            self._load_level(self.campaign[0])
-            return
+            return self.campaign[0]
 
         # Priority 3: Default start level
-        start_level = level_registry.get_default_start()
-        if start_level:
-            self._load_level(start_level)
+        return level_registry.get_default_start()
 
     def _load_level(self, level_config):
         """
         Load a specific level.
 
+        Args:
+            level_config: Level configuration object with name and path
+        """
+        if self._prepared_level_id != level_config.id:
+            self._prepare_level(level_config)
+        self._prepared_level_id = None
+        self._current_level_id = level_config.id
+        self._attach_background()
+
+        level_data = self.level_manager.get_current_level_data()
+        if level_data:
+            self._load_level_music(level_data)
+
+    def _prepare_start_level(self):
+        """Load the starting level's data and background before on_enter()."""
+        level_config = self._select_level_config()
+        if level_config:
+            self._prepare_level(level_config)
+
+    def _prepare_level(self, level_config):
+        """
+        Load level data and background (everything except music).
+
+        Safe to run before on_enter(): nothing spawns until the scene updates,
+        and the background is only handed to the DrawManager by _load_level().
+
         Args:
             level_config: Level configuration object with name and path
         """
@@ -460,60 +677,103 @@ class GameScene(BaseScene):
 
         # Setup background from level data
         level_data = self.level_manager.get_current_level_data()
+        self.item_manager.set_drop_chance(
+            level_data.get("item_drop_chance") if level_data else None
+        )
         if level_data:
-            self._load_level_background(level_data)
-            self._load_level_music(level_data)
+            self._load_level_background(level_data, level_config.id)
+        self._prepared_level_id = level_config.id
 
-    def _load_level_background(self, level_data):
+    def _load_level_background(self, level_data, level_id=None):
         """
         Load background from level data.
 
         Args:
             level_data: Level data dict with optional 'background' section
+            level_id: Level identifier (keys the decoration cache)
+        """
+        bg_config = self._build_background_config(level_data)
+        base_image_path = bg_config["layers"][0]["image"]
+        decoration = self._get_decoration_cache(level_data, level_id, base_image_path)
+
+        DebugLogger.init(
+            f"[BG Check] Path: {base_image_path}, Is Snow?: {decoration is not None}"
+        )
+
+        if decoration is None:
+            self._setup_background(bg_config, attach=False)
+            return
+
+        cache_path, seed = decoration
+        if os.path.exists(cache_path):
+            layers = [dict(layer) for layer in bg_config["layers"]]
+            layers[0]["image"] = cache_path
+            self._setup_background({"layers": layers}, attach=False)
+            return
+
+        self._setup_background(bg_config, attach=False)
+        if self.bg_manager is None or self.bg_manager.layer_count == 0:
+            return
+
+        base_layer = self.bg_manager.get_layer(0)
+        base_layer.random_scatter_objects(seed=seed, **SNOW_DECORATION)
+        DecorationCache.store(cache_path, base_layer.image)
+
+    def _build_background_config(self, level_data):
+        """
+        Build the background layer config from level data.
+
+        Args:
+            level_data: Level data dict with optional 'background' section
+
+        Returns:
+            dict: {"layers": [...]} with resolved image paths
         """
         default_layer = DEFAULT_BACKGROUND["layers"][0]
 
-        if "background" in level_data:
-            bg_config = {"layers": []}
-            for layer in level_data["background"].get("layers", []):
-                image = layer.get("image", default_layer["image"])
-                if image and not image.startswith("assets/"):
-                    image = MAPS_PATH + image
-
-                merged = {
-                    "image": image,
-                    "scroll_speed": layer.get(
-                        "scroll_speed", default_layer["scroll_speed"]
-                    ),
-                    "parallax": layer.get("parallax", default_layer["parallax"]),
-                }
-                bg_config["layers"].append(merged)
-        else:
-            bg_config = DEFAULT_BACKGROUND
+        if "background" not in level_data:
+            return DEFAULT_BACKGROUND
+
+        bg_config = {"layers": []}
+        for layer in level_data["background"].get("layers", []):
+            image = layer.get("image", default_layer["image"])
+            if image and not image.startswith("assets/"):
+                image = MAPS_PATH + image
+
+            merged = {
+                "image": image,
+                "scroll_speed": layer.get(
+                    "scroll_speed", default_layer["scroll_speed"]
+                ),
+                "parallax": layer.get("parallax", default_layer["parallax"]),
+            }
+            bg_config["layers"].append(merged)
+        return bg_config
+
+    def _get_decoration_cache(self, level_data, level_id, base_image_path):
+        """
+        Get the decoration cache entry for decorated (snow) maps.
 
-        self._setup_background(bg_config)
+        Args:
+            level_data: Level data dict
+            level_id: Level identifier (falls back to the base image path)
+            base_image_path: Resolved path of background layer 0
 
-        is_snow_map = False
-        base_image_path = bg_config["layers"][0]["image"]
-        if "snow" in base_image_path.lower():
-            is_snow_map = True
-
-        DebugLogger.init(f"[BG Check] Path: {base_image_path}, Is Snow?: {is_snow_map}")
-
-        if self.bg_manager.layer_count > 0 and is_snow_map:
-            base_layer = self.bg_manager.get_layer(0)
-
-            rock_images = [
-                "assets/images/maps/rock_1.png",
-                "assets/images/maps/rock_2.png",
-                "assets/images/maps/rock_3.png",
-                "assets/images/maps/rock_4.png",
-                "assets/images/maps/rock_5.png",
-            ]
-            if hasattr(base_layer, "random_scatter_objects"):
-                base_layer.random_scatter_objects(
-                    object_paths=rock_images, count=7, min_distance=200
-                )
+        Returns:
+            tuple: (cache_path, seed), or None if the map is not decorated
+        """
+        if "snow" not in base_image_path.lower():
+            return None
+
+        # Decorated maps are cached as a finished image keyed by level + seed
+        level_id = level_id or base_image_path
+        seed = level_data.get("background", {}).get(
+            "seed", zlib.crc32(str(level_id).encode("utf-8"))
+        )
+        cache_path = DecorationCache.path_for(
+            level_id, seed, base_image_path, **SNOW_DECORATION
+        )
+        return cache_path, seed
 
     def _load_level_music(self, level_data):
         """
@@ -675,6 +935,8 @@ class GameScene(BaseScene):
         Args:
             dt: Delta time in seconds
         """
+        profile = get_profiler().scope
+
         # Track play time
         get_session_stats().add_time(dt)
 
@@ -682,28 +944,39 @@ class GameScene(BaseScene):
         self.draw_manager.update_shake(dt)
 
         # Background parallax
-        player_pos = (self.player.virtual_pos.x, self.player.virtual_pos.y)
-        self._update_background(dt, player_pos)
+        with profile("update.background"):
+            player_pos = (self.player.virtual_pos.x, self.player.virtual_pos.y)
+            self._update_background(dt, player_pos)
 
         # Core systems
-        self.player.update(dt)
-        self.spawn_manager.update(dt)
-        self.bullet_manager.update(dt)
-        self.hazard_manager.update(dt)
-        self.level_manager.update(dt)
-        self.effects_manager.update(dt)
+        with profile("update.player"):
+            self.player.update(dt)
+        with profile("update.spawns"):
+            self.spawn_manager.update(dt)
+        with profile("update.bullets"):
+            self.bullet_manager.update(dt)
+        with profile("update.hazards"):
+            self.hazard_manager.update(dt)
+        with profile("update.level"):
+            self.level_manager.update(dt)
+        with profile("update.effects"):
+            self.effects_manager.update(dt)
 
         # Collision detection
-        self.collision_manager.update()
-        self.collision_manager.detect()
+        with profile("collision.update"):
+            self.collision_manager.update()
+        with profile("collision.detect"):
+            self.collision_manager.detect()
 
         # Entity cleanup
-        self.spawn_manager.cleanup()
-        self.hazard_manager.cleanup()
+        with profile("cleanup"):
+            self.spawn_manager.cleanup()
+            self.hazard_manager.cleanup()
 
         # UI update
-        mouse_pos = self.input_manager.get_effective_mouse_pos()
-        self.ui.update(dt, mouse_pos)
+        with profile("update.ui"):
+            mouse_pos = self.input_manager.get_effective_mouse_pos()
+            self.ui.update(dt, mouse_pos)
 
     # ===========================================================
     # Rendering
@@ -726,22 +999,31 @@ class GameScene(BaseScene):
         Args:
             draw_manager: DrawManager for queuing draws
         """
+        profile = get_profiler().scope
+
         # Game entities
-        self.player.draw(draw_manager)
-        self.spawn_manager.draw()
-        self.bullet_manager.draw(draw_manager)
-        self.hazard_manager.draw()
+        with profile("draw.player"):
+            self.player.draw(draw_manager)
+        with profile("draw.enemies"):
+            self.spawn_manager.draw()
+        with profile("draw.bullets"):
+            self.bullet_manager.draw(draw_manager)
+        with profile("draw.hazards"):
+            self.hazard_manager.draw()
 
         # Screen effects
-        self.effects_manager.draw(draw_manager)
+        with profile("draw.effects"):
+            self.effects_manager.draw(draw_manager)
 
-        ParticleEmitter.render_all(draw_manager)
+        with profile("draw.particles"):
+            ParticleEmitter.render_all(draw_manager)
 
         # Overlay (between game and UI)
         self.overlay.draw(draw_manager)
 
         # UI layers (includes level_up screen when active)
-        self.ui.draw(draw_manager)
+        with profile("draw.ui"):
+            self.ui.draw(draw_manager)
 
         # Cutscene overlays (text, etc)
         self.cutscene_manager.draw(draw_manager)
@@ -788,6 +1070,10 @@ class GameScene(BaseScene):
 
         if action == "resume":
             self.scene_manager.resume_active_scene()
+        elif action == "retry":
+            self.scene_manager.set_scene(
+                "Game", transition=FadeTransition(0.5), level_id=self._current_level_id
+            )
         elif action in ("quit", "return_to_menu"):
             self.scene_manager.set_scene("MainMenu", transition=FadeTransition(0.5))
 
@@ -962,3 +1248,26 @@ class GameScene(BaseScene):
                     elem.mark_dirty()
 
                     DebugLogger.state(f"Revealed stat: {label_id}", category="game")
+
+    # ===========================================================
+    # Diagnostics
+    # ===========================================================
+
+    def profile_context(self):
+        """
+        Describe the running level for profile captures.
+
+        Returns:
+            dict: Level, stage and live entity counts
+        """
+        return {
+            "level": self._current_level_id,
+            "stage": self.level_manager.current_stage_idx,
+            "enemies": len(self.spawn_manager.entities),
+            "items": len(
+                self.spawn_manager.get_entities_by_category(EntityCategory.PICKUP)
+            ),
+            "bullets": len(self.bullet_manager.active),
+            "hazards": len(self.hazard_manager.hazards),
+            "particles": ParticleEmitter.active_count(),
+        }
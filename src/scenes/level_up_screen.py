@@ -5,11 +5,13 @@ Level-up screen using YAML-driven UI system.
 Randomly selects upgrades from JSON config.
 """
 
-import json
-import random
 from pathlib import Path
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.config_manager import load_config
 from src.entities.player.player_effects import EFFECT_HANDLERS
+from src.core.services.rng import get_rng
+
+_rng = get_rng("upgrades")
 
 
 class LevelUp:
@@ -38,8 +40,7 @@ class LevelUp:
         if not path.exists():
             DebugLogger.warn("upgrades.json not found", category="ui")
             return {}
-        with open(path, "r") as f:
-            return json.load(f)
+        return load_config(str(path))
 
     def show(self):
         """Show level-up UI with random upgrade choices."""
@@ -66,7 +67,7 @@ class LevelUp:
         count = min(count, len(upgrade_ids))
 
         # Random selection
-        selected_ids = random.sample(upgrade_ids, count)
+        selected_ids = _rng.sample(upgrade_ids, count)
 
         # Build choice list with full data
         self.current_choices = []
@@ -16,6 +16,8 @@ from src.graphics.particles.particle_manager import ParticleOverlay
 class MainMenuScene(BaseScene):
     """Main menu scene with navigation."""
 
+    dirty_rect_present = True
+
     BACKGROUNDS_PATH = "assets/images/backgrounds/"
 
     BACKGROUND_CONFIG = {
@@ -11,6 +11,8 @@ from src.scenes.transitions.transitions import FadeTransition
 class MissionSelectScene(BaseScene):
     """Mission selection scene."""
 
+    dirty_rect_present = True
+
     BACKGROUNDS_PATH = "assets/images/backgrounds/"
 
     BACKGROUND_CONFIG = {
@@ -67,7 +69,7 @@ class MissionSelectScene(BaseScene):
         if action and action.startswith("select_level_"):
             level_id = action.replace("select_level_", "")
             self.scene_manager.set_scene(
-                "Game", transition=FadeTransition(0.5), level_id=level_id
+                "Game", transition=FadeTransition(0.5), preload=True, level_id=level_id
             )
 
         elif action == "back":
@@ -12,6 +12,8 @@ from src.audio.sound_manager import get_sound_manager
 class SettingsScene(BaseScene):
     """Settings menu scene."""
 
+    dirty_rect_present = True
+
     BACKGROUNDS_PATH = "assets/images/backgrounds/"
 
     BACKGROUND_CONFIG = {
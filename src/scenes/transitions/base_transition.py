@@ -21,6 +21,9 @@ class BaseTransition(ABC):
         self.elapsed = 0.0
         self.complete = False
 
+        # False while the next scene is still preloading (transition holds)
+        self.ready = True
+
     @abstractmethod
     def update(self, dt: float) -> bool:
         """
@@ -18,7 +18,7 @@ class InstantTransition(BaseTransition):
         self.complete = True
 
     def update(self, dt: float) -> bool:
-        return True
+        return self.ready
 
     def draw(self, draw_manager, old_scene, new_scene):
         if new_scene:
@@ -36,6 +36,12 @@ class FadeTransition(BaseTransition):
 
     def update(self, dt: float) -> bool:
         self.elapsed += dt
+
+        # Hold on the solid color until the preloaded scene is ready
+        if not self.ready:
+            self.elapsed = min(self.elapsed, self._half)
+            return False
+
         if self.elapsed >= self.duration:
             self.complete = True
             return True
@@ -81,6 +87,7 @@ class UIFadeOverlay:
         self.alpha = 0
         self._target = 0
         self._speed = 500
+        self._drawn_alpha = 0
 
     def fade_in(self, speed=500):
         self._target = self.max_alpha
@@ -98,7 +105,12 @@ class UIFadeOverlay:
 
     def draw(self, draw_manager):
         if self.alpha > 0:
-            self.surface.fill((*self.color[:3], int(self.alpha)))
+            alpha = int(self.alpha)
+            if alpha != self._drawn_alpha:
+                # Same surface refilled in place: flag it for dirty-rect tracking
+                self.surface.fill((*self.color[:3], alpha))
+                draw_manager.mark_dirty(self.surface.get_rect())
+                self._drawn_alpha = alpha
             draw_manager.queue_draw(
                 self.surface, self.surface.get_rect(), layer=Layers.OVERLAY
             )
@@ -5,11 +5,11 @@ Expanding pulse that freezes entities, then detonates them.
 """
 
 import math
-import random
 import pygame
 
 from src.core.runtime.game_settings import Display, Layers
 from src.core.debug.debug_logger import DebugLogger
+from src.core.debug.event_trace import get_tracer
 
 from src.core.services.event_manager import (
     get_events,
@@ -22,6 +22,9 @@ from src.entities.entity_state import InteractionState, LifecycleState
 from src.entities.entity_types import EntityCategory
 
 from src.graphics.particles.particle_manager import ParticleEmitter
+from src.core.services.rng import get_rng
+
+_rng = get_rng("effects")
 
 
 class PulseState:
@@ -93,6 +96,7 @@ class NukePulse:
         get_events().dispatch(SpawnPauseEvent(paused=True))
 
         DebugLogger.action("Nuke pulse expanding...", category="effects")
+        get_tracer().instant("nuke.fire", "effects", {"center": list(center)})
 
     @property
     def active(self):
@@ -162,7 +166,7 @@ class NukePulse:
             self._detonate_index = 0
 
             # Shuffle for random explosion order
-            random.shuffle(self._frozen_entities)
+            _rng.shuffle(self._frozen_entities)
 
             # Pre-calculate explosion times (accelerating curve)
             self._explosion_times = self._generate_explosion_times(
@@ -181,6 +185,9 @@ class NukePulse:
                 )
 
             DebugLogger.action("Nuke detonation starting...", category="effects")
+            get_tracer().instant(
+                "nuke.detonate", "effects", {"frozen": len(self._frozen_entities)}
+            )
 
     def _update_detonating(self, dt):
         """Shake frozen entities, explode one by one."""
@@ -197,8 +204,8 @@ class NukePulse:
 
             orig_pos = self._original_positions.get(id(entity))
             if orig_pos:
-                offset_x = random.uniform(-shake_intensity, shake_intensity)
-                offset_y = random.uniform(-shake_intensity, shake_intensity)
+                offset_x = _rng.uniform(-shake_intensity, shake_intensity)
+                offset_y = _rng.uniform(-shake_intensity, shake_intensity)
                 entity.pos.x = orig_pos[0] + offset_x
                 entity.pos.y = orig_pos[1] + offset_y
                 entity.sync_rect()
@@ -273,6 +280,9 @@ class NukePulse:
         DebugLogger.action(
             f"Nuke detonated {len(self._frozen_entities)} enemies!", category="effects"
         )
+        get_tracer().instant(
+            "nuke.finished", "effects", {"detonated": len(self._frozen_entities)}
+        )
 
         self._frozen_entities.clear()
         self._original_positions.clear()
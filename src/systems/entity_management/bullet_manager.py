@@ -13,11 +13,12 @@ Responsibilities
 
 import pygame
 import math
-import os
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.asset_bundle import asset_exists
 
 from src.core.services.event_manager import get_events, BulletClearEvent
+from src.graphics.image_formats import load_image
 
 from src.entities.bullets.bullet_straight import StraightBullet
 from src.entities.entity_state import LifecycleState
@@ -241,6 +242,14 @@ class BulletManager:
         if damage is None:
             damage = config.get("damage", 1)
 
+        # Plain straight bullets come from the pool like spawn()
+        if bullet_class is StraightBullet and not kwargs:
+            bullet = self._get_bullet(
+                pos, vel, image, color, radius, owner, damage, hitbox_scale
+            )
+            self.active.append(bullet)
+            return bullet
+
         try:
             bullet = bullet_class(
                 pos,
@@ -297,8 +306,7 @@ class BulletManager:
                     category="combat",
                 )
                 bullet.death_state = LifecycleState.DEAD
-                self._unregister_hitbox(bullet)
-                self.pool.append(bullet)
+                self._recycle(bullet)
                 continue
 
             # Lifecycle
@@ -308,8 +316,7 @@ class BulletManager:
                 next_active.append(bullet)
             else:
                 bullet.death_state = LifecycleState.DEAD
-                self._unregister_hitbox(bullet)
-                self.pool.append(bullet)
+                self._recycle(bullet)
 
         self.active = next_active
 
@@ -346,6 +353,13 @@ class BulletManager:
         if self.collision_manager:
             self.collision_manager.unregister_hitbox(bullet)
 
+    def _recycle(self, bullet):
+        """Stop tracking a dead bullet; pool it if it can be reused."""
+        self._unregister_hitbox(bullet)
+        # The pool only serves StraightBullets (see _get_bullet)
+        if type(bullet) is StraightBullet:
+            self.pool.append(bullet)
+
     # ===========================================================
     # Cleanup
     # ===========================================================
@@ -357,8 +371,7 @@ class BulletManager:
             if b.death_state < LifecycleState.DEAD:
                 cleaned.append(b)
             else:
-                self._unregister_hitbox(b)
-                self.pool.append(b)
+                self._recycle(b)
 
         self.active = cleaned
         removed = before - len(self.active)
@@ -368,6 +381,12 @@ class BulletManager:
                 f"Cleaned up {removed} inactive bullets", category="entity_cleanup"
             )
 
+    def clear(self):
+        """Return every active bullet to the pool (level restart)."""
+        for b in self.active:
+            b.death_state = LifecycleState.DEAD
+        self.cleanup()
+
     def _on_bullet_clear(self, event: BulletClearEvent):
         """Clear bullets matching owner within radius of center."""
         cleared = 0
@@ -427,10 +446,9 @@ class BulletManager:
         _NULL_IMAGE_PATH = "assets/images/null.png"
 
         # Try loading specified path
-        if path and os.path.exists(path):
+        if path and asset_exists(path):
             try:
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, size)
+                img = load_image(path, size=size, sprite=True)
                 self._bullet_images[owner] = img
                 return img
             except pygame.error as e:
@@ -439,10 +457,9 @@ class BulletManager:
                 )
 
         # Fallback to null.png
-        if os.path.exists(_NULL_IMAGE_PATH):
+        if asset_exists(_NULL_IMAGE_PATH):
             try:
-                img = pygame.image.load(_NULL_IMAGE_PATH).convert_alpha()
-                img = pygame.transform.scale(img, size)
+                img = load_image(_NULL_IMAGE_PATH, size=size, sprite=True)
                 self._bullet_images[owner] = img
                 return img
             except pygame.error:
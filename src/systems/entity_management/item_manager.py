@@ -11,7 +11,6 @@ Responsibilities
 - Handle item spawning via SpawnManager
 """
 
-import random
 from enum import Enum
 import pygame
 import os
@@ -19,6 +18,11 @@ import os
 from src.core.services.event_manager import get_events, EnemyDiedEvent
 from src.core.services.config_manager import load_config
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.asset_bundle import asset_exists
+from src.graphics.image_formats import load_image
+from src.core.services.rng import get_rng
+
+_rng = get_rng("items")
 
 
 # ===========================================================
@@ -46,6 +50,7 @@ class ItemManager:
 
     ASSET_BASE_PATH = "assets/images/sprites/items/"
     DEFAULT_ITEM_SIZE = (48, 48)
+    DEFAULT_DROP_CHANCE = 0.35
 
     def __init__(self, spawn_manager, item_data_path: str):
         """
@@ -60,6 +65,7 @@ class ItemManager:
         self._loot_table_ids = []
         self._loot_table_weights = []
         self._fallback_image = None
+        self.drop_chance = self.DEFAULT_DROP_CHANCE  # Per mission ("item_drop_chance")
 
         # Load and build loot system
         self._load_item_definitions(item_data_path)
@@ -117,9 +123,9 @@ class ItemManager:
     def _load_fallback_image(self) -> None:
         """Load fallback dummy_item image."""
         fallback_path = "assets/images/null.png"
-        if os.path.exists(fallback_path):
+        if asset_exists(fallback_path):
             try:
-                self._fallback_image = pygame.image.load(fallback_path).convert_alpha()
+                self._fallback_image = load_image(fallback_path, sprite=True)
                 DebugLogger.init_sub("Loaded fallback image")
             except Exception as e:
                 DebugLogger.warn(f"Failed loading fallback: {e}")
@@ -130,8 +136,18 @@ class ItemManager:
 
     def on_enemy_died(self, event: EnemyDiedEvent) -> None:
         """Handle enemy death event - try to spawn item."""
-        # For now, use hardcoded 15% drop chance
-        self.try_spawn_random_item(position=event.position, drop_chance=0.35)
+        self.try_spawn_random_item(
+            position=event.position, drop_chance=self.drop_chance
+        )
+
+    def set_drop_chance(self, chance=None) -> None:
+        """
+        Set the chance that a killed enemy drops an item.
+
+        Args:
+            chance: 0.0 - 1.0 (None = DEFAULT_DROP_CHANCE)
+        """
+        self.drop_chance = self.DEFAULT_DROP_CHANCE if chance is None else chance
 
     # ===========================================================
     # Spawning Logic
@@ -140,7 +156,7 @@ class ItemManager:
     def try_spawn_random_item(self, position: tuple, drop_chance: float) -> None:
         """Attempt to spawn a random item based on drop chance."""
         # Roll for drop
-        if random.random() > drop_chance:
+        if _rng.random() > drop_chance:
             return
 
         # Check if loot table has items
@@ -149,7 +165,7 @@ class ItemManager:
             return
 
         # Select random item using weights
-        selected_item = random.choices(
+        selected_item = _rng.choices(
             self._loot_table_ids, weights=self._loot_table_weights, k=1
         )[0]
 
@@ -190,9 +206,9 @@ class ItemManager:
         item_data = self._item_definitions.get(item_id, {})
         size = item_data.get("size")
 
-        if os.path.exists(asset_path):
+        if asset_exists(asset_path):
             try:
-                img = pygame.image.load(asset_path).convert_alpha()
+                img = load_image(asset_path, sprite=True)
 
                 # Do NOT scale here. Raw sprite only.
                 self._image_cache[asset_path] = img
@@ -13,6 +13,7 @@ Responsibilities
 """
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.rng import preserved_state
 from src.systems.entity_management.entity_registry import EntityRegistry
 from src.entities.entity_state import LifecycleState
 from src.entities.base_entity import BaseEntity
@@ -103,10 +104,12 @@ class SpawnManager:
                     category="entity_spawn",
                 )
 
-        # Create test instance to validate structure
-        test_entity = EntityRegistry.create(
-            category, type_name, -9999, -9999, draw_manager=self.draw_manager
-        )
+        # Create test instance to validate structure (its constructor's RNG
+        # draws must not shift the run, since validation happens once per process)
+        with preserved_state():
+            test_entity = EntityRegistry.create(
+                category, type_name, -9999, -9999, draw_manager=self.draw_manager
+            )
 
         if not test_entity:
             DebugLogger.warn(
@@ -490,9 +493,15 @@ class SpawnManager:
         """
         for entity in self.entities:
             entity.death_state = LifecycleState.DEAD
+            if self.collision_manager:
+                self.collision_manager.unregister_hitbox(entity)
+                for part in getattr(entity, "parts", {}).values():
+                    self.collision_manager.unregister_hitbox(part)
             self._return_to_pool(entity)
 
         self.entities.clear()
+        self._alive_cache = []
+        self._alive_cache_dirty = False
         # Note: Keep _validated_types - entity classes don't change between missions
         # Clear only if you want to re-validate (e.g., for hot-reload debugging)
         DebugLogger.system(
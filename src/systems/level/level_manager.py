@@ -17,6 +17,7 @@ Responsibilities
 """
 
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.config_manager import load_config
 
 
 class LevelManager:
@@ -43,6 +44,7 @@ class LevelManager:
 
         # Level data storage (for background config, etc.)
         self.current_level_data = {}
+        self.timeline = ()  # Compiled waves per stage
 
         # Callback
         self.on_level_complete = None
@@ -64,12 +66,12 @@ class LevelManager:
             )
             return
 
-        # Load and store level data for background/config access
-        import json
+        # Drop leftovers from a previous run (warm restart)
+        self.wave_scheduler.reset()
 
+        # Load and store level data for background/config access
         try:
-            with open(level_path, "r") as f:
-                self.current_level_data = json.load(f)
+            self.current_level_data = load_config(level_path, strict=True)
         except Exception as e:
             DebugLogger.warn(
                 f"Failed to load level data from {level_path}: {e}", category="level"
@@ -79,6 +81,7 @@ class LevelManager:
 
         # Load stages into stage_loader
         self.stage_loader.load(level_path)
+        self.timeline = self.wave_scheduler.compile_level(level_path, self.stage_loader)
 
         if not self.stage_loader.stages:
             DebugLogger.warn(
@@ -107,8 +110,8 @@ class LevelManager:
             f"[ STAGE {stage_idx + 1}/{len(self.stage_loader.stages)} START ]: {stage_name}"
         )
 
-        # Parse and load waves
-        waves = self.stage_loader.parse_timeline(stage)
+        # Load pre-compiled waves
+        waves = self.timeline[stage_idx]
         self.wave_scheduler.load_waves(waves)
 
         # Load trigger
@@ -18,7 +18,7 @@ Performance
 - Campaign ordering: O(1) list access
 """
 
-from src.core.services.config_manager import load_config, _resolve_search_path
+from src.core.services.config_manager import load_config, _resolve_path
 from src.core.debug.debug_logger import DebugLogger
 
 
@@ -41,7 +41,7 @@ class LevelConfig:
         """
         self.id = level_id
         path = data["path"]
-        self.path = _resolve_search_path(path)
+        self.path = _resolve_path(path)
         self.name = data.get("name", level_id)
         self.unlocked = data.get("unlocked", False)
         self.campaign = data.get("campaign", None)
@@ -143,6 +143,23 @@ class LevelRegistry:
             DebugLogger.fail(f"Failed to load config: {e}")
             cls._initialized = False
 
+    @classmethod
+    def register(cls, level_id: str, data: dict):
+        """
+        Add or replace a single mission at runtime (e.g. generated missions).
+
+        Args:
+            level_id: Unique identifier for the level
+            data: Same fields as a Campaigns.json mission entry
+
+        Returns:
+            LevelConfig: The registered config
+        """
+        config = LevelConfig(level_id, data)
+        cls._levels[level_id] = config
+        DebugLogger.state(f"Registered mission '{level_id}'", category="loading")
+        return config
+
     # ===========================================================
     # Lookup Methods
     # ===========================================================
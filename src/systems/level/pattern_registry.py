@@ -7,7 +7,9 @@ Decouples spawn positioning logic from level config.
 Performance
 -----------
 All patterns are pure functions - zero state, zero overhead.
-Called only during wave spawn (not per-frame).
+Results are memoized by their inputs, so a formation reused across a
+mission (or a restart) is computed once. Positions come back as
+immutable tuples shared between callers.
 
 Usage
 -----
@@ -18,6 +20,9 @@ PatternRegistry.register("line", pattern_line)
 positions = PatternRegistry.get_positions("line", count=5, width=1280)
 """
 
+import json
+from types import MappingProxyType
+
 from src.core.debug.debug_logger import DebugLogger
 
 
@@ -26,6 +31,13 @@ class PatternRegistry:
 
     _patterns = {}
 
+    # Memoized positions: {(name, count, width, height, config_key): tuple},
+    # oldest entry evicted once MEMO_SIZE is reached
+    _memo = {}
+    _memo_hits = 0
+    _memo_misses = 0
+    MEMO_SIZE = 256
+
     @classmethod
     def register(cls, name, pattern_func):
         """
@@ -36,6 +48,7 @@ class PatternRegistry:
             pattern_func (callable): Function(count, width, **kwargs) -> [(x, y), ...] or [(x, y, metadata), ...]
         """
         cls._patterns[name] = pattern_func
+        cls.clear_cache()
         DebugLogger.system(f"Registered pattern: {name}")
 
     @classmethod
@@ -51,15 +64,48 @@ class PatternRegistry:
             config (dict): Pattern configuration with optional edge/offset
 
         Returns:
-            list: List of (x, y) or (x, y, metadata) tuples
+            tuple: (x, y) or (x, y, metadata) tuples (read-only, shared)
         """
         pattern_func = cls._patterns.get(pattern_name)
 
         if not pattern_func:
             DebugLogger.warn(f"Unknown pattern '{pattern_name}', using fallback")
-            return [(width / 2, -100)] * count
+            return ((width / 2, -100),) * count
+
+        key = (pattern_name, count, width, height, _config_key(config))
+        positions = cls._memo.get(key)
+        if positions is not None:
+            cls._memo_hits += 1
+            return positions
+
+        cls._memo_misses += 1
+        positions = tuple(
+            _freeze_position(pos) for pos in pattern_func(count, width, height, config)
+        )
+        if len(cls._memo) >= cls.MEMO_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cls._memo[next(iter(cls._memo))]
+        cls._memo[key] = positions
+        return positions
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop memoized positions (e.g. after re-registering a pattern)."""
+        cls._memo.clear()
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Get memo statistics.
 
-        return pattern_func(count, width, height, config)
+        Returns:
+            dict: {"size", "hits", "misses"}
+        """
+        return {
+            "size": len(cls._memo),
+            "hits": cls._memo_hits,
+            "misses": cls._memo_misses,
+        }
 
     @classmethod
     def list_patterns(cls):
@@ -67,6 +113,27 @@ class PatternRegistry:
         return list(cls._patterns.keys())
 
 
+def _freeze_position(pos):
+    """Make a pattern result entry immutable (metadata becomes read-only)."""
+    if len(pos) == 3:
+        return (pos[0], pos[1], MappingProxyType(pos[2]))
+    return tuple(pos)
+
+
+def _config_key(config):
+    """Canonical, hashable form of a pattern config."""
+    if not config:
+        return ()
+    # Flat scalar configs (the common case) hash directly; the value type
+    # is part of the key because 1, 1.0 and True compare and hash equal
+    key = tuple((k, v.__class__, v) for k, v in sorted(config.items()))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return json.dumps(config, sort_keys=True, separators=(",", ":"), default=repr)
+
+
 # ===========================================================
 # Built-in Formation Patterns
 # ===========================================================
@@ -96,7 +163,8 @@ def pattern_line(count, game_width, game_height, config, **_):
     spacing = config.get("spacing")
     cross = config.get("cross", False)
 
-    positions = []
+    # One metadata dict shared by every point
+    metadata = {"use_auto_direction": cross}
 
     if edge in ["top", "bottom"]:
         # Horizontal line
@@ -104,23 +172,17 @@ def pattern_line(count, game_width, game_height, config, **_):
             spacing = game_width // (count + 1)
 
         base_y = offset if edge == "top" else game_height + offset
+        return [(spacing * i, base_y, metadata) for i in range(1, count + 1)]
 
-        for i in range(count):
-            x = spacing * (i + 1)
-            positions.append((x, base_y, {"use_auto_direction": cross}))
-
-    elif edge in ["left", "right"]:
+    if edge in ["left", "right"]:
         # Vertical line
         if spacing is None:
             spacing = game_height // (count + 1)
 
         base_x = offset if edge == "left" else game_width + offset
+        return [(base_x, spacing * i, metadata) for i in range(1, count + 1)]
 
-        for i in range(count):
-            y = spacing * (i + 1)
-            positions.append((base_x, y, {"use_auto_direction": cross}))
-
-    return positions
+    return []
 
 
 def pattern_v(count, game_width, game_height, config, **_):
@@ -145,31 +207,28 @@ def pattern_v(count, game_width, game_height, config, **_):
     y_spacing = config.get("y_spacing", 40)
     tip_depth = config.get("tip_depth", 120)
 
-    positions = []
+    metadata = {"use_auto_direction": False}
+    rels = [i - (count - 1) / 2 for i in range(count)]
 
     if edge in ["top", "bottom"]:
         # Horizontal V
         center_x = game_width // 2
-        base_y = offset if edge == "top" else game_height + offset
-
-        for i in range(count):
-            rel = i - (count - 1) / 2
-            x = center_x + rel * x_spacing
-            y = base_y + tip_depth - abs(rel) * y_spacing
-            positions.append((x, y, {"use_auto_direction": False}))
+        tip_y = (offset if edge == "top" else game_height + offset) + tip_depth
+        return [
+            (center_x + rel * x_spacing, tip_y - abs(rel) * y_spacing, metadata)
+            for rel in rels
+        ]
 
-    elif edge in ["left", "right"]:
+    if edge in ["left", "right"]:
         # Vertical V (rotated 90°)
-        base_x = offset if edge == "left" else game_width + offset
         center_y = game_height // 2
+        tip_x = (offset if edge == "left" else game_width + offset) + tip_depth
+        return [
+            (tip_x - abs(rel) * y_spacing, center_y + rel * x_spacing, metadata)
+            for rel in rels
+        ]
 
-        for i in range(count):
-            rel = i - (count - 1) / 2
-            y = center_y + rel * x_spacing
-            x = base_x + tip_depth - abs(rel) * y_spacing
-            positions.append((x, y, {"use_auto_direction": False}))
-
-    return positions
+    return []
 
 
 # ===========================================================
@@ -0,0 +1,227 @@
+"""
+stress_mission.py
+-----------------
+Generates synthetic missions with parameterized load for scaling tests.
+
+The real missions never come close to the engine's limits. A stress
+mission is ordinary mission JSON (same schema as src/config/missions),
+so it runs through the real loader, timeline compiler and wave scheduler.
+
+Knobs (StressConfig):
+- Enemies per second, grouped into formation waves
+- Share of homing enemies and of waypoint shooters
+- Shots per second per shooter (enemy bullet rate)
+- Item drop chance on kills (mission-level "item_drop_chance")
+
+Usage:
+    config = StressConfig(enemies_per_second=20, homing_ratio=0.5)
+    path = write_stress_mission(config, ".cache/stress/dense.json")
+    level_id = register_stress_mission(path)
+    loop.start_mission(level_id)
+
+See stress_ramp.py for the driver that searches for the sustainable load.
+"""
+
+import json
+import os
+import random
+from dataclasses import asdict, dataclass
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Display
+from src.systems.level.level_registry import LevelRegistry
+from src.systems.level.pattern_registry import PatternRegistry
+
+# "single" = individual spawns along an edge, others are PatternRegistry names
+SINGLE = "single"
+
+# Screen area waypoint shooters patrol (fractions of width / height)
+_PATROL_X = (0.1, 0.9)
+_PATROL_Y = (0.1, 0.55)
+
+
+@dataclass
+class StressConfig:
+    """Load parameters for a generated mission."""
+
+    enemies_per_second: float = 4.0
+    duration: float = 60.0  # Seconds of spawning
+    group_size: int = 5  # Enemies per wave
+    formations: tuple = ("line", "v", SINGLE)  # Cycled wave by wave
+    homing_ratio: float = 0.2  # Share of homing enemies
+    shooter_ratio: float = 0.1  # Share of waypoint shooters
+    shots_per_second: float = 0.7  # Per waypoint shooter
+    item_drop_chance: float = 0.35
+    enemy_hp: float = None  # None = entity default
+    enemy_speed: float = 200.0  # Straight enemies, pixels per second
+    seed: int = 0  # Layout randomness (wave mix, positions)
+
+
+# ===========================================================
+# Generation
+# ===========================================================
+
+
+def generate_stress_mission(config: StressConfig) -> dict:
+    """
+    Build mission data for a stress configuration.
+
+    Args:
+        config: Load parameters
+
+    Returns:
+        dict: Mission JSON data (one stage)
+
+    Raises:
+        ValueError: Non-positive rates or sizes, ratios summing above 1,
+                    or an unknown formation
+    """
+    _validate(config)
+
+    rng = random.Random(config.seed)
+    interval = config.group_size / config.enemies_per_second
+    wave_count = max(1, int(config.duration / interval))
+
+    timeline = {}
+    for i in range(wave_count):
+        time_key = f"{1.0 + i * interval:.3f}"
+        formation = config.formations[i % len(config.formations)]
+        timeline.setdefault(time_key, []).append(_make_wave(config, formation, rng))
+
+    name = (
+        f"Stress {config.enemies_per_second:g}/s "
+        f"(homing {config.homing_ratio:.0%}, shooters {config.shooter_ratio:.0%})"
+    )
+    return {
+        "generated": {"generator": "stress_mission", "config": asdict(config)},
+        "item_drop_chance": config.item_drop_chance,
+        "background": {"layers": [{"image": "test_background.png"}]},
+        "stages": [
+            {
+                "name": name,
+                "exit_trigger": "all_waves_cleared",
+                "timeline": timeline,
+            }
+        ],
+    }
+
+
+def _validate(config):
+    """Reject configurations the generator cannot lay out."""
+    if config.enemies_per_second <= 0 or config.group_size < 1 or config.duration <= 0:
+        raise ValueError("enemies_per_second, group_size and duration must be positive")
+    if config.homing_ratio < 0 or config.shooter_ratio < 0:
+        raise ValueError("Ratios must not be negative")
+    if config.homing_ratio + config.shooter_ratio > 1.0:
+        raise ValueError("homing_ratio + shooter_ratio must not exceed 1")
+    if config.shots_per_second <= 0:
+        raise ValueError("shots_per_second must be positive")
+
+    known = set(PatternRegistry.list_patterns()) | {SINGLE}
+    unknown = [f for f in config.formations if f not in known]
+    if not config.formations or unknown:
+        raise ValueError(f"Unknown formations {unknown}; available: {sorted(known)}")
+
+
+def _make_wave(config, formation, rng):
+    """One wave entry, its enemy type drawn by the configured ratios."""
+    roll = rng.random()
+    if roll < config.shooter_ratio:
+        wave = _shooter_wave(config, rng)
+    elif roll < config.shooter_ratio + config.homing_ratio:
+        wave = {
+            "enemy": "homing_slow",
+            "enemy_params": {"speed": 150, "size": 20},
+            "movement": {"type": "homing"},
+        }
+    else:
+        wave = {
+            "enemy": "straight",
+            "enemy_params": {
+                "speed": config.enemy_speed,
+                "size": 15,
+                "direction": [0, 1],
+            },
+            "movement": {"type": "straight"},
+        }
+
+    if config.enemy_hp is not None:
+        wave["enemy_params"]["hp"] = config.enemy_hp
+
+    wave.update(
+        {
+            "spawn_edge": "top",
+            "spawn_position": round(rng.uniform(0.1, 0.9), 3),
+            "spawn_offset_y": -60,
+            "count": config.group_size,
+        }
+    )
+    if formation != SINGLE:
+        wave["formation"] = formation
+        wave["formation_config"] = {"spacing": 90, "x_spacing": 90}
+    return wave
+
+
+def _shooter_wave(config, rng):
+    """Waypoint shooter wave patrolling a random loop in the upper screen."""
+    width, height = Display.WIDTH, Display.HEIGHT
+    waypoints = [
+        [
+            round(rng.uniform(*_PATROL_X) * width),
+            round(rng.uniform(*_PATROL_Y) * height),
+        ]
+        for _ in range(4)
+    ]
+    return {
+        "enemy": "waypoint_shooter",
+        "enemy_params": {
+            "waypoints": waypoints,
+            "shoot_interval": round(1.0 / config.shots_per_second, 4),
+        },
+    }
+
+
+# ===========================================================
+# Output
+# ===========================================================
+
+
+def write_stress_mission(config: StressConfig, path: str) -> str:
+    """
+    Generate a mission and write it as JSON.
+
+    Args:
+        config: Load parameters
+        path: Output file (directories are created)
+
+    Returns:
+        str: Absolute path written
+    """
+    data = generate_stress_mission(config)
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+    waves = sum(len(w) for w in data["stages"][0]["timeline"].values())
+    DebugLogger.system(f"Stress mission written: {path} ({waves} waves)")
+    return path
+
+
+def register_stress_mission(path: str, level_id=None) -> str:
+    """
+    Make a generated mission startable by ID (not part of any campaign).
+
+    Args:
+        path: Mission JSON written by write_stress_mission
+        level_id: ID to register (default: file name without extension)
+
+    Returns:
+        str: Registered level ID
+    """
+    level_id = level_id or os.path.splitext(os.path.basename(path))[0]
+    LevelRegistry.register(
+        level_id,
+        {"path": os.path.abspath(path), "name": level_id, "unlocked": True},
+    )
+    return level_id
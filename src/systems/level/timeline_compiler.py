@@ -0,0 +1,591 @@
+"""
+timeline_compiler.py
+--------------------
+Compiles mission timelines into pre-resolved spawn tables.
+
+Responsibilities
+----------------
+- Validate wave entries once, at level load
+- Resolve spawn positions (edge, formation, pattern)
+- Resolve movement configs and final per-spawn params
+- Cache compiled missions on disk (Cache.TIMELINES)
+
+Each stage compiles to a tuple of CompiledWave records sorted by time,
+so WaveScheduler only walks an index and calls spawn(). Parts that depend
+on live state stay symbolic:
+- refs: manager/player references injected at spawn time
+- aim_player: direction toward the player, computed at spawn time
+- source: raw wave kept for randomized edge spawns, resolved when the
+  wave triggers so every run still rolls new positions
+
+Snapshots are keyed by mission path and validated against the source
+file's mtime/size, the game area size and COMPILER_VERSION. Bump the
+version when pattern or param resolution changes.
+"""
+
+import marshal
+import os
+import time
+from collections import namedtuple
+
+import pygame
+
+from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Cache
+from src.systems.level.pattern_registry import PatternRegistry
+from src.core.services.rng import get_rng
+
+_rng = get_rng("spawns")
+
+COMPILER_VERSION = 2
+
+# Level-specific enemy_params overrides (stats live in enemies.json)
+ALLOWED_PARAMS = {
+    "waypoints",
+    "direction",
+    "player_ref",
+    "spawn_edge",
+    # Waypoint shooter params
+    "shoot_interval",
+    "bullet_speed",
+    "waypoint_speed",
+}
+
+CompiledWave = namedtuple(
+    "CompiledWave",
+    "time category entity_type pattern count spawns refs aim_player precise source",
+)
+CompiledWave.__doc__ = """
+Fully resolved wave.
+
+Fields:
+    time: Stage time in seconds
+    category: "enemy" or "pickup"
+    entity_type: Registered entity type name
+    pattern: Position mode label (for logging)
+    count: Requested spawn count
+    spawns: Tuple of (x, y, params), or None if resolved at trigger time
+    refs: Param names to inject from live objects (player_ref, ...)
+    aim_player: Replace each spawn's direction with one toward the player
+    precise: Spawn on its exact tick, ignoring the spawn budget
+    source: Raw wave dict for trigger-time resolution, else None
+"""
+
+
+class TimelineCompiler:
+    """Turns stage timelines into sorted CompiledWave tables."""
+
+    def __init__(self, display=None, cache_dir=None):
+        """
+        Initialize compiler.
+
+        Args:
+            display: DisplayManager for game area size (default 1280x720)
+            cache_dir: Snapshot directory (default Cache.TIMELINES)
+        """
+        self.display = display
+        self.cache_dir = cache_dir or Cache.TIMELINES
+
+    @property
+    def game_size(self):
+        """Current game area (width, height)."""
+        if self.display:
+            return (
+                getattr(self.display, "game_width", 1280),
+                getattr(self.display, "game_height", 720),
+            )
+        return 1280, 720
+
+    # ===========================================================
+    # Level Compilation
+    # ===========================================================
+
+    def compile_level(self, level_path, stage_loader):
+        """
+        Compile every stage of a loaded level, using the disk cache.
+
+        Args:
+            level_path: Mission file path (cache key)
+            stage_loader: StageLoader holding the level's stages
+
+        Returns:
+            tuple: One tuple of CompiledWave per stage
+        """
+        start = time.perf_counter()
+        stamp = self._source_stamp(level_path)
+
+        timeline = self._read_snapshot(level_path, stamp)
+        source = "cache"
+        if timeline is None:
+            timeline = tuple(
+                self.compile_waves(stage_loader.parse_timeline(stage))
+                for stage in stage_loader.stages
+            )
+            self._write_snapshot(level_path, stamp, timeline)
+            source = "compiled"
+
+        waves = sum(len(stage) for stage in timeline)
+        DebugLogger.init_sub(
+            f"Timeline {source}: {waves} waves in "
+            f"{(time.perf_counter() - start) * 1000.0:.1f}ms"
+        )
+        return timeline
+
+    def compile_waves(self, waves):
+        """
+        Compile one stage's wave list.
+
+        Args:
+            waves: Wave dicts with "time" (StageLoader.parse_timeline)
+
+        Returns:
+            tuple: CompiledWave records sorted by time
+        """
+        compiled = (self.compile_wave(wave) for wave in waves)
+        return tuple(sorted((w for w in compiled if w), key=lambda w: w.time))
+
+    def compile_wave(self, wave):
+        """
+        Validate and resolve a single wave.
+
+        Args:
+            wave: Wave configuration dict
+
+        Returns:
+            CompiledWave, or None if the wave is invalid
+        """
+        # VALIDATION: Check wave structure
+        if not isinstance(wave, dict):
+            DebugLogger.warn(
+                f"[TimelineCompiler] Invalid wave type: {type(wave)}", category="level"
+            )
+            return None
+
+        # Determine entity type (enemy or pickup)
+        if "enemy" in wave:
+            category = "enemy"
+            entity_type = wave.get("enemy", "straight")
+        elif "pickup" in wave:
+            category = "pickup"
+            entity_type = wave.get("pickup", "health")
+        else:
+            DebugLogger.warn(
+                "[TimelineCompiler] Wave missing 'enemy' or 'pickup' key",
+                category="level",
+            )
+            return None
+
+        # VALIDATION: Required parameters
+        if not entity_type:
+            DebugLogger.warn(
+                "[TimelineCompiler] Wave has empty entity_type", category="level"
+            )
+            return None
+
+        count = wave.get("count", 1)
+        if count <= 0:
+            DebugLogger.warn(
+                f"[TimelineCompiler] Invalid count: {count}", category="level"
+            )
+            return None
+
+        refs = _injected_refs(category, entity_type)
+        aim_player = category == "enemy" and _movement_target(wave) == "player"
+        pattern = wave.get("pattern", "line")
+        precise = bool(wave.get("precise", entity_type == "boss"))
+
+        # Randomized edge positions must differ per run
+        if wave.get("spawn_position_random", 0.0) and not (
+            "formation" in wave or "pattern" in wave
+        ):
+            spawns, source = None, wave
+        else:
+            spawns, source = self.resolve_spawns(wave), None
+            if not spawns:
+                return None
+
+        return CompiledWave(
+            float(wave.get("time", 0)),
+            category,
+            entity_type,
+            pattern,
+            count,
+            spawns,
+            refs,
+            aim_player,
+            precise,
+            source,
+        )
+
+    # ===========================================================
+    # Spawn Resolution
+    # ===========================================================
+
+    def resolve_spawns(self, wave):
+        """
+        Resolve a wave's positions and final per-spawn params.
+
+        Live references and player aiming are left to the caller (see
+        CompiledWave.refs / aim_player).
+
+        Args:
+            wave: Wave configuration dict
+
+        Returns:
+            tuple: (x, y, params) per spawn, empty if nothing is valid
+        """
+        positions = self._calculate_positions(wave)
+
+        # VALIDATION: Check positions
+        if not positions:
+            DebugLogger.warn(
+                f"[TimelineCompiler] No valid positions for wave "
+                f"{wave.get('enemy') or wave.get('pickup')} "
+                f"(pattern: {wave.get('pattern', 'line')})",
+                category="level",
+            )
+            return ()
+
+        # Extract spawn edge (only from wave level, not pattern_config)
+        spawn_edge = wave.get("spawn_edge")
+
+        if "enemy" in wave:
+            base_params = _filter_enemy_params(wave.get("enemy_params", {}))
+            needs_position_calc, movement_params = _parse_movement_config(wave)
+
+            # Merge movement params with priority system:
+            # 1. Explicit enemy_params.direction (highest priority)
+            # 2. Movement config direction
+            # 3. Auto-direction from spawn_edge (lowest priority)
+            if not needs_position_calc:
+                if (
+                    "direction" not in base_params
+                    or base_params.get("direction") is None
+                ):
+                    if movement_params.get("direction") is not None:
+                        base_params.update(movement_params)
+                elif "homing" in movement_params:
+                    base_params.update(movement_params)
+        else:
+            base_params = dict(wave.get("item_params", {}))
+            needs_position_calc = False
+            movement_params = {}
+
+        width, height = self.game_size
+        spawns = []
+        for pos_data in positions:
+            # Unpack position with optional metadata
+            if isinstance(pos_data, tuple) and len(pos_data) == 3:
+                x, y, metadata = pos_data
+            else:
+                x, y = pos_data[0], pos_data[1]
+                metadata = {}
+
+            # VALIDATION: Coordinate types
+            if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+                DebugLogger.warn(
+                    f"[TimelineCompiler] Invalid position: ({x}, {y})",
+                    category="level",
+                )
+                continue
+
+            spawn_params = base_params.copy()
+
+            # Handle position-dependent direction calculation
+            # ("player" gets a placeholder, aimed at spawn time)
+            if needs_position_calc:
+                target = movement_params.get("target")
+                if target == "center":
+                    direction = direction_to_center(x, y, width, height)
+                else:
+                    if target != "player":
+                        DebugLogger.warn(
+                            f"[TimelineCompiler] Unknown movement target '{target}' "
+                            "- using default down",
+                            category="level",
+                        )
+                    direction = (0, 1)
+                spawn_params["direction"] = direction
+
+            # Handle pattern metadata: use_auto_direction
+            elif metadata.get("use_auto_direction", False):
+                # Override with auto-direction based on position
+                spawn_params["direction"] = None
+                spawn_params["spawn_edge"] = spawn_edge
+
+            # Pass spawn_edge for auto-direction calculation
+            spawn_kwargs = {}
+            if spawn_edge:
+                # Only use auto-direction if direction is None or homing needs edge
+                if (
+                    spawn_params.get("direction") is None
+                    or spawn_params.get("homing") == "snapshot_axis"
+                ):
+                    spawn_kwargs["spawn_edge"] = spawn_edge
+
+            spawns.append((x, y, {**spawn_kwargs, **spawn_params}))
+
+        return tuple(spawns)
+
+    # ===========================================================
+    # Position Calculation
+    # ===========================================================
+
+    def _calculate_positions(self, wave: dict) -> list:
+        """
+        Calculate spawn positions from wave config.
+
+        Modes:
+        - Individual: spawn_edge only (single position)
+        - Formation: spawn_edge + formation (shaped group on one edge)
+        - Pattern: pattern only (complex multi-edge choreography)
+        """
+        # Mode 1: Individual spawn (spawn_edge without formation)
+        if "spawn_edge" in wave and "formation" not in wave and "pattern" not in wave:
+            return self._positions_from_edge(wave)
+
+        # Mode 2: Formation spawn (shaped group on single edge)
+        if "formation" in wave:
+            if "spawn_edge" not in wave:
+                DebugLogger.warn(
+                    "[TimelineCompiler] Formation requires 'spawn_edge'",
+                    category="level",
+                )
+                return []
+            return self._positions_from_formation(wave)
+
+        # Mode 3: Pattern spawn (multi-edge patterns)
+        if "pattern" in wave:
+            return self._positions_from_registry(
+                wave["pattern"], wave.get("count", 1), wave.get("pattern_config", {})
+            )
+
+        DebugLogger.warn(
+            "[TimelineCompiler] Wave has no position config (spawn_edge, formation, or pattern)",
+            category="level",
+        )
+        return []
+
+    def _positions_from_edge(self, wave: dict) -> list:
+        """Generate positions along screen edge."""
+        edge = wave["spawn_edge"]
+        position = wave.get("spawn_position", 0.5)
+        random_range = wave.get("spawn_position_random", 0.0)
+        offset_x = wave.get("spawn_offset_x", 0)
+        offset_y = wave.get("spawn_offset_y", -100)
+        count = wave.get("count", 1)
+        width, height = self.game_size
+
+        positions = []
+        for _ in range(count):
+            pos = position
+            if random_range:
+                pos += _rng.uniform(-random_range, random_range)
+            pos = max(0.0, min(1.0, pos))
+
+            if edge == "top":
+                x = pos * width + offset_x
+                y = offset_y
+            elif edge == "bottom":
+                x = pos * width + offset_x
+                y = height + offset_y
+            elif edge == "left":
+                x = offset_x
+                y = pos * height + offset_y
+            elif edge == "right":
+                x = width + offset_x
+                y = pos * height + offset_y
+            else:
+                x, y = width / 2, -100
+
+            positions.append((x, y))
+
+        return positions
+
+    def _positions_from_formation(self, wave: dict) -> list:
+        """Generate positions using formation along single edge."""
+        edge = wave["spawn_edge"]
+
+        # Build formation config from wave
+        formation_config = wave.get("formation_config", {}).copy()
+        formation_config["edge"] = edge
+
+        # Add offset if specified at wave level (single offset)
+        if "spawn_offset" in wave:
+            formation_config.setdefault("offset", wave["spawn_offset"])
+        # Backward compatibility: offset_y for top/bottom, offset_x for left/right
+        elif edge in ["top", "bottom"] and "spawn_offset_y" in wave:
+            formation_config.setdefault("offset", wave["spawn_offset_y"])
+        elif edge in ["left", "right"] and "spawn_offset_x" in wave:
+            formation_config.setdefault("offset", wave["spawn_offset_x"])
+
+        return self._positions_from_registry(
+            wave["formation"], wave.get("count", 1), formation_config
+        )
+
+    def _positions_from_registry(self, name, count, config) -> list:
+        """Generate positions from a registered pattern/formation."""
+        width, height = self.game_size
+        try:
+            return PatternRegistry.get_positions(name, count, width, height, config)
+        except KeyError as e:
+            DebugLogger.warn(
+                f"[TimelineCompiler] Pattern '{name}' not registered: {e}",
+                category="level",
+            )
+        except (ValueError, TypeError) as e:
+            DebugLogger.warn(
+                f"[TimelineCompiler] Pattern '{name}' invalid config: {e}",
+                category="level",
+            )
+        except Exception as e:
+            DebugLogger.warn(
+                f"[TimelineCompiler] Pattern '{name}' failed: {e}", category="level"
+            )
+        return []
+
+    # ===========================================================
+    # Disk Cache
+    # ===========================================================
+
+    def _source_stamp(self, level_path):
+        """Validation key for a mission file, or None if it can't be stat'ed."""
+        try:
+            stat = os.stat(level_path)
+        except (OSError, TypeError):
+            return None
+        return (COMPILER_VERSION, stat.st_mtime_ns, stat.st_size, *self.game_size)
+
+    def _snapshot_path(self, level_path):
+        """Snapshot file for a mission path."""
+        name = os.path.normpath(level_path).replace(os.sep, "__").replace(":", "_")
+        return os.path.join(self.cache_dir, name + ".bin")
+
+    def _read_snapshot(self, level_path, stamp):
+        """Load a compiled timeline if its stamp matches."""
+        if stamp is None:
+            return None
+        try:
+            with open(self._snapshot_path(level_path), "rb") as f:
+                cached_stamp, stages = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if tuple(cached_stamp) != stamp:
+            return None
+        return tuple(
+            tuple(CompiledWave._make(wave) for wave in stage) for stage in stages
+        )
+
+    def _write_snapshot(self, level_path, stamp, timeline):
+        """Store a compiled timeline (failures are non-fatal)."""
+        if stamp is None:
+            return
+        target = self._snapshot_path(level_path)
+        # marshal only takes exact tuples, not namedtuples
+        stages = tuple(tuple(tuple(wave) for wave in stage) for stage in timeline)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp = f"{target}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                marshal.dump((stamp, stages), f)
+            os.replace(temp, target)
+        except (OSError, ValueError) as e:
+            DebugLogger.warn(f"Timeline cache write failed for {level_path}: {e}")
+
+
+# ===========================================================
+# Helpers
+# ===========================================================
+
+
+def direction_to_center(x, y, width, height):
+    """Normalized direction from (x, y) to the game area center."""
+    vec = pygame.Vector2(width / 2 - x, height / 2 - y)
+    if vec.length_squared() > 0:
+        vec.normalize_ip()
+        return (vec.x, vec.y)
+    return (0, 1)
+
+
+def _injected_refs(category, entity_type):
+    """Live references an entity type needs at spawn time."""
+    if category != "enemy":
+        return ()
+    if entity_type == "boss":
+        return ("player_ref", "bullet_manager", "hazard_manager")
+    if entity_type == "waypoint_shooter":
+        return ("player_ref", "bullet_manager")
+    if entity_type.startswith("homing"):
+        return ("player_ref",)
+    return ()
+
+
+def _movement_target(wave):
+    """Target of a straight movement config ("auto", "center", "player", ...)."""
+    movement = wave.get("movement", {})
+    if movement.get("type", "straight") != "straight":
+        return None
+    return movement.get("target", "auto")
+
+
+def _parse_movement_config(wave: dict):
+    """
+    Parse movement config from wave.
+
+    Returns:
+        tuple: (needs_position_calc: bool, params: dict)
+    """
+    movement = wave.get("movement", {})
+    move_type = movement.get("type", "straight")
+    target = movement.get("target", "auto")
+
+    if move_type == "homing_continuous":
+        return False, {
+            "homing": True,
+            "turn_rate": movement.get("params", {}).get("turn_rate", 180),
+        }
+    elif move_type == "homing_snapshot":
+        return False, {
+            "homing": "snapshot",
+            "lock_delay": movement.get("params", {}).get("lock_delay", 0.5),
+        }
+    elif move_type == "homing_snapshot_axis":
+        return False, {
+            "homing": "snapshot_axis",
+            "lock_delay": movement.get("params", {}).get("lock_delay", 0.5),
+        }
+    elif move_type == "straight":
+        if target == "auto":
+            return False, {"direction": None}
+        elif target in ("center", "player"):
+            return True, {"target": target}
+        else:
+            return False, {"direction": (0, 1)}
+    elif move_type == "stationary":
+        return False, {"direction": (0, 0)}
+
+    return False, {"direction": (0, 1)}
+
+
+def _filter_enemy_params(params: dict) -> dict:
+    """
+    Filter enemy_params to only allow level-specific overrides.
+    Blocks stat overrides (health, speed, scale) - use enemies.json instead.
+
+    Args:
+        params: Raw enemy_params from level JSON
+
+    Returns:
+        Filtered params with only positioning/behavior data
+    """
+    filtered = {k: v for k, v in params.items() if k in ALLOWED_PARAMS}
+
+    # Log blocked overrides
+    blocked = set(params.keys()) - set(filtered.keys())
+    if blocked:
+        DebugLogger.trace(
+            f"Blocked stat overrides: {blocked} (use enemies.json)",
+            category="level",
+        )
+
+    return filtered
@@ -25,6 +25,9 @@ class UIElement:
 
     _font_cache: Dict[Tuple[str, int], pygame.font.Font] = {}
 
+    # RetainedLayer this element contributes to (set by UIManager)
+    _retained_layer = None
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize ui element from config dictionary.
@@ -341,10 +344,19 @@ class UIElement:
         w, h = max(1, int(self.width)), max(1, int(self.height))
         scaled = pygame.transform.scale(image, (w, h))
 
-        # Apply tint if specified
+        # Apply tint if specified (a colorkey would be tinted too, use alpha)
         if self.image_tint:
+            if scaled.get_colorkey() is not None:
+                scaled = scaled.convert_alpha()
             scaled.fill(self.image_tint, special_flags=pygame.BLEND_RGB_MULT)
 
+        # transform.scale drops RLE, keep the format picked at load time
+        if (
+            image.get_flags() & pygame.RLEACCELOK
+            and scaled.get_flags() & pygame.SRCALPHA
+        ):
+            scaled.set_alpha(255, pygame.RLEACCEL)
+
         self._loaded_image = scaled
         return self._loaded_image
 
@@ -428,6 +440,12 @@ class UIElement:
     def mark_dirty(self):
         """Mark element as needing re-render."""
         self._dirty = True
+        self.invalidate()
+
+    def invalidate(self):
+        """Notify the owning retained layer that this element changed (redraw it)."""
+        if self._retained_layer is not None:
+            self._retained_layer.invalidate()
 
     def set_visible(self, visible: bool):
         """Set visibility state."""
@@ -471,6 +489,7 @@ class UIElement:
     def invalidate_position(self):
         """Mark position as needing recalculation (affects children too)."""
         self._position_cache_valid = False
+        self.invalidate()
         # Cascade to children if this is a container
         if hasattr(self, "children"):
             for child in self.children:
@@ -542,6 +561,7 @@ class UIElement:
         self._slide_delay = delay
         self._slide_elapsed = 0.0
         self._sliding = True
+        self.invalidate()
 
     def update_slide(self, dt: float) -> bool:
         """
@@ -559,6 +579,7 @@ class UIElement:
             return False
 
         self._slide_elapsed += dt
+        self.invalidate()
         t = min(self._slide_elapsed / self._slide_duration, 1.0)
 
         # Ease-out
@@ -4,12 +4,12 @@ ui_loader.py
 Loads ui configurations from YAML files and instantiates element trees.
 """
 
-import yaml
 from pathlib import Path
 from typing import Dict, Any
 
 from src.core.runtime.game_settings import Layers
 from src.core.debug.debug_logger import DebugLogger
+from src.core.services.config_cache import get_config_cache
 
 from src.ui.core.ui_element import UIElement
 
@@ -55,9 +55,21 @@ class UILoader:
         Returns:
             Root UIElement
         """
+        return self._instantiate(self.preload(filename))
+
+    def preload(self, filename: str) -> Dict:
+        """
+        Parse a YAML file into the cache without building elements.
+
+        Args:
+            filename: Path to YAML file relative to src/config/ui/
+
+        Returns:
+            Parsed config dict
+        """
         # Check cache
         if filename in self.cache:
-            return self._instantiate(self.cache[filename])
+            return self.cache[filename]
 
         # Load file - filename can include subdirectory path
         full_path = self.base_path / filename
@@ -65,13 +77,12 @@ class UILoader:
         if not full_path.exists():
             raise FileNotFoundError(f"ui config not found: {full_path}")
 
-        with open(full_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Compiled snapshot skips the YAML parser after the first run
+        config = get_config_cache().load(str(full_path))
 
         # Cache parsed config
         self.cache[filename] = config
-
-        return self._instantiate(config)
+        return config
 
     def load_from_dict(self, config: Dict[str, Any]) -> UIElement:
         """
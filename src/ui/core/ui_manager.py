@@ -60,6 +60,11 @@ class UIManager:
         # HUD slide animation tracking
         self._hud_sliding = False
 
+        # HUD is retained: re-queued only when an element invalidates it
+        self._hud_retained = draw_manager.register_retained(
+            "ui_hud", Layers.UI, self._build_hud
+        )
+
         # Focus navigation
         self.focusables: List[UIElement] = []  # Flat list of focusable buttons
         self.focus_index: int = -1  # -1 = none focused
@@ -77,6 +82,13 @@ class UIManager:
             for child in element.children:
                 self._inject_draw_manager_to_tree(child)
 
+    def _set_retained_tree(self, element: UIElement, retained):
+        """Recursively attach (or detach with None) a retained layer."""
+        element._retained_layer = retained
+        if hasattr(element, "children"):
+            for child in element.children:
+                self._set_retained_tree(child, retained)
+
     # ===================================================================
     # Screen Management
     # ===================================================================
@@ -336,7 +348,9 @@ class UIManager:
             element: HUD element to add
         """
         self._inject_draw_manager_to_tree(element)
+        self._set_retained_tree(element, self._hud_retained)
         self.hud_elements.append(element)
+        self._hud_retained.invalidate()
 
     def load_hud(self, filename: str):
         """
@@ -362,7 +376,10 @@ class UIManager:
 
     def clear_hud(self):
         """Remove all HUD elements."""
+        for element in self.hud_elements:
+            self._set_retained_tree(element, None)
         self.hud_elements.clear()
+        self._hud_retained.invalidate()
 
     # ===================================================================
     # HUD Animation
@@ -646,9 +663,9 @@ class UIManager:
         Args:
             draw_manager: DrawManager instance
         """
-        # Draw HUD (bottom layer)
-        for element in self.hud_elements:
-            self._draw_element_tree(element, draw_manager)
+        # Draw HUD (bottom layer, cached until an element changes)
+        if self.hud_elements:
+            draw_manager.queue_retained(self._hud_retained)
 
         # Draw active screen
         if self.active_screen:
@@ -666,6 +683,11 @@ class UIManager:
                 anim_offset = offset.offset if offset else (0, 0)
                 self._draw_element_tree(screen, draw_manager, anim_offset=anim_offset)
 
+    def _build_hud(self, retained):
+        """Retained-layer builder: queue the full HUD tree."""
+        for element in self.hud_elements:
+            self._draw_element_tree(element, retained)
+
     def _draw_element_tree(
         self, element, draw_manager, parent=None, anim_offset=(0, 0)
     ):
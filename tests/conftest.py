@@ -7,9 +7,12 @@ Contains:
 - Common fixtures used across multiple test modules
 - Pytest configuration and hooks
 - Shared mock utilities and test helpers
+- Headless engine runner for tests that need real pygame
 """
 
+import json
 import pytest
+import subprocess
 import sys
 import os
 from unittest.mock import MagicMock
@@ -125,6 +128,60 @@ def create_mock_rect(x=0, y=0, width=50, height=50):
     return rect
 
 
+# ===========================================================
+# Headless Engine
+# ===========================================================
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_HEADLESS_PRELUDE = """
+import json
+from src.core.debug.debug_logger import LoggerConfig
+LoggerConfig.ENABLE_LOGGING = False
+
+def emit(result):
+    print("RESULT " + json.dumps(result), flush=True)
+"""
+
+
+@pytest.fixture(scope="session")
+def run_headless():
+    """
+    Run a script against the real engine in a fresh interpreter.
+
+    pygame is mocked in this process, so engine-level tests drive
+    MainLoop(headless=True) in a subprocess instead. The script reports
+    back by calling emit(result) with a JSON-serializable value.
+
+    Returns:
+        Callable (script, timeout=120) -> last emitted result
+    """
+
+    def run(script, timeout=120):
+        env = dict(os.environ, PYTHONPATH=REPO_ROOT, SDL_VIDEODRIVER="dummy")
+        env["SDL_AUDIODRIVER"] = "dummy"
+        env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+        proc = subprocess.run(
+            [sys.executable, "-c", _HEADLESS_PRELUDE + script],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        results = [
+            line[len("RESULT ") :]
+            for line in proc.stdout.splitlines()
+            if line.startswith("RESULT ")
+        ]
+        assert proc.returncode == 0 and results, (
+            f"Headless script failed ({proc.returncode}):\n{proc.stderr[-2000:]}"
+        )
+        return json.loads(results[-1])
+
+    return run
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Custom pytest configuration."""
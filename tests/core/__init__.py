@@ -0,0 +1,4 @@
+"""
+Core tests package.
+Contains tests for engine services, runtime and debug tooling.
+"""
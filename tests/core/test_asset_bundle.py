@@ -0,0 +1,69 @@
+"""
+test_asset_bundle.py
+--------------------
+Tests for AssetBundle staleness with an undecodable source.
+
+Builds a bundle headless from a folder holding one valid and one corrupt
+image and checks that:
+1. The corrupt image is recorded as skipped, the valid one is bundled
+2. The rebuilt bundle is not stale on the next start
+3. Changing the corrupt file (mtime) or removing it makes it stale again
+"""
+
+import pytest
+
+CORRUPT_SOURCE = """
+import os
+
+import pygame
+
+from src.core.services.asset_bundle import AssetBundle
+
+root = {root!r}
+pygame.init()
+pygame.image.save(pygame.Surface((4, 3)), os.path.join(root, "good.png"))
+bad = os.path.join(root, "bad.png")
+with open(bad, "wb") as f:
+    f.write(b"not a png")
+
+bundle = AssetBundle(os.path.join(root, "assets.bundle"))
+bundle.SOURCES = ((root, "image", AssetBundle.IMAGE_EXTS),)
+bundle.open()
+header = bundle._read_header()
+result = {{
+    "entries": sorted(os.path.basename(p) for p in header["entries"]),
+    "skipped": sorted(os.path.basename(p) for p in header["skipped"]),
+    "surface": list(bundle.load_surface(os.path.join(root, "good.png")).get_size()),
+    "stale": bundle._is_stale(header, bundle._scan_sources()),
+}}
+bundle.close()
+
+stat = os.stat(bad)
+os.utime(bad, (stat.st_atime, stat.st_mtime + 10))
+result["stale_after_touch"] = bundle._is_stale(header, bundle._scan_sources())
+
+os.remove(bad)
+result["stale_after_remove"] = bundle._is_stale(header, bundle._scan_sources())
+emit(result)
+"""
+
+
+@pytest.fixture(scope="module")
+def corrupt_result(run_headless, tmp_path_factory):
+    root = tmp_path_factory.mktemp("bundle_sources")
+    return run_headless(CORRUPT_SOURCE.format(root=str(root)))
+
+
+@pytest.mark.integration
+class TestCorruptSource:
+    def test_corrupt_image_skipped(self, corrupt_result):
+        assert corrupt_result["entries"] == ["good.png"]
+        assert corrupt_result["skipped"] == ["bad.png"]
+        assert corrupt_result["surface"] == [4, 3]
+
+    def test_not_stale_after_rebuild(self, corrupt_result):
+        assert corrupt_result["stale"] is False
+
+    def test_stale_when_skipped_source_changes(self, corrupt_result):
+        assert corrupt_result["stale_after_touch"] is True
+        assert corrupt_result["stale_after_remove"] is True
@@ -0,0 +1,176 @@
+"""
+test_batch_runner.py
+--------------------
+Tests for the batch runner's pure helpers (no engine is booted).
+
+Covers:
+1. _parse_seeds() expands single seeds, ranges and lists, and rejects
+   empty, malformed or reversed ranges
+2. make_jobs() expands the sweep mission-major and rejects unknown policies
+3. _frame_stats() nearest-rank percentiles
+4. merge_report() groups by (mission, policy), computes survival rate and
+   keeps failed jobs out of the groups
+"""
+
+import pytest
+
+from src.core.runtime.batch_runner import (
+    CLEARED,
+    DIED,
+    TIMEOUT,
+    BatchJob,
+    _frame_stats,
+    _parse_seeds,
+    make_jobs,
+    merge_report,
+)
+
+
+def _run(mission="2_Mission", policy="autopilot", seed=0, outcome=CLEARED, **extra):
+    """A run_job() result with fixed stats."""
+    result = {
+        "mission": mission,
+        "policy": policy,
+        "seed": seed,
+        "outcome": outcome,
+        "score": 100,
+        "kills": 10,
+        "run_time": 30.0,
+        "level_reached": 2,
+        "sim_per_wall": 4.0,
+        "frame": {"p50_ms": 1.0, "p95_ms": 2.0, "p99_ms": 3.0, "max_ms": 4.0},
+    }
+    result.update(extra)
+    return result
+
+
+# ===========================================================
+# Seeds and Jobs
+# ===========================================================
+
+
+class TestParseSeeds:
+    @pytest.mark.parametrize(
+        "items, seeds",
+        [
+            (["3"], [3]),
+            (["0-3"], [0, 1, 2, 3]),
+            (["2-2"], [2]),
+            (["1,4,9"], [1, 4, 9]),
+            (["0-1", "5", "7,8-9"], [0, 1, 5, 7, 8, 9]),
+            ([" 4 "], [4]),
+        ],
+    )
+    def test_valid(self, items, seeds):
+        assert _parse_seeds(items) == seeds
+
+    @pytest.mark.parametrize("item", ["5-1", "", "1,,3", "3-", "-3", "x", "1-y"])
+    def test_rejected(self, item):
+        with pytest.raises(ValueError):
+            _parse_seeds([item])
+
+
+class TestMakeJobs:
+    def test_mission_major_order(self):
+        jobs = make_jobs(["a", "b"], [0, 1], ["autopilot"], seconds=5.0)
+        assert [(j.mission, j.seed) for j in jobs] == [
+            ("a", 0),
+            ("a", 1),
+            ("b", 0),
+            ("b", 1),
+        ]
+        assert all(j == BatchJob(j.mission, j.seed, "autopilot", 5.0) for j in jobs)
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            make_jobs(["a"], [0], ["no_such_policy"])
+
+
+# ===========================================================
+# Aggregation
+# ===========================================================
+
+
+class TestFrameStats:
+    def test_known_samples(self):
+        stats = _frame_stats([float(ms) for ms in range(100, 0, -1)])
+        assert stats == {
+            "count": 100,
+            "mean_ms": 50.5,
+            "p50_ms": 50.0,
+            "p95_ms": 95.0,
+            "p99_ms": 99.0,
+            "max_ms": 100.0,
+        }
+
+    def test_empty(self):
+        assert _frame_stats([]) is None
+
+
+class TestMergeReport:
+    def test_survival_rate_and_outcomes(self):
+        results = [
+            _run(seed=0, outcome=CLEARED),
+            _run(seed=1, outcome=DIED),
+            _run(seed=2, outcome=TIMEOUT),
+            _run(seed=3, outcome=DIED),
+        ]
+        (group,) = merge_report(results)["groups"]
+
+        assert (group["cleared"], group["died"], group["timeout"]) == (1, 2, 1)
+        assert group["survival_rate"] == 0.5
+        assert group["seeds"] == [0, 1, 2, 3]
+
+    def test_groups_by_mission_and_policy(self):
+        results = [
+            _run(mission="a", policy="turret", score=10),
+            _run(mission="a", policy="dodger", score=20),
+            _run(mission="a", policy="turret", score=30),
+            _run(mission="b", policy="turret", score=40),
+        ]
+        groups = {
+            (g["mission"], g["policy"]): g for g in merge_report(results)["groups"]
+        }
+
+        assert set(groups) == {("a", "turret"), ("a", "dodger"), ("b", "turret")}
+        turret = groups[("a", "turret")]
+        assert turret["runs"] == 2
+        assert (turret["score_mean"], turret["score_min"], turret["score_max"]) == (
+            20.0,
+            10,
+            30,
+        )
+
+    def test_errors_kept_out_of_groups(self):
+        failed = {
+            "mission": "a",
+            "policy": "turret",
+            "seed": 7,
+            "error": "RuntimeError('boom')",
+        }
+        report = merge_report([_run(mission="a", policy="turret"), failed])
+
+        assert report["runs"] == 2
+        assert report["errors"] == [failed]
+        (group,) = report["groups"]
+        assert group["runs"] == 1
+        assert group["survival_rate"] == 1.0
+
+    def test_frame_stats_merge_skips_runs_without_frames(self):
+        results = [
+            _run(
+                seed=0,
+                frame={"p50_ms": 1.0, "p95_ms": 2.0, "p99_ms": 5.0, "max_ms": 9.0},
+            ),
+            _run(
+                seed=1,
+                frame={"p50_ms": 3.0, "p95_ms": 4.0, "p99_ms": 6.0, "max_ms": 7.0},
+            ),
+            _run(seed=2, frame=None),
+        ]
+        (group,) = merge_report(results)["groups"]
+
+        assert group["frame_p50_ms"] == 2.0
+        assert group["frame_p95_ms"] == 3.0
+        assert group["frame_p99_worst_ms"] == 6.0
+        assert group["frame_max_ms"] == 9.0
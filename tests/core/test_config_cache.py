@@ -0,0 +1,159 @@
+"""
+test_config_cache.py
+--------------------
+Tests for the compiled config cache behind load_config().
+
+Covers:
+1. Memo and disk snapshots invalidate on an mtime_ns or size change
+2. view() returns a read-only tree
+3. Data marshal cannot encode falls back to pickle
+4. load_config() without defaults matches the plain parse + merge
+"""
+
+import datetime
+import json
+import os
+
+import pytest
+
+from src.core.services import config_manager
+from src.core.services.config_cache import ConfigCache, _pack, _unpack
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+def _write(path, data, mtime_ns=None):
+    """Write JSON to path, optionally pinning its mtime."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """A small JSON config with a fixed mtime."""
+    path = tmp_path / "enemy.json"
+    _write(path, {"hp": 10, "tags": ["a", "b"]}, mtime_ns=1_000_000_000)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+# ===========================================================
+# Invalidation
+# ===========================================================
+
+
+class TestSnapshotInvalidation:
+    """A cached parse is only reused while the source stamp matches."""
+
+    def test_memo_hit_when_unchanged(self, config_file, cache_dir):
+        cache = ConfigCache(cache_dir)
+        cache.load(str(config_file))
+        cache.load(str(config_file))
+        assert (cache.parsed, cache.memo_hits) == (1, 1)
+
+    def test_disk_hit_in_new_process_cache(self, config_file, cache_dir):
+        ConfigCache(cache_dir).load(str(config_file))
+        fresh = ConfigCache(cache_dir)
+        assert fresh.load(str(config_file)) == {"hp": 10, "tags": ["a", "b"]}
+        assert (fresh.parsed, fresh.disk_hits) == (0, 1)
+
+    def test_mtime_change_reparses(self, config_file, cache_dir):
+        cache = ConfigCache(cache_dir)
+        cache.load(str(config_file))
+
+        # Same size, new content and mtime
+        _write(config_file, {"hp": 20, "tags": ["a", "b"]}, mtime_ns=2_000_000_000)
+
+        assert cache.load(str(config_file))["hp"] == 20
+        assert ConfigCache(cache_dir).load(str(config_file))["hp"] == 20
+        assert cache.parsed == 2
+
+    def test_size_change_reparses_with_same_mtime(self, config_file, cache_dir):
+        cache = ConfigCache(cache_dir)
+        cache.load(str(config_file))
+
+        _write(config_file, {"hp": 100, "tags": ["a", "b"]}, mtime_ns=1_000_000_000)
+
+        assert cache.load(str(config_file))["hp"] == 100
+        assert ConfigCache(cache_dir).load(str(config_file))["hp"] == 100
+
+
+# ===========================================================
+# Views and Copies
+# ===========================================================
+
+
+class TestViews:
+    """view() shares one frozen tree; load() hands out private copies."""
+
+    def test_view_rejects_writes(self, config_file, cache_dir):
+        view = ConfigCache(cache_dir).view(str(config_file))
+        with pytest.raises(TypeError):
+            view["hp"] = 99
+        assert view["tags"] == ("a", "b")
+
+    def test_view_is_shared(self, config_file, cache_dir):
+        cache = ConfigCache(cache_dir)
+        assert cache.view(str(config_file)) is cache.view(str(config_file))
+
+    def test_load_returns_independent_copies(self, config_file, cache_dir):
+        cache = ConfigCache(cache_dir)
+        first = cache.load(str(config_file))
+        first["tags"].append("c")
+        assert cache.load(str(config_file))["tags"] == ["a", "b"]
+
+
+# ===========================================================
+# Serialization
+# ===========================================================
+
+
+class TestPacking:
+    """marshal is preferred; values it rejects go through pickle."""
+
+    def test_plain_data_uses_marshal(self):
+        assert _pack({"a": [1, 2.5, "x", None]})[:1] == b"M"
+
+    def test_unmarshallable_data_falls_back_to_pickle(self):
+        data = {"released": datetime.date(2024, 5, 1)}
+        blob = _pack(data)
+        assert blob[:1] == b"P"
+        assert _unpack(blob) == data
+
+    def test_yaml_timestamps_round_trip(self, tmp_path, cache_dir):
+        pytest.importorskip("yaml")
+        path = tmp_path / "schedule.yaml"
+        path.write_text("start: 2024-05-01\nwaves: [1, 2]\n", encoding="utf-8")
+
+        ConfigCache(cache_dir).load(str(path))
+        data = ConfigCache(cache_dir).load(str(path))
+        assert data == {"start": datetime.date(2024, 5, 1), "waves": [1, 2]}
+
+
+# ===========================================================
+# load_config Equivalence
+# ===========================================================
+
+
+def test_load_config_matches_plain_merge():
+    """Cached load_config(name) equals parsing each file and merging into {}."""
+    mismatched = []
+    for name, path in sorted(config_manager.get_indexed_files().items()):
+        if not path.endswith(".json"):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        if not isinstance(raw, dict):
+            continue
+        if config_manager.load_config(name) != config_manager._merge_dicts({}, raw):
+            mismatched.append(name)
+
+    assert not mismatched, f"load_config differs from the plain merge: {mismatched}"
@@ -0,0 +1,83 @@
+"""
+test_debug_hud.py
+-----------------
+Tests for the DebugHUD frame history ring buffers and histogram.
+
+Covers:
+1. Frame-time and FPS history keep only the last GRAPH_WIDTH frames
+2. Histogram bins stay equal to a recount of the history after overflow
+3. Frames without a frame time (fast draw path) skip the history
+"""
+
+from bisect import bisect_left
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.debug.debug_hud import GRAPH_WIDTH, HISTOGRAM_EDGES, DebugHUD
+
+
+@pytest.fixture
+def hud():
+    """A hidden HUD with mocked display and draw managers."""
+    return DebugHUD(MagicMock(), MagicMock())
+
+
+def _recount(history):
+    """Histogram bins rebuilt from scratch."""
+    counts = [0] * (len(HISTOGRAM_EDGES) + 1)
+    for ms in history:
+        counts[bisect_left(HISTOGRAM_EDGES, ms)] += 1
+    return counts
+
+
+def _record(hud, frame_ms, fps=60.0):
+    hud.record_frame_metrics(frame_ms, 0.0, 0.0, fps)
+
+
+# ===========================================================
+# Ring Buffers
+# ===========================================================
+
+
+class TestHistory:
+    def test_keeps_last_n_after_overflow(self, hud):
+        total = GRAPH_WIDTH + 25
+        for i in range(total):
+            _record(hud, 1.0 + i, fps=float(i))
+
+        assert len(hud.frame_time_history) == GRAPH_WIDTH
+        assert list(hud.frame_time_history) == [1.0 + i for i in range(25, total)]
+        assert list(hud.fps_history) == [float(i) for i in range(25, total)]
+
+    def test_zero_frame_time_skips_history(self, hud):
+        _record(hud, 5.0)
+        _record(hud, 0.0, fps=30.0)
+
+        assert list(hud.frame_time_history) == [5.0]
+        assert list(hud.fps_history) == [60.0, 30.0]
+        assert sum(hud.histogram) == 1
+
+
+# ===========================================================
+# Histogram
+# ===========================================================
+
+
+class TestHistogram:
+    def test_bins_on_known_samples(self, hud):
+        for ms in (1.0, 2.0, 3.0, 16.0, 16.67, 17.0, 40.0, 90.0):
+            _record(hud, ms)
+
+        assert hud.histogram == [2, 1, 0, 0, 0, 0, 0, 2, 1, 0, 0, 2]
+
+    def test_bins_track_history_after_overflow(self, hud):
+        # Slow frames first, so eviction has to empty the spike bin
+        for _ in range(GRAPH_WIDTH):
+            _record(hud, 45.0)
+        for i in range(GRAPH_WIDTH):
+            _record(hud, 1.0 + (i % 30))
+
+        assert hud.histogram == _recount(hud.frame_time_history)
+        assert hud.histogram[-1] == 0
+        assert sum(hud.histogram) == GRAPH_WIDTH
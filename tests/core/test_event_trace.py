@@ -0,0 +1,164 @@
+"""
+test_event_trace.py
+-------------------
+Tests for the ring-buffered EventTracer.
+
+Covers:
+1. A ring overflow drops the oldest events and counts them from sequence gaps
+2. stop() leaves a closed, loadable Chrome trace JSON array
+3. .jsonl traces hold one event object per line
+4. start/stop/start cycles (toggle) write separate, complete files, even
+   within the same second
+"""
+
+import json
+
+import pytest
+
+from src.core.debug.event_trace import EventTracer
+from src.core.runtime.game_settings import Profiling, Tracing
+
+# Process and thread name records written by start()
+METADATA_EVENTS = 2
+
+
+@pytest.fixture(autouse=True)
+def quiet_tracing(monkeypatch, tmp_path):
+    """No GC spans, no background flush during a test, exports to tmp."""
+    monkeypatch.setattr(Tracing, "TRACE_GC", False)
+    monkeypatch.setattr(Tracing, "FLUSH_INTERVAL", 60.0)
+    monkeypatch.setattr(Profiling, "EXPORT_DIR", str(tmp_path))
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _names(events):
+    return [e["name"] for e in events if e["ph"] != "M"]
+
+
+# ===========================================================
+# Ring Buffer
+# ===========================================================
+
+
+class TestRingOverflow:
+    def test_oldest_events_dropped_and_counted(self, tmp_path):
+        tracer = EventTracer(size=8)
+        path = tracer.start(str(tmp_path / "overflow.jsonl"))
+        for i in range(20):
+            tracer.instant(f"e{i}", "test")
+        tracer.stop()
+
+        events = _read_jsonl(path)
+        assert _names(events) == [f"e{i}" for i in range(12, 20)]
+        assert tracer.stats() == {
+            "written": 8,
+            "buffered": 0,
+            "dropped": 20 + METADATA_EVENTS - 8,
+        }
+
+    def test_no_drops_within_capacity(self, tmp_path):
+        tracer = EventTracer(size=64)
+        tracer.start(str(tmp_path / "fits.jsonl"))
+        for i in range(10):
+            tracer.instant(f"e{i}")
+        tracer.stop()
+
+        assert tracer.stats()["dropped"] == 0
+        assert tracer.stats()["written"] == 10 + METADATA_EVENTS
+
+
+# ===========================================================
+# Output Formats
+# ===========================================================
+
+
+class TestOutput:
+    def test_json_array_closed_after_stop(self, tmp_path):
+        tracer = EventTracer(size=64)
+        path = tracer.start(str(tmp_path / "run.json"))
+        with tracer.span("load", "level", {"level": "2_Mission"}):
+            pass
+        tracer.instant("wave", "level", {"count": 5})
+        tracer.stop()
+
+        events = _read_json(path)
+        assert isinstance(events, list)
+        assert _names(events) == ["load", "wave"]
+        span, instant = (e for e in events if e["ph"] != "M")
+        assert span["ph"] == "X" and span["dur"] >= 0
+        assert span["args"] == {"level": "2_Mission"}
+        assert instant["ph"] == "i" and instant["s"] == "t"
+
+    def test_empty_json_trace_loads(self, tmp_path):
+        tracer = EventTracer(size=64)
+        path = tracer.start(str(tmp_path / "empty.json"))
+        tracer.stop()
+
+        assert [e["ph"] for e in _read_json(path)] == ["M"] * METADATA_EVENTS
+
+    def test_jsonl_one_event_per_line(self, tmp_path):
+        tracer = EventTracer(size=64)
+        path = tracer.start(str(tmp_path / "run.jsonl"))
+        for i in range(3):
+            tracer.instant(f"e{i}")
+        tracer.stop()
+
+        events = _read_jsonl(path)
+        assert len(events) == 3 + METADATA_EVENTS
+        assert _names(events) == ["e0", "e1", "e2"]
+
+    def test_stopped_tracer_records_nothing(self):
+        tracer = EventTracer(size=8)
+        with tracer.span("ignored"):
+            pass
+        tracer.instant("ignored")
+
+        assert tracer.stats()["buffered"] == 0
+        assert tracer.stop() is None
+
+
+# ===========================================================
+# Start / Stop Cycles
+# ===========================================================
+
+
+class TestToggle:
+    def test_toggle_cycles_write_separate_files(self):
+        tracer = EventTracer(size=64)
+
+        paths = []
+        for i in range(3):
+            assert tracer.toggle() is True
+            paths.append(tracer.path)
+            tracer.instant(f"run{i}")
+            assert tracer.toggle() is False
+
+        assert len(set(paths)) == 3
+        for i, path in enumerate(paths):
+            assert _names(_read_json(path)) == [f"run{i}"]
+
+    def test_restart_resets_counts(self, tmp_path):
+        tracer = EventTracer(size=4)
+        tracer.start(str(tmp_path / "first.jsonl"))
+        for i in range(10):
+            tracer.instant(f"e{i}")
+        tracer.stop()
+        assert tracer.stats()["dropped"] > 0
+
+        tracer.start(str(tmp_path / "second.jsonl"))
+        tracer.instant("only")
+        tracer.stop()
+        assert tracer.stats() == {
+            "written": 1 + METADATA_EVENTS,
+            "buffered": 0,
+            "dropped": 0,
+        }
@@ -0,0 +1,155 @@
+"""
+test_frame_profiler.py
+----------------------
+Tests for FrameProfiler percentile reports and ring-buffer history.
+
+Covers:
+1. Nearest-rank p50/p95/p99, mean and max on known sample sets
+2. Each section's ring keeps only its last N samples, oldest first
+3. CSV and JSON exports carry the same stats
+4. A disabled profiler records nothing
+5. toggle_session() starts fresh and exports a distinct file on each stop
+"""
+
+import csv
+import json
+
+import pytest
+
+from src.core.debug.frame_profiler import STAT_FIELDS, FrameProfiler
+from src.core.runtime.game_settings import Profiling
+
+
+@pytest.fixture
+def profiler():
+    """An enabled profiler with a small ring."""
+    return FrameProfiler(size=100, enabled=True)
+
+
+def _fill(profiler, name, values):
+    for ms in values:
+        profiler.record(name, ms)
+
+
+# ===========================================================
+# Percentiles
+# ===========================================================
+
+
+class TestStats:
+    def test_percentiles_on_one_to_hundred(self, profiler):
+        _fill(profiler, "update", range(100, 0, -1))
+
+        stats = profiler.stats("update")
+        assert stats["count"] == 100
+        assert stats["mean_ms"] == pytest.approx(50.5)
+        assert stats["p50_ms"] == 50
+        assert stats["p95_ms"] == 95
+        assert stats["p99_ms"] == 99
+        assert stats["max_ms"] == 100
+
+    @pytest.mark.parametrize(
+        "values, p50, p95, p99",
+        [
+            ([7.0], 7.0, 7.0, 7.0),
+            ([1.0, 2.0], 1.0, 2.0, 2.0),
+            ([4.0, 1.0, 3.0, 2.0], 2.0, 4.0, 4.0),
+            ([1.0] * 18 + [20.0, 40.0], 1.0, 20.0, 40.0),
+        ],
+    )
+    def test_nearest_rank(self, profiler, values, p50, p95, p99):
+        _fill(profiler, "draw", values)
+
+        stats = profiler.stats("draw")
+        assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]) == (p50, p95, p99)
+
+    def test_unknown_section_has_no_stats(self, profiler):
+        assert profiler.stats("missing") is None
+        assert profiler.samples("missing") == []
+
+
+# ===========================================================
+# Ring Buffer
+# ===========================================================
+
+
+class TestRing:
+    def test_keeps_last_n_after_overflow(self):
+        profiler = FrameProfiler(size=5, enabled=True)
+        _fill(profiler, "update", range(1, 9))
+
+        assert profiler.samples("update") == [4.0, 5.0, 6.0, 7.0, 8.0]
+        stats = profiler.stats("update")
+        assert stats["count"] == 5
+        assert stats["max_ms"] == 8.0
+
+    def test_partial_ring_is_oldest_first(self):
+        profiler = FrameProfiler(size=5, enabled=True)
+        _fill(profiler, "update", [3.0, 1.0, 2.0])
+
+        assert profiler.samples("update") == [3.0, 1.0, 2.0]
+
+    def test_exact_wrap_is_oldest_first(self):
+        profiler = FrameProfiler(size=4, enabled=True)
+        _fill(profiler, "update", range(1, 9))
+
+        assert profiler.samples("update") == [5.0, 6.0, 7.0, 8.0]
+
+    def test_reset_clears_history(self, profiler):
+        _fill(profiler, "update", [1.0, 2.0])
+        profiler.reset()
+
+        assert profiler.sections() == []
+        assert profiler.stats("update") is None
+
+    def test_disabled_records_nothing(self):
+        profiler = FrameProfiler(size=5, enabled=False)
+        profiler.record("update", 1.0)
+        with profiler.scope("draw"):
+            pass
+
+        assert profiler.sections() == []
+
+
+# ===========================================================
+# Export
+# ===========================================================
+
+
+class TestExport:
+    def test_csv_and_json_match_stats(self, profiler, tmp_path):
+        _fill(profiler, "update", range(1, 101))
+        _fill(profiler, "draw", [2.0, 4.0])
+
+        csv_path = profiler.export(str(tmp_path / "run.csv"))
+        json_path = profiler.export(str(tmp_path / "run.json"), include_samples=True)
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["section"] for row in rows] == ["update", "draw"]
+        assert tuple(rows[0]) == STAT_FIELDS
+        assert float(rows[0]["p95_ms"]) == 95.0
+
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["ring_size"] == 100
+        assert data["sections"] == profiler.summary()
+        assert data["samples"]["draw"] == [2.0, 4.0]
+
+    def test_toggle_session_exports_on_stop(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Profiling, "EXPORT_DIR", str(tmp_path))
+        profiler = FrameProfiler(size=10, enabled=False)
+
+        paths = []
+        for ms in (5.0, 7.0):
+            assert profiler.toggle_session() is None
+            assert profiler.enabled
+            profiler.record("update", ms)
+            paths.append(profiler.toggle_session())
+            assert not profiler.enabled
+
+        assert len(set(paths)) == 2
+        for path, ms in zip(paths, (5.0, 7.0)):
+            with open(path, newline="", encoding="utf-8") as f:
+                (row,) = csv.DictReader(f)
+            assert float(row["max_ms"]) == ms
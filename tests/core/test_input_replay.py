@@ -0,0 +1,117 @@
+"""
+test_input_replay.py
+--------------------
+Determinism test for input recording and replay (InputRecorder / InputReplay).
+
+Records a scripted run, then replays the recording twice: in a freshly
+booted engine and in a warm one that already played a different run.
+All three must end in the same game state, so a replay reproduces a run
+regardless of what the process did before it.
+"""
+
+import json
+
+import pytest
+
+# Shared by every run: play a mission on a fresh or warm engine and report
+# the end state. {setup} picks the input source and how the mission starts.
+RUN_TEMPLATE = """
+from src.core.runtime.game_settings import Spawning
+from src.core.runtime.main_loop import MainLoop
+from src.core.runtime.session_stats import get_session_stats
+from src.core.services.input_sources import InputRecorder, InputReplay, ScriptedInput
+
+Spawning.FRAME_BUDGET_MS = float("inf")
+loop = MainLoop(headless=True)
+input_manager = loop.input_manager
+
+def play(source, ticks):
+    input_manager.set_key_source(source)
+    loop.run_fixed(ticks, before_tick=source.advance)
+
+def outcome():
+    scene = loop.scenes.active_scene
+    return {{
+        "stats": get_session_stats().as_dict(),
+        "player": [
+            round(scene.player.pos.x, 3),
+            round(scene.player.pos.y, 3),
+            scene.player.health,
+        ],
+        "entities": sorted(
+            [type(e).__name__, round(e.pos.x, 3), round(e.pos.y, 3)]
+            for e in scene.spawn_manager.entities
+        ),
+        "stage_timer": round(scene.level_manager.stage_timer, 3),
+    }}
+
+{setup}
+"""
+
+RECORD = """
+source = ScriptedInput(input_manager)
+mission, seeds = loop.start_mission("2_Mission", seed=3)
+recorder = InputRecorder(input_manager, mission, seeds)
+input_manager.set_recorder(recorder)
+play(source, 1800)
+input_manager.set_recorder(None)
+recorder.save({path!r})
+emit(outcome())
+"""
+
+REPLAY = """
+if {warm}:
+    # Another run first: entity types validated, streams advanced
+    warmup = ScriptedInput(input_manager)
+    loop.start_mission("2_Mission", seed=11)
+    play(warmup, 1200)
+
+replay = InputReplay(input_manager, {path!r})
+loop.start_mission(replay.mission, seeds=replay.seeds)
+play(replay, replay.ticks)
+emit(outcome())
+"""
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+@pytest.fixture(scope="module")
+def runs(run_headless, tmp_path_factory):
+    """End states of the recorded run and of its fresh and warm replays."""
+    path = str(tmp_path_factory.mktemp("replay") / "run.json")
+    recorded = run_headless(RUN_TEMPLATE.format(setup=RECORD.format(path=path)))
+    fresh, warm = (
+        run_headless(RUN_TEMPLATE.format(setup=REPLAY.format(path=path, warm=warm)))
+        for warm in (False, True)
+    )
+    with open(path, "r", encoding="utf-8") as f:
+        recording = json.load(f)
+    return recorded, fresh, warm, recording
+
+
+# ===========================================================
+# Replay Determinism
+# ===========================================================
+
+
+@pytest.mark.integration
+class TestReplayDeterminism:
+    """A recording reproduces its run in any engine state."""
+
+    def test_recording_covers_the_run(self, runs):
+        recorded, _, _, recording = runs
+        assert recording["mission"] == "2_Mission"
+        assert recording["ticks"] == 1800
+        assert recording["seeds"]
+        assert recorded["stats"]["enemies_killed"] > 0, "Run too quiet to compare"
+
+    def test_fresh_replay_matches_recording(self, runs):
+        recorded, fresh, _, _ = runs
+        assert fresh == recorded
+
+    def test_warm_replay_matches_fresh_replay(self, runs):
+        _, fresh, warm, _ = runs
+        assert warm == fresh
@@ -0,0 +1,43 @@
+"""
+test_leak_harness.py
+--------------------
+Regression test for scene-owned objects outliving a cold GameScene.
+
+Runs a few short --cold cycles headless and checks that:
+1. No GameScene, Player or scene system survives the exit to the menu
+2. The harness reports no retained or accumulating counters
+"""
+
+import pytest
+
+COLD_CYCLES = """
+from src.core.debug.leak_harness import LeakHarness
+
+harness = LeakHarness("2_Mission", play=2.0, cold=True)
+for _ in range(3):
+    harness.run_cycle()
+report = harness.report(warmup=1)
+emit({
+    "live": {k: v[-1] for k, v in report["counters"].items() if k.startswith("live.")},
+    "retained": report["retained"],
+    "accumulating": report["accumulating"],
+})
+"""
+
+
+@pytest.fixture(scope="module")
+def cold_result(run_headless):
+    return run_headless(COLD_CYCLES)
+
+
+@pytest.mark.integration
+@pytest.mark.regression
+class TestColdCycles:
+    def test_nothing_scene_owned_survives_exit(self, cold_result):
+        live = cold_result["live"]
+        assert live
+        assert all(count == 0 for count in live.values()), live
+
+    def test_report_is_clean(self, cold_result):
+        assert cold_result["retained"] == []
+        assert cold_result["accumulating"] == []
@@ -0,0 +1,4 @@
+"""
+Scene tests package.
+Contains tests for scene lifecycle, caching and warm restarts.
+"""
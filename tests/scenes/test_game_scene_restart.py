@@ -0,0 +1,129 @@
+"""
+test_game_scene_restart.py
+--------------------------
+Regression test for GameScene warm restarts (SceneManager cache + reset_for_level).
+
+Plays a mission headless, puts the player through a heavy hit, the full
+recovery animation and death, then retries from the game over screen and
+checks that:
+1. The retry reuses the cached scene, player, managers and pools
+2. The player comes back alive at full health with its base image slot
+3. No per-death animation state survives the restart
+"""
+
+import pytest
+
+RETRY_AFTER_DEATH = """
+from types import SimpleNamespace
+
+import pygame
+
+from src.core.runtime.main_loop import MainLoop
+from src.entities.player import player_logic
+from src.entities.player.player_state import PlayerEffectState
+
+loop = MainLoop(headless=True)
+loop.start_mission("2_Mission")
+scene = loop.scenes.active_scene
+loop.run_fixed(1)
+while scene.cutscene_manager.is_playing:
+    loop.run_fixed(1)
+
+player = scene.player
+def identities(scene):
+    return {
+        "scene": id(scene),
+        "player": id(scene.player),
+        "spawn_manager": id(scene.spawn_manager),
+        "bullet_manager": id(scene.bullet_manager),
+        "ui": id(scene.ui),
+        "entity_pools": {str(k): id(v) for k, v in scene.spawn_manager.pools.items()},
+        "bullet_pool": id(scene.bullet_manager.pool),
+    }
+before = identities(scene)
+
+# Heavy hit: STUN, then RECOVERY with its recovery animation
+hit = SimpleNamespace(
+    damage=1,
+    pos=pygame.Vector2(player.pos.x, player.pos.y - 50),
+    collision_tag="enemy_bullet",
+)
+player.stress = player.stress_threshold
+player_logic.damage_collision(player, hit)
+ticks = 0
+while not player.state_manager.has_state(PlayerEffectState.RECOVERY) and ticks < 600:
+    loop.run_fixed(1)
+    ticks += 1
+while player.state_manager.has_state(PlayerEffectState.RECOVERY) and ticks < 1200:
+    loop.run_fixed(1)
+    ticks += 1
+loop.run_fixed(30)
+recovered = player.state_manager.has_state(PlayerEffectState.RECOVERY) is False
+
+# Death, game over, retry
+player.health = 1
+player_logic.damage_collision(player, hit)
+ticks = 0
+while not scene.game_over_shown and ticks < 1200:
+    loop.run_fixed(1)
+    ticks += 1
+game_over = scene.game_over_shown
+
+scene._handle_ui_action("retry")
+loop.run_fixed(120)
+active = loop.scenes.active_scene
+
+emit({
+    "recovered": recovered,
+    "game_over": game_over,
+    "before": before,
+    "after": identities(active),
+    "health": active.player.health,
+    "max_health": active.player.max_health,
+    "alive": active.player.death_state.name,
+    "has_base_image": hasattr(active.player, "_base_image"),
+    "death_scratch": [
+        attr for attr in ("_shake_origin", "_death_emit_timer")
+        if attr in vars(active.player)
+    ],
+})
+"""
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+@pytest.fixture(scope="module")
+def retry_result(run_headless):
+    """Outcome of one headless play -> recovery -> death -> retry run."""
+    return run_headless(RETRY_AFTER_DEATH)
+
+
+# ===========================================================
+# Warm Restart
+# ===========================================================
+
+
+@pytest.mark.integration
+class TestGameSceneWarmRestart:
+    """Retry after death must reuse the scene instead of rebuilding it."""
+
+    def test_retry_after_recovery_and_death_succeeds(self, retry_result):
+        """Recovery and death complete, and the retry does not crash."""
+        assert retry_result["recovered"], "Player never left RECOVERY"
+        assert retry_result["game_over"], "Game over screen never shown"
+
+    def test_retry_reuses_scene_managers_and_pools(self, retry_result):
+        """The same scene, player, managers and pools serve the new run."""
+        before, after = retry_result["before"], retry_result["after"]
+        for name in before:
+            assert after[name] == before[name], f"{name} was rebuilt on retry"
+
+    def test_player_state_reset_for_new_run(self, retry_result):
+        """The reused player is alive, healed and clear of death state."""
+        assert retry_result["alive"] == "ALIVE"
+        assert retry_result["health"] == retry_result["max_health"]
+        assert retry_result["has_base_image"]
+        assert retry_result["death_scratch"] == []
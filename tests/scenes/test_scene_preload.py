@@ -0,0 +1,64 @@
+"""
+test_scene_preload.py
+---------------------
+Regression test for preloaded scene switches (set_scene(..., preload=True)).
+
+Switches CampaignSelect -> Game headless the way the mission menu does and
+checks that:
+1. The outgoing menu keeps its own background while the fade plays
+2. The preloaded Game scene draws its own background once active
+"""
+
+import pytest
+
+PRELOADED_SWITCH = """
+import time
+
+from src.core.runtime.main_loop import MainLoop
+from src.scenes.transitions.transitions import FadeTransition
+
+loop = MainLoop(headless=True)
+draw_manager = loop.draw_manager
+scenes = loop.scenes
+
+scenes.set_scene("CampaignSelect")
+loop.run_fixed(5)
+menu = scenes.active_scene
+
+scenes.set_scene("Game", transition=FadeTransition(0.5), preload=True, level_id="2_Mission")
+menu_bg_kept = True
+ticks = 0
+while scenes.active_scene is menu and ticks < 3000:
+    menu_bg_kept &= draw_manager.bg_manager is menu.bg_manager
+    loop.run_fixed(1)
+    time.sleep(0.01)  # Level images decode on worker threads
+    ticks += 1
+
+scene = scenes.active_scene
+loop.run_fixed(5)
+emit({
+    "active": type(scene).__name__,
+    "menu_bg_kept": menu_bg_kept,
+    "game_bg_set": scene.bg_manager is not None,
+    "game_bg_attached": draw_manager.bg_manager is scene.bg_manager,
+})
+"""
+
+
+@pytest.fixture(scope="module")
+def switch_result(run_headless):
+    return run_headless(PRELOADED_SWITCH)
+
+
+@pytest.mark.integration
+@pytest.mark.regression
+class TestPreloadedSwitch:
+    def test_switch_completes(self, switch_result):
+        assert switch_result["active"] == "GameScene"
+
+    def test_menu_keeps_background_during_fade(self, switch_result):
+        assert switch_result["menu_bg_kept"]
+
+    def test_game_background_attached(self, switch_result):
+        assert switch_result["game_bg_set"]
+        assert switch_result["game_bg_attached"]
@@ -0,0 +1,4 @@
+"""
+Systems tests package.
+Contains tests for level, spawning and other gameplay systems.
+"""
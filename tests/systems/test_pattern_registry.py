@@ -0,0 +1,117 @@
+"""
+test_pattern_registry.py
+------------------------
+Tests for PatternRegistry's position memo.
+
+Covers:
+1. Configs that differ (including only by value type) never share an entry
+2. Equal configs share one immutable result, whatever their key order
+3. Cached positions and their metadata cannot be modified
+4. A full memo evicts its oldest entry instead of being wiped
+"""
+
+import pytest
+
+from src.systems.level.pattern_registry import PatternRegistry, _config_key
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    """Start and finish every test with an empty memo."""
+    PatternRegistry.clear_cache()
+    yield
+    PatternRegistry.clear_cache()
+
+
+def _line(config, count=3):
+    return PatternRegistry.get_positions("line", count, 1280, 720, config)
+
+
+# ===========================================================
+# Cache Keys
+# ===========================================================
+
+
+class TestMemoKeys:
+    """Same name, count and size must still key on the full config."""
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ({"edge": "top"}, {"edge": "left"}),
+            ({"edge": "top", "offset": -100}, {"edge": "top", "offset": -50}),
+            ({"edge": "top", "cross": True}, {"edge": "top", "cross": 1}),
+            ({"edge": "top", "offset": 1}, {"edge": "top", "offset": 1.0}),
+            ({"edge": "top", "spacing": None}, {"edge": "top"}),
+            ({"edge": "top", "tags": [1, 2]}, {"edge": "top", "tags": [2, 1]}),
+        ],
+    )
+    def test_different_configs_do_not_share_an_entry(self, first, second):
+        assert _config_key(first) != _config_key(second)
+
+        _line(first)
+        _line(second)
+        assert PatternRegistry.cache_info()["size"] == 2
+
+    def test_different_configs_get_their_own_positions(self):
+        top = _line({"edge": "top"})
+        left = _line({"edge": "left"})
+        assert top != left
+        assert all(y == -100 for _, y, _ in top)
+        assert all(x == -100 for x, _, _ in left)
+
+    def test_equal_configs_share_one_result(self):
+        first = _line({"edge": "top", "offset": -80})
+        second = _line({"offset": -80, "edge": "top"})
+        assert second is first
+        assert PatternRegistry.cache_info()["size"] == 1
+
+    def test_nested_config_is_keyed(self):
+        first = _line({"edge": "top", "extra": {"a": 1}})
+        second = _line({"edge": "top", "extra": {"a": 2}})
+        assert second is not first
+        assert _line({"extra": {"a": 1}, "edge": "top"}) is first
+
+
+# ===========================================================
+# Immutability
+# ===========================================================
+
+
+class TestCachedPositions:
+    """Shared results must be safe to hand to every caller."""
+
+    def test_positions_are_tuples(self):
+        positions = _line({"edge": "top"})
+        assert isinstance(positions, tuple)
+        assert all(isinstance(pos, tuple) for pos in positions)
+        with pytest.raises(TypeError):
+            positions[0] = (0, 0)
+
+    def test_metadata_is_read_only(self):
+        _, _, metadata = _line({"edge": "top"})[0]
+        with pytest.raises(TypeError):
+            metadata["use_auto_direction"] = True
+        assert _line({"edge": "top"})[0][2]["use_auto_direction"] is False
+
+
+# ===========================================================
+# Eviction
+# ===========================================================
+
+
+def test_full_memo_evicts_oldest_entry(monkeypatch):
+    monkeypatch.setattr(PatternRegistry, "MEMO_SIZE", 3)
+    first = _line({"edge": "top"}, count=1)
+    for count in (2, 3, 4):
+        _line({"edge": "top"}, count=count)
+
+    assert PatternRegistry.cache_info()["size"] == 3
+    newest = _line({"edge": "top"}, count=4)
+    assert _line({"edge": "top"}, count=4) is newest
+    assert _line({"edge": "top"}, count=1) is not first
@@ -0,0 +1,231 @@
+"""
+test_timeline_compiler.py
+-------------------------
+Tests for TimelineCompiler, which replaces runtime wave parsing.
+
+Covers:
+1. Compiled waves come out sorted by time, invalid waves dropped
+2. refs / aim_player / precise flags per entity type and movement
+3. Randomized edge waves stay symbolic (spawns=None) and resolve on trigger
+4. Disk snapshots are rejected when COMPILER_VERSION, mtime, size or
+   display size change
+"""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.systems.level import timeline_compiler
+from src.systems.level.timeline_compiler import CompiledWave, TimelineCompiler
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+def _edge_wave(time, enemy="straight", **extra):
+    """Single enemy wave entering from the top edge."""
+    return {"time": time, "enemy": enemy, "spawn_edge": "top", **extra}
+
+
+class _StageLoader:
+    """Minimal StageLoader: one stage whose timeline is a wave list."""
+
+    def __init__(self, waves):
+        self.stages = [{"waves": waves}]
+        self.parses = 0
+
+    def parse_timeline(self, stage):
+        self.parses += 1
+        return [dict(wave) for wave in stage["waves"]]
+
+
+@pytest.fixture
+def compiler(tmp_path):
+    return TimelineCompiler(cache_dir=str(tmp_path / "timelines"))
+
+
+@pytest.fixture
+def mission_file(tmp_path):
+    path = tmp_path / "mission.json"
+    path.write_text(json.dumps({"stages": []}), encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return path
+
+
+# ===========================================================
+# Compilation
+# ===========================================================
+
+
+class TestCompileWaves:
+    """Wave tables are validated once and sorted for the scheduler."""
+
+    def test_sorted_by_time(self, compiler):
+        waves = [_edge_wave(5.0), _edge_wave(1.0), _edge_wave(3.5)]
+        compiled = compiler.compile_waves(waves)
+        assert [wave.time for wave in compiled] == [1.0, 3.5, 5.0]
+        assert all(isinstance(wave, CompiledWave) for wave in compiled)
+
+    def test_invalid_waves_dropped(self, compiler):
+        waves = [
+            _edge_wave(1.0),
+            {"time": 2.0, "spawn_edge": "top"},  # No enemy/pickup
+            _edge_wave(3.0, count=0),
+            "not a wave",
+        ]
+        assert [wave.time for wave in compiler.compile_waves(waves)] == [1.0]
+
+    def test_fixed_positions_resolved_at_compile_time(self, compiler):
+        wave = compiler.compile_wave(
+            {
+                "time": 0,
+                "enemy": "straight",
+                "formation": "line",
+                "spawn_edge": "top",
+                "count": 4,
+            }
+        )
+        assert wave.source is None
+        assert len(wave.spawns) == 4
+        assert all(len(spawn) == 3 for spawn in wave.spawns)
+
+
+# ===========================================================
+# Flags
+# ===========================================================
+
+
+class TestWaveFlags:
+    """Live state stays symbolic in refs / aim_player; precise skips the budget."""
+
+    @pytest.mark.parametrize(
+        "enemy, refs",
+        [
+            ("straight", ()),
+            ("homing", ("player_ref",)),
+            ("waypoint_shooter", ("player_ref", "bullet_manager")),
+            ("boss", ("player_ref", "bullet_manager", "hazard_manager")),
+        ],
+    )
+    def test_refs_by_entity_type(self, compiler, enemy, refs):
+        assert compiler.compile_wave(_edge_wave(0, enemy)).refs == refs
+
+    def test_pickups_need_no_refs(self, compiler):
+        wave = compiler.compile_wave(
+            {"time": 0, "pickup": "health", "spawn_edge": "top"}
+        )
+        assert wave.category == "pickup"
+        assert wave.refs == ()
+        assert wave.aim_player is False
+
+    def test_aim_player_only_for_player_target(self, compiler):
+        at_player = _edge_wave(0, movement={"type": "straight", "target": "player"})
+        auto = _edge_wave(0, movement={"type": "straight", "target": "auto"})
+        homing = _edge_wave(0, movement={"type": "homing_continuous"})
+
+        assert compiler.compile_wave(at_player).aim_player is True
+        assert compiler.compile_wave(auto).aim_player is False
+        assert compiler.compile_wave(homing).aim_player is False
+
+    def test_precise_defaults_to_boss_and_can_be_set(self, compiler):
+        assert compiler.compile_wave(_edge_wave(0, "boss")).precise is True
+        assert compiler.compile_wave(_edge_wave(0)).precise is False
+        assert compiler.compile_wave(_edge_wave(0, precise=True)).precise is True
+        assert (
+            compiler.compile_wave(_edge_wave(0, "boss", precise=False)).precise is False
+        )
+
+
+# ===========================================================
+# Randomized Edge Waves
+# ===========================================================
+
+
+class TestRandomEdgeWaves:
+    """Random spawn positions must be rolled per run, not baked in."""
+
+    def test_spawns_left_symbolic(self, compiler):
+        raw = _edge_wave(2.0, count=3, spawn_position_random=0.4)
+        wave = compiler.compile_wave(raw)
+        assert wave.spawns is None
+        assert wave.source == raw
+
+    def test_resolve_spawns_on_trigger(self, compiler):
+        raw = _edge_wave(2.0, count=3, spawn_position_random=0.4)
+        wave = compiler.compile_wave(raw)
+
+        rolls = {
+            tuple(x for x, _, _ in compiler.resolve_spawns(wave.source))
+            for _ in range(5)
+        }
+        assert all(len(xs) == 3 for xs in rolls)
+        assert len(rolls) > 1, "Random edge positions were not re-rolled"
+        for xs in rolls:
+            assert all(0.1 * 1280 <= x <= 0.9 * 1280 for x in xs)
+
+    def test_random_formation_still_compiled(self, compiler):
+        wave = compiler.compile_wave(
+            {
+                "time": 0,
+                "enemy": "straight",
+                "formation": "line",
+                "spawn_edge": "top",
+                "count": 2,
+                "spawn_position_random": 0.4,
+            }
+        )
+        assert wave.spawns is not None
+
+
+# ===========================================================
+# Disk Snapshots
+# ===========================================================
+
+
+class TestSnapshotValidation:
+    """A snapshot is only reused while every part of its stamp matches."""
+
+    WAVES = [_edge_wave(1.0), _edge_wave(0.5, "homing")]
+
+    def _compile(self, compiler, mission_file):
+        loader = _StageLoader(self.WAVES)
+        timeline = compiler.compile_level(str(mission_file), loader)
+        return timeline, loader.parses
+
+    def test_round_trip_from_snapshot(self, compiler, mission_file):
+        compiled, parses = self._compile(compiler, mission_file)
+        cached, cached_parses = self._compile(compiler, mission_file)
+        assert (parses, cached_parses) == (1, 0)
+        assert cached == compiled
+        assert all(isinstance(wave, CompiledWave) for wave in cached[0])
+
+    def test_rejected_on_compiler_version(self, compiler, mission_file, monkeypatch):
+        self._compile(compiler, mission_file)
+        monkeypatch.setattr(
+            timeline_compiler,
+            "COMPILER_VERSION",
+            timeline_compiler.COMPILER_VERSION + 1,
+        )
+        assert self._compile(compiler, mission_file)[1] == 1
+
+    def test_rejected_on_mtime(self, compiler, mission_file):
+        self._compile(compiler, mission_file)
+        os.utime(mission_file, ns=(2_000_000_000, 2_000_000_000))
+        assert self._compile(compiler, mission_file)[1] == 1
+
+    def test_rejected_on_size(self, compiler, mission_file):
+        self._compile(compiler, mission_file)
+        mission_file.write_text(json.dumps({"stages": [], "x": 1}), encoding="utf-8")
+        os.utime(mission_file, ns=(1_000_000_000, 1_000_000_000))
+        assert self._compile(compiler, mission_file)[1] == 1
+
+    def test_rejected_on_display_size(self, compiler, mission_file):
+        self._compile(compiler, mission_file)
+        compiler.display = SimpleNamespace(game_width=1920, game_height=1080)
+        timeline, parses = self._compile(compiler, mission_file)
+        assert parses == 1
+        assert timeline[0][1].spawns[0][0] == 1920 * 0.5
@@ -0,0 +1,136 @@
+"""
+test_wave_scheduler.py
+----------------------
+Tests for WaveScheduler's budgeted (deferred) spawning.
+
+Covers:
+1. Waves over the spawn budget are queued, then spawned on later ticks
+2. Player aiming for deferred spawns uses the player's position when the
+   spawn runs, not when the wave was queued
+3. Later non-precise waves queue behind the backlog; precise waves skip it
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.runtime.game_settings import Spawning
+from src.systems.level.timeline_compiler import CompiledWave
+from src.systems.level.wave_scheduler import WaveScheduler
+
+
+# ===========================================================
+# Fixtures
+# ===========================================================
+
+
+def _aimed_wave(count=3):
+    """Enemy wave aimed at the player with fixed spawn positions."""
+    spawns = tuple((100.0 * i, -100.0, {}) for i in range(1, count + 1))
+    return CompiledWave(
+        0.0, "enemy", "straight", "line", count, spawns, (), True, False, None
+    )
+
+
+def _tagged_wave(tag, count=2, precise=False):
+    """Enemy wave whose spawns carry a tag param, to check spawn order."""
+    spawns = tuple((100.0 * i, -100.0, {"tag": tag}) for i in range(count))
+    return CompiledWave(
+        0.0, "enemy", "straight", "line", count, spawns, (), False, precise, None
+    )
+
+
+def _spawned_tags(scheduler):
+    return [kwargs["tag"] for _, kwargs in scheduler.spawner.spawn.call_args_list]
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """Scheduler with a fake spawner, a movable player and no spawn budget."""
+    monkeypatch.setattr(Spawning, "FRAME_BUDGET_MS", 0.0)
+    monkeypatch.setattr(Spawning, "MAX_DELAY", 10.0)
+
+    spawner = MagicMock()
+    spawner.display = None
+    player = SimpleNamespace(pos=SimpleNamespace(x=0.0, y=500.0))
+    scheduler = WaveScheduler(spawner, player_ref=player)
+
+    # Record where the player was each time a spawn was aimed
+    aimed_at = []
+
+    def direction_to_player(x, y):
+        aimed_at.append(player.pos.x)
+        return (player.pos.x, player.pos.y)
+
+    monkeypatch.setattr(scheduler, "_direction_to_player", direction_to_player)
+    scheduler.aimed_at = aimed_at
+    return scheduler
+
+
+# ===========================================================
+# Deferred Spawning
+# ===========================================================
+
+
+class TestDeferredSpawns:
+    """Spawns over budget wait in the queue; live params resolve late."""
+
+    def test_over_budget_wave_is_queued(self, scheduler):
+        scheduler._trigger_wave(_aimed_wave())
+        assert len(scheduler._deferred_spawns) == 3
+        assert scheduler.spawner.spawn.call_count == 0
+
+    def test_queue_drains_one_per_tick_within_max_delay(self, scheduler):
+        scheduler.load_waves((_aimed_wave(),))
+        scheduler.update(0.016, stage_timer=0.0)
+        assert scheduler.spawner.spawn.call_count == 1
+        scheduler.update(0.016, stage_timer=0.016)
+        scheduler.update(0.016, stage_timer=0.032)
+        assert scheduler.spawner.spawn.call_count == 3
+        assert not scheduler._deferred_spawns
+
+    def test_deferred_spawns_aim_at_current_player_position(self, scheduler):
+        scheduler._trigger_wave(_aimed_wave())
+        assert scheduler.aimed_at == [], "Aimed while queueing"
+
+        for player_x in (200.0, 400.0, 600.0):
+            scheduler.player.pos.x = player_x
+            scheduler._clock += 0.016
+            scheduler._process_deferred_spawns()
+            _, kwargs = scheduler.spawner.spawn.call_args
+            assert kwargs["direction"] == (player_x, 500.0)
+
+        assert scheduler.aimed_at == [200.0, 400.0, 600.0]
+
+
+class TestDeferredOrder:
+    """The backlog keeps timeline order; only precise waves jump it."""
+
+    @pytest.fixture(autouse=True)
+    def budget(self, scheduler, monkeypatch):
+        # Queue the first wave, then allow plenty of budget afterwards
+        scheduler._trigger_wave(_tagged_wave("first"))
+        monkeypatch.setattr(Spawning, "FRAME_BUDGET_MS", 1000.0)
+        scheduler._tick_start = time.perf_counter()
+
+    def test_later_wave_queues_behind_backlog(self, scheduler):
+        scheduler._trigger_wave(_tagged_wave("second"))
+        assert scheduler.spawner.spawn.call_count == 0
+
+        scheduler._process_deferred_spawns()
+        assert _spawned_tags(scheduler) == ["first", "first", "second", "second"]
+
+    def test_precise_wave_skips_backlog(self, scheduler):
+        scheduler._trigger_wave(_tagged_wave("boss", precise=True))
+        assert _spawned_tags(scheduler) == ["boss", "boss"]
+        assert len(scheduler._deferred_spawns) == 2
+
+    def test_empty_backlog_spawns_immediately(self, scheduler):
+        scheduler._process_deferred_spawns()
+        scheduler.spawner.spawn.reset_mock()
+
+        scheduler._trigger_wave(_tagged_wave("third"))
+        assert _spawned_tags(scheduler) == ["third", "third"]
+        assert not scheduler._deferred_spawns